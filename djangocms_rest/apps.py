@@ -10,3 +10,26 @@ class DjangocmsRestConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "djangocms_rest"
     verbose_name = "Django CMS REST API"
+
+    def ready(self):
+        from django.apps import apps
+        from django.db.models.signals import post_delete, post_save
+
+        from cms.models import Page, PageUrl
+        from cms.signals import post_obj_operation
+
+        from djangocms_rest.search import connect_signals
+        from djangocms_rest.utils import invalidate_path_index_on_commit
+
+        connect_signals()
+        if apps.is_installed("djangocms_alias"):
+            from djangocms_rest import static_aliases
+
+            static_aliases.connect_signals()
+
+        # Page paths change when pages or their URLs are saved, deleted, or moved in the admin
+        for model in (Page, PageUrl):
+            dispatch_uid = f"djangocms_rest_path_index_{model.__name__}"
+            post_save.connect(invalidate_path_index_on_commit, sender=model, dispatch_uid=dispatch_uid)
+            post_delete.connect(invalidate_path_index_on_commit, sender=model, dispatch_uid=dispatch_uid)
+        post_obj_operation.connect(invalidate_path_index_on_commit, dispatch_uid="djangocms_rest_path_index")
@@ -1,14 +1,16 @@
 from functools import cached_property
 
 from django.conf import settings
-from django.urls import NoReverseMatch, reverse
+from django.urls import NoReverseMatch
 
 from cms.app_base import CMSAppConfig
 from cms.cms_menus import CMSMenu
 from cms.models import Page, PageContent
-from cms.utils.i18n import force_language, get_current_language
+from cms.utils.i18n import get_current_language
 from menus import base
 
+from djangocms_rest.utils import page_detail_url, page_root_url
+
 
 try:
     from filer.models import File
@@ -23,14 +25,13 @@ def get_page_api_endpoint(page, language=None, fallback=True):
     if not language:
         language = get_current_language()
 
-    with force_language(language):
-        try:
-            if page.is_home:
-                return reverse("page-root", kwargs={"language": language})
-            path = page.get_path(language, fallback)
-            return reverse("page-detail", kwargs={"language": language, "path": path}) if path else None
-        except NoReverseMatch:
-            return None
+    try:
+        if page.is_home:
+            return page_root_url.reverse({"language": language}, language)
+        path = page.get_path(language, fallback)
+        return page_detail_url.reverse({"language": language, "path": path}, language) if path else None
+    except NoReverseMatch:
+        return None
 
 
 def get_file_api_endpoint(file):
@@ -0,0 +1,112 @@
+import time
+from contextlib import nullcontext
+
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.sites.models import Site
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import prefetch_related_objects
+from django.test import RequestFactory
+from django.utils import translation
+
+from cms.models import PageContent
+from cms.utils.plugins import assign_plugins
+
+from djangocms_rest.permissions import get_visible_page_ids
+from djangocms_rest.renderers import get_json_renderer_class
+from djangocms_rest.serializers.pages import PageContentSerializer
+from djangocms_rest.utils import get_site_filtered_queryset, prefetch_page_contents
+
+
+class Command(BaseCommand):
+    help = (
+        "Exports the page detail API response of every published page of a site in one language "
+        "as newline-delimited JSON (one page per line), e.g., for static site generation."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("language", help="Language of the pages to export.")
+        parser.add_argument("--site", type=int, help="ID of the site to export. Defaults to the current site.")
+        parser.add_argument("--output", "-o", help="File to write to. Defaults to standard output.")
+        parser.add_argument(
+            "--host",
+            help="Host name the API is served from. Defaults to the domain of the site. "
+            "Absolute URLs in the exported content are built from it.",
+        )
+        parser.add_argument("--secure", action="store_true", help="Build https URLs.")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=100,
+            help="Number of pages loaded from the database at once (default: 100).",
+        )
+
+    def handle(self, *args, **options):
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be at least 1.")
+        try:
+            site = Site.objects.get(pk=options["site"]) if options["site"] else Site.objects.get_current()
+        except Site.DoesNotExist:
+            raise CommandError(f"Site {options['site']} does not exist.")
+
+        language = options["language"]
+        request = self.get_request(site, language, options["host"], options["secure"])
+        renderer = get_json_renderer_class()()
+        request._rest_raw_json = getattr(renderer, "supports_raw_json", False)
+
+        start = time.monotonic()
+        exported = 0
+        with (
+            open(options["output"], "w", encoding="utf-8") if options["output"] else nullcontext(self.stdout)
+        ) as output:
+            with translation.override(language):
+                for data in self.export(request, site, language, options["chunk_size"]):
+                    output.write(renderer.render(data).decode() + "\n")
+                    exported += 1
+
+        if options["verbosity"]:
+            self.stderr.write(f"Exported {exported} pages in {time.monotonic() - start:.1f}s.")
+
+    def get_request(self, site: Site, language: str, host: str | None, secure: bool):
+        """Returns a request for the export, as made by an anonymous visitor."""
+        request = RequestFactory().get("/", HTTP_HOST=host or site.domain, secure=secure)
+        request.user = AnonymousUser()
+        request.site = site
+        request.LANGUAGE_CODE = language
+        # Share resolved references to other objects between all pages
+        request._rest_fk_cache = {}
+        return request
+
+    def export(self, request, site: Site, language: str, chunk_size: int):
+        """Yields the serialized page content of all pages visible to anonymous visitors."""
+        page_ids = list(get_site_filtered_queryset(site).filter(login_required=False).values_list("pk", flat=True))
+        for i in range(0, len(page_ids), chunk_size):
+            for page_content in self.get_page_contents(request, page_ids[i : i + chunk_size], language):
+                yield PageContentSerializer(page_content, read_only=True, context={"request": request}).data
+
+    def get_page_contents(self, request, page_ids: list[int], language: str) -> list[PageContent]:
+        """
+        Loads the page contents in ``language`` for the given pages together with everything
+        serializing them needs: the pages' urls and translations, the placeholders and their plugins.
+        """
+        pages = prefetch_page_contents(
+            list(get_site_filtered_queryset(request.site).filter(pk__in=page_ids).prefetch_related("urls"))
+        )
+
+        visible_page_ids = get_visible_page_ids(request.user, pages, request.site)
+        page_contents = []
+        for page in pages:
+            page.urls_cache = {url.language: url for url in page.urls.all()}
+            page_content = page.get_content_obj(language, fallback=False)
+            if page_content and page.pk in visible_page_ids:
+                page_content.page = page
+                page_contents.append(page_content)
+
+        prefetch_related_objects(page_contents, "placeholders")
+        placeholders = []
+        for page_content in page_contents:
+            for placeholder in page_content.placeholders.all():
+                placeholder.source = page_content
+                placeholders.append(placeholder)
+        # Fetch the plugins of all placeholders at once
+        assign_plugins(request, placeholders, lang=language)
+        return page_contents
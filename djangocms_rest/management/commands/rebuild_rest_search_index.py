@@ -0,0 +1,53 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from cms.models import PageContent
+
+from djangocms_rest.models import PageSearchIndex
+from djangocms_rest.search import get_search_backend
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuilds the search index of the page_search endpoint from all published page contents. "
+        "Run it after installing djangocms-rest and after changing content outside the editor."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--language",
+            dest="languages",
+            action="append",
+            help="Language to index (can be repeated). Defaults to all languages.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=100,
+            help="Number of page contents loaded from the database at once (default: 100).",
+        )
+
+    def handle(self, *args, **options):
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be at least 1.")
+
+        page_contents = PageContent.objects.order_by("pk")
+        entries = PageSearchIndex.objects.all()
+        if options["languages"]:
+            page_contents = page_contents.filter(language__in=options["languages"])
+            entries = entries.filter(language__in=options["languages"])
+
+        start = time.monotonic()
+        backend = get_search_backend()
+        indexed = 0
+        for page_content in page_contents.iterator(chunk_size=options["chunk_size"]):
+            backend.update(page_content)
+            indexed += 1
+        # Drop entries of contents which are no longer published
+        removed, _ = entries.exclude(page_content__in=page_contents).delete()
+
+        if options["verbosity"]:
+            self.stdout.write(
+                f"Indexed {indexed} page contents, removed {removed} entries in {time.monotonic() - start:.1f}s."
+            )
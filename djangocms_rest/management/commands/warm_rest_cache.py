@@ -0,0 +1,169 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from django.contrib.sites.models import Site
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test import Client
+from django.urls import reverse
+
+from cms.models import PageContent
+from cms.utils.i18n import get_public_languages
+
+from djangocms_rest.utils import get_site_filtered_queryset
+
+
+class RateLimiter:
+    """Spaces out calls to :meth:`wait` across threads to at most ``rate`` per second."""
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate if rate else 0
+        self.next_slot = time.monotonic()
+        self.lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self.lock:
+            now = time.monotonic()
+            slot = max(self.next_slot, now)
+            self.next_slot = slot + self.interval
+        time.sleep(max(slot - now, 0))
+
+
+class Command(BaseCommand):
+    help = (
+        "Warms the REST API caches by requesting every published page's detail endpoint, "
+        "the page tree and the menu for each site and public language."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--site",
+            dest="sites",
+            action="append",
+            type=int,
+            help="ID of a site to warm (can be repeated). Defaults to all sites.",
+        )
+        parser.add_argument(
+            "--language",
+            dest="languages",
+            action="append",
+            help="Language to warm (can be repeated). Defaults to the public languages of each site.",
+        )
+        parser.add_argument(
+            "--host",
+            help="Host name the API is served from. Defaults to the domain of each site. "
+            "Absolute URLs in cached content are built from it.",
+        )
+        parser.add_argument("--secure", action="store_true", help="Build https URLs.")
+        parser.add_argument(
+            "--concurrency", type=int, default=1, help="Number of requests to run in parallel (default: 1)."
+        )
+        parser.add_argument(
+            "--rate", type=float, default=0, help="Maximum number of requests per second (default: unlimited)."
+        )
+        parser.add_argument("--skip-menus", action="store_true", help="Do not warm the page tree and menus.")
+        parser.add_argument(
+            "--fail-on-error", action="store_true", help="Exit with an error if any request fails."
+        )
+
+    def handle(self, *args, **options):
+        if options["concurrency"] < 1:
+            raise CommandError("--concurrency must be at least 1.")
+        if options["rate"] < 0:
+            raise CommandError("--rate must not be negative.")
+
+        sites = Site.objects.order_by("pk")
+        if options["sites"]:
+            sites = sites.filter(pk__in=options["sites"])
+
+        jobs = []
+        for site in sites:
+            languages = options["languages"] or get_public_languages(site.pk)
+            for language in languages:
+                jobs.extend(self.get_jobs(site, language, skip_menus=options["skip_menus"]))
+
+        self.host = options["host"]
+        self.secure = options["secure"]
+        rate_limiter = RateLimiter(options["rate"])
+        failed = 0
+        start = time.monotonic()
+
+        def run(job):
+            rate_limiter.wait()
+            try:
+                return self.warm(*job)
+            except Exception as e:
+                return f"{e.__class__.__name__}: {e}"
+
+        for done, (job, status_code) in enumerate(self.run_jobs(run, jobs, options["concurrency"]), start=1):
+            site, url = job
+            if status_code != 200:
+                failed += 1
+                self.stderr.write(f"[{done}/{len(jobs)}] {url} (site {site.pk}) failed: {status_code}")
+            elif options["verbosity"] > 1:
+                self.stdout.write(f"[{done}/{len(jobs)}] {url} (site {site.pk})")
+            elif options["verbosity"] and done % 100 == 0:
+                self.stdout.write(f"{done}/{len(jobs)} requests done")
+
+        if options["verbosity"]:
+            self.stdout.write(
+                f"Warmed {len(jobs) - failed} of {len(jobs)} endpoints in {time.monotonic() - start:.1f}s"
+                + (f", {failed} failed." if failed else ".")
+            )
+        if failed and options["fail_on_error"]:
+            raise CommandError(f"{failed} requests failed.")
+
+    @staticmethod
+    def run_jobs(run, jobs, concurrency):
+        """Yields (job, result) pairs, running the jobs in a thread pool if concurrency is requested."""
+        if concurrency == 1:
+            for job in jobs:
+                yield job, run(job)
+            return
+
+        def run_in_thread(job):
+            try:
+                return run(job)
+            finally:
+                # Worker threads open their own database connections
+                connections.close_all()
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = {executor.submit(run_in_thread, job): job for job in jobs}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
+    def get_jobs(self, site: Site, language: str, skip_menus: bool = False) -> list[tuple[Site, str]]:
+        """Returns the (site, URL) pairs to request for a site and language."""
+        jobs = []
+        if not skip_menus:
+            jobs.append((site, reverse("page-tree-list", kwargs={"language": language})))
+            jobs.append((site, reverse("menu", kwargs={"language": language})))
+        # Pages requiring a login are not cached for anonymous visitors. The pages with
+        # published content in the language and their URLs are loaded in two queries.
+        pages = (
+            get_site_filtered_queryset(site)
+            .filter(login_required=False, pk__in=PageContent.objects.filter(language=language).values("page_id"))
+            .prefetch_related("urls")
+        )
+        for page in pages:
+            url = page.get_api_endpoint(language, fallback=False)
+            if url:
+                jobs.append((site, url))
+        return jobs
+
+    def warm(self, site: Site, url: str) -> int:
+        """
+        Requests a URL like an anonymous visitor would and returns the response status code.
+        The request passes through the project's middleware, so that locale, site and
+        authentication middleware shape the response and its cache keys as for real requests.
+        Closing the response runs work deferred until after it, e.g., refreshing stale entries.
+        """
+        client = Client(raise_request_exception=False)
+        response = client.get(
+            url, secure=self.secure, headers={"host": self.host or site.domain, "x-site-id": str(site.pk)}
+        )
+        return response.status_code
@@ -0,0 +1,59 @@
+import django.db.models.deletion
+from django.contrib.postgres.indexes import GinIndex
+from django.db import connection, migrations, models
+
+import djangocms_rest.models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        ("cms", "0034_remove_pagecontent_placeholders"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PageSearchIndex",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("language", models.CharField(db_index=True, max_length=15, verbose_name="language")),
+                ("title", models.TextField(blank=True, verbose_name="title")),
+                ("description", models.TextField(blank=True, verbose_name="description")),
+                ("text", models.TextField(blank=True, verbose_name="text")),
+                ("slots", models.JSONField(blank=True, default=list, verbose_name="text by slot")),
+                ("search_vector", djangocms_rest.models.SearchVectorField(editable=False, null=True)),
+                ("changed_date", models.DateTimeField(auto_now=True, verbose_name="changed date")),
+                (
+                    "page",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="cms.page",
+                    ),
+                ),
+                (
+                    "page_content",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="rest_search_index",
+                        to="cms.pagecontent",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "page search index entry",
+                "verbose_name_plural": "page search index",
+                "indexes": (
+                    [GinIndex(fields=["search_vector"], name="djangocms_rest_search_vector")]
+                    if connection.vendor == "postgresql"
+                    else []
+                ),
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("page", "language"), name="djangocms_rest_search_index_page_language"
+                    )
+                ],
+            },
+        ),
+    ]
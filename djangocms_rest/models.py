@@ -0,0 +1,54 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.db import connection, models
+from django.utils.translation import gettext_lazy as _
+
+from cms.models import Page, PageContent
+
+
+class SearchVectorField(models.TextField):
+    """
+    Holds the search vector of the PostgreSQL search backend: a ``tsvector`` column on
+    PostgreSQL, an unused text column on other databases. Unlike the field of
+    ``django.contrib.postgres``, it can be imported without psycopg installed.
+    """
+
+    def db_type(self, connection):
+        if connection.vendor == "postgresql":
+            return "tsvector"
+        return super().db_type(connection)
+
+
+class PageSearchIndex(models.Model):
+    """
+    The searchable text of a published page content, kept up to date on publish. The page
+    search endpoint queries this table instead of joining page contents and plugins.
+    """
+
+    page = models.ForeignKey(Page, on_delete=models.CASCADE, related_name="+")
+    language = models.CharField(_("language"), max_length=15, db_index=True)
+    page_content = models.OneToOneField(PageContent, on_delete=models.CASCADE, related_name="rest_search_index")
+    title = models.TextField(_("title"), blank=True)
+    description = models.TextField(_("description"), blank=True)
+    text = models.TextField(_("text"), blank=True)
+    # The plugin text of each placeholder as {"slot": ..., "text": ...} objects, in placeholder
+    # order. A list, as the keys of a JSON object lose their order in PostgreSQL's jsonb.
+    slots = models.JSONField(_("text by slot"), default=list, blank=True)
+    # Filled by the PostgreSQL search backend only, and GIN-indexed on PostgreSQL only
+    search_vector = SearchVectorField(null=True, editable=False)
+    changed_date = models.DateTimeField(_("changed date"), auto_now=True)
+
+    class Meta:
+        verbose_name = _("page search index entry")
+        verbose_name_plural = _("page search index")
+        # GIN indexes do not exist on other databases
+        indexes = (
+            [GinIndex(fields=["search_vector"], name="djangocms_rest_search_vector")]
+            if connection.vendor == "postgresql"
+            else []
+        )
+        constraints = [
+            models.UniqueConstraint(fields=["page", "language"], name="djangocms_rest_search_index_page_language"),
+        ]
+
+    def __str__(self):
+        return f"{self.title} ({self.language})"
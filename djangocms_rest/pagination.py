@@ -0,0 +1,22 @@
+from rest_framework.pagination import CursorPagination
+from rest_framework.settings import api_settings
+
+
+class KeysetCursorPagination(CursorPagination):
+    """
+    Keyset pagination with opaque cursors for list endpoints. Each page is fetched with a
+    ``WHERE <key> > <last key> ... LIMIT`` query, so requesting a page costs the same
+    regardless of how deep into the list it is.
+
+    The key is taken from the view's ``cursor_ordering`` attribute and must be unique.
+    The page size defaults to DRF's ``PAGE_SIZE`` (or 100) and can be set with ``?limit=``.
+    """
+
+    page_size = api_settings.PAGE_SIZE or 100
+    page_size_query_param = "limit"
+    max_page_size = 1000
+    ordering = "pk"
+
+    def get_ordering(self, request, queryset, view):
+        ordering = getattr(view, "cursor_ordering", self.ordering)
+        return (ordering,) if isinstance(ordering, str) else tuple(ordering)
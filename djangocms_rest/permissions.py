@@ -1,16 +1,66 @@
+from collections.abc import Iterable
+
+from django.contrib.sites.models import Site
 from django.contrib.sites.shortcuts import get_current_site
+from django.utils.functional import SimpleLazyObject
 
-from cms.models import Page, PageContent
+from cms.models import Page, PageContent, PagePermission
+from cms.utils.conf import get_cms_setting
 from cms.utils.i18n import get_language_tuple, get_languages
-from cms.utils.page_permissions import user_can_view_page
+from cms.utils.page_permissions import user_can_view_all_pages, user_can_view_page
 
 from rest_framework.exceptions import NotFound
 from rest_framework.permissions import BasePermission
 from rest_framework.request import Request
 
+from djangocms_rest.utils import get_page_tree_path, get_site_filtered_queryset
 from djangocms_rest.views_base import BaseAPIView
 
 
+def get_visible_page_ids(user, pages: Iterable[Page], site: Site) -> set[int]:
+    """
+    Returns the ids of the ``pages`` the user can view. This is a many-pages-at-once version
+    of ``cms.utils.page_permissions.user_can_view_page``: the view restrictions of the whole
+    site are loaded at once and evaluated for each page in memory.
+    """
+    pages = list(pages)
+    all_page_ids = {page.pk for page in pages}
+    if user.is_superuser:
+        return all_page_ids
+
+    public_for = get_cms_setting("PUBLIC_FOR")
+    can_see_unrestricted = public_for == "all" or (public_for == "staff" and user.is_staff)
+    can_view_all = SimpleLazyObject(lambda: user_can_view_all_pages(user, site=site))
+
+    if not get_cms_setting("PERMISSION"):
+        # No page has view restrictions
+        if can_see_unrestricted or (user.is_authenticated and can_view_all):
+            return all_page_ids
+        return set()
+
+    restrictions = [
+        (permission.get_page_permission_tuple(), permission.user_id, permission.group_id)
+        for permission in PagePermission.objects.filter(
+            can_view=True, page__in=get_site_filtered_queryset(site)
+        ).select_related("page")
+    ]
+    user_groups = SimpleLazyObject(lambda: frozenset(user.groups.values_list("pk", flat=True)))
+
+    def can_view(page: Page) -> bool:
+        path = get_page_tree_path(page)
+        granted_to = [(user_id, group_id) for scope, user_id, group_id in restrictions if scope.contains(path)]
+        if not granted_to:
+            return can_see_unrestricted or (user.is_authenticated and bool(can_view_all))
+        if not user.is_authenticated:
+            return False
+        if can_view_all or any(user_id == user.pk or group_id in user_groups for user_id, group_id in granted_to):
+            return True
+        # Users who can change a restricted page can view it as well: leave it to django CMS
+        return user.is_staff and user_can_view_page(user, page, site=site)
+
+    return {page.pk for page in pages if can_view(page)}
+
+
 class IsAllowedLanguage(BasePermission):
     """
     Check whether the provided language is allowed for a given site.
@@ -1,4 +1,5 @@
 import json
+from urllib.parse import urlencode
 from typing import Any, TypeVar
 from collections.abc import Iterable
 
@@ -6,17 +7,24 @@ from django.contrib.sites.shortcuts import get_current_site
 from django.core.exceptions import ValidationError
 from django.core.validators import URLValidator
 from django.db import models
+from django.template import Context
 from django.utils.html import escape, mark_safe
 
-from cms.models import Placeholder
+from cms.models import CMSPlugin, Placeholder
 from cms.plugin_rendering import ContentRenderer
 from cms.utils.plugins import get_plugins
 
+from djangocms_rest.renderers import RawJSON
 from djangocms_rest.serializers.placeholders import PlaceholderSerializer
-from djangocms_rest.serializers.plugins import GenericPluginSerializer, base_exclude
+from djangocms_rest.serializers.plugins import GenericPluginSerializer, base_exclude, prefetch_file_urls
 from djangocms_rest.serializers.utils.cache import (
     get_placeholder_rest_cache,
+    get_plugin_cache_duration,
+    get_plugin_rest_cache_many,
+    is_placeholder_rest_cache_stale,
+    schedule_placeholder_refresh,
     set_placeholder_rest_cache,
+    set_plugin_rest_cache_many,
 )
 
 
@@ -270,8 +278,15 @@ class RESTRenderer(ContentRenderer):
             placeholder, language, context, editable=editable, template=template
         )
 
-    def serialize_placeholder(self, placeholder, context, language, use_cache=True):
+    def serialize_placeholder(self, placeholder, context, language, use_cache=True, raw_json=False):
+        """
+        Serialize a placeholder's plugins, using the REST cache if possible. With ``raw_json``,
+        content cached as JSON is returned as a :class:`~djangocms_rest.renderers.RawJSON`
+        fragment instead of being decoded.
+        """
         context.update({"request": self.request})
+        # Plugins are cached individually even if one of their siblings cannot be cached
+        use_plugin_cache = use_cache and self.placeholder_cache_is_enabled()
         if use_cache and placeholder.cache_placeholder:
             use_cache = self.placeholder_cache_is_enabled()
         else:
@@ -283,6 +298,7 @@ class RESTRenderer(ContentRenderer):
                 lang=language,
                 site_id=get_current_site(self.request).pk,
                 request=self.request,
+                raw=raw_json,
             )
         else:
             cached_value = None
@@ -290,12 +306,24 @@ class RESTRenderer(ContentRenderer):
         if cached_value is not None:
             # User has opted to use the cache
             # and there is something in the cache
+            if is_placeholder_rest_cache_stale(cached_value):
+                # Serve the stale content now and re-serialize after the response
+                schedule_placeholder_refresh(
+                    placeholder,
+                    lang=language,
+                    site_id=get_current_site(self.request).pk,
+                    request=self.request,
+                    refresh=lambda: self.refresh_placeholder(placeholder, language),
+                )
+            if isinstance(cached_value["content"], bytes):
+                return RawJSON(cached_value["content"])
             return cached_value["content"]
 
         plugin_content = self.serialize_plugins(
             placeholder,
             language=language,
             context=context,
+            use_cache=use_plugin_cache,
         )
 
         if use_cache:
@@ -313,36 +341,110 @@ class RESTRenderer(ContentRenderer):
 
         return plugin_content
 
-    def serialize_plugins(
-        self, placeholder: Placeholder, language: str, context: dict
-    ) -> list:
-        plugins = get_plugins(
-            self.request,
-            placeholder=placeholder,
+    def refresh_placeholder(self, placeholder, language):
+        """
+        Re-serialize a placeholder and store the result in the REST cache.
+        """
+        plugin_content = self.serialize_plugins(
+            placeholder,
+            language=language,
+            context=Context({"request": self.request}),
+            use_cache=True,
+        )
+        set_placeholder_rest_cache(
+            placeholder,
             lang=language,
-            template=None,
+            site_id=get_current_site(self.request).pk,
+            content=plugin_content,
+            request=self.request,
         )
+        return plugin_content
 
-        def serialize_children(child_plugins):
+    def serialize_plugins(
+        self,
+        placeholder: Placeholder,
+        language: str,
+        context: dict,
+        plugins: Iterable[CMSPlugin] | None = None,
+        depth: int | None = None,
+        use_cache: bool = False,
+    ) -> list:
+        """
+        Serialize the placeholder's plugins (or the given ``plugins`` with their children) as a
+        nested tree. With ``depth``, plugins nested deeper are left out: their parent has a
+        ``children_count`` and a ``children_url`` to fetch them from instead of ``children``.
+
+        With ``use_cache`` and ``REST_PLUGIN_CACHE_DURATION`` set, each plugin's own data is
+        taken from the per-plugin cache, so only plugins changed since they were cached are
+        serialized again. The URLs of the filer files the other plugins refer to are resolved
+        in bulk beforehand.
+        """
+        if plugins is None:
+            plugins = get_plugins(
+                self.request,
+                placeholder=placeholder,
+                lang=language,
+                template=None,
+            )
+
+        tree_plugins = self.get_tree_plugins(plugins, depth)
+        use_cache = use_cache and bool(get_plugin_cache_duration())
+        cached_data = {}
+        serialized = []
+        if use_cache:
+            site_id = get_current_site(self.request).pk
+            cacheable = [plugin for plugin in tree_plugins if getattr(self.get_plugin_class(plugin), "cache", True)]
+            cached_data = get_plugin_rest_cache_many(cacheable, site_id, self.request)
+        # Resolve the file URLs of all plugins to serialize at once
+        prefetch_file_urls(self.request, [plugin for plugin in tree_plugins if plugin.pk not in cached_data])
+
+        def serialize_plugin(plugin):
+            data = cached_data.get(plugin.pk)
+            if data is None:
+                data = serialize_cms_plugin(plugin, context)
+                if not data:
+                    return None
+                data = dict(data)
+                if use_cache and getattr(self.get_plugin_class(plugin), "cache", True):
+                    serialized.append((plugin, data))
+            # Children are added to a copy, the plugin's own data is cached without them
+            return dict(data)
+
+        def serialize_children(child_plugins, level):
             children_list = []
             for child_plugin in child_plugins:
-                child_content = serialize_cms_plugin(child_plugin, context)
-                if getattr(child_plugin, "child_plugin_instances", None):
-                    child_content["children"] = serialize_children(
-                        child_plugin.child_plugin_instances
-                    )
+                child_content = serialize_plugin(child_plugin)
+                child_instances = getattr(child_plugin, "child_plugin_instances", None)
+                if child_content and child_instances:
+                    if depth is not None and level >= depth:
+                        child_content["children_count"] = len(child_instances)
+                        child_content["children_url"] = self.get_children_url(
+                            placeholder, child_plugin, language, depth
+                        )
+                    else:
+                        child_content["children"] = serialize_children(child_instances, level + 1)
                 if child_content:
                     children_list.append(child_content)
             return children_list
 
-        results = []
-        for plugin in plugins:
-            plugin_content = serialize_cms_plugin(plugin, context)
-            if getattr(plugin, "child_plugin_instances", None):
-                plugin_content["children"] = serialize_children(
-                    plugin.child_plugin_instances
-                )
-            if plugin_content:
-                results.append(plugin_content)
+        results = serialize_children(plugins, 1)
+        if serialized:
+            set_plugin_rest_cache_many(serialized, site_id, self.request)
         return results
 
+    def get_tree_plugins(self, plugins: Iterable[CMSPlugin], depth: int | None, level: int = 1) -> list:
+        """Return the plugins of the tree up to ``depth`` as a flat list."""
+        tree_plugins = []
+        for plugin in plugins:
+            tree_plugins.append(plugin)
+            if depth is None or level < depth:
+                children = getattr(plugin, "child_plugin_instances", None) or ()
+                tree_plugins.extend(self.get_tree_plugins(children, depth, level + 1))
+        return tree_plugins
+
+    def get_children_url(self, placeholder: Placeholder, plugin: CMSPlugin, language: str, depth: int) -> str:
+        """Return the URL of the placeholder endpoint serving the children of the plugin."""
+        url = PlaceholderSerializer(language=language, request=self.request, render_plugins=False).get_details(
+            placeholder
+        )
+        return url + ("&" if "?" in url else "?") + urlencode({"parent": plugin.pk, "depth": depth})
@@ -0,0 +1,204 @@
+import json
+import re
+from functools import cache, cached_property
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+from rest_framework import renderers
+from rest_framework.compat import INDENT_SEPARATORS, LONG_SEPARATORS, SHORT_SEPARATORS
+
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+
+class RawJSON:
+    """
+    A pre-encoded JSON fragment, e.g., placeholder content read from the cache.
+
+    :class:`JSONRenderer` embeds the fragment into the response as is instead of
+    encoding it again.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+    def __repr__(self):
+        return f"<RawJSON: {len(self.data)} bytes>"
+
+
+class RawJSONEncoderMixin:
+    """
+    Encodes :class:`RawJSON` fragments as unique marker strings and collects them
+    so that the renderer can replace the markers with the fragments.
+    """
+
+    def __init__(self, *args, fragments: list, marker: str, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fragments = fragments
+        self.marker = marker
+
+    def default(self, obj):
+        if isinstance(obj, RawJSON):
+            self.fragments.append(obj.data)
+            return f"{self.marker}:{len(self.fragments) - 1}"
+        return super().default(obj)
+
+
+@cache
+def get_raw_json_encoder(encoder_class: type) -> type:
+    return type(f"RawJSON{encoder_class.__name__}", (RawJSONEncoderMixin, encoder_class), {})
+
+
+class JSONRenderer(renderers.JSONRenderer):
+    """
+    DRF's JSON renderer which additionally embeds :class:`RawJSON` fragments into
+    the rendered document without decoding and re-encoding them.
+    """
+
+    #: Views may hand over pre-encoded JSON fragments to this renderer
+    supports_raw_json = True
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        indent = self.get_indent(accepted_media_type, renderer_context)
+
+        if indent is None:
+            separators = SHORT_SEPARATORS if self.compact else LONG_SEPARATORS
+        else:
+            separators = INDENT_SEPARATORS
+
+        fragments = []
+        marker = f"__raw_json_{uuid4().hex}"
+        ret = json.dumps(
+            data,
+            cls=get_raw_json_encoder(self.encoder_class),
+            fragments=fragments,
+            marker=marker,
+            indent=indent,
+            ensure_ascii=self.ensure_ascii,
+            allow_nan=not self.strict,
+            separators=separators,
+        )
+
+        # We always fully escape \u2028 and \u2029 to ensure we output JSON
+        # that is a strict javascript subset.
+        ret = ret.replace("\u2028", "\\u2028").replace("\u2029", "\\u2029").encode()
+        if fragments:
+            ret = re.sub(f'"{marker}:(\\d+)"'.encode(), lambda match: fragments[int(match[1])], ret)
+        return ret
+
+
+def _escape_line_separators(ret: bytes) -> bytes:
+    """Fully escape U+2028 and U+2029 to ensure the output is a strict javascript subset."""
+    if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+        ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+    return ret
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer using `orjson <https://github.com/ijl/orjson>`_.
+
+    Types orjson does not handle natively (lazy translation strings, ``Decimal``, ...) and
+    datetimes are passed to DRF's encoder, so the output matches DRF's renderer. If an output
+    format orjson cannot produce is requested (ASCII-only or non-compact output, indents other
+    than 2) or the data contains values orjson cannot encode (integers beyond 64 bits),
+    rendering falls back to the standard library.
+    """
+
+    @cached_property
+    def encoder(self):
+        return self.encoder_class()
+
+    def default(self, obj):
+        if isinstance(obj, RawJSON):
+            return orjson.Fragment(obj.data)
+        return self.encoder.default(obj)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if data is None or self.ensure_ascii or not self.compact or indent not in (None, 2):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return _escape_line_separators(orjson.dumps(data, default=self.default, option=option))
+        except orjson.JSONEncodeError:
+            # E.g., integers beyond 64 bits: the standard library encodes them or raises the error
+            return super().render(data, accepted_media_type, renderer_context)
+
+
+class MsgspecJSONRenderer(JSONRenderer):
+    """
+    JSON renderer using `msgspec <https://jcristharif.com/msgspec/>`_.
+
+    Types msgspec does not handle natively (e.g., lazy translation strings) are passed to DRF's
+    encoder, subclasses of ``str`` are rendered as strings. ``Decimal`` values are rendered as
+    numbers, as by DRF's encoder. msgspec encodes ``timedelta`` and binary values itself, as
+    ISO 8601 durations and base64: DRF's serializer fields convert them to strings before
+    rendering. Indented or ASCII-only output falls back to the standard library.
+    """
+
+    @cached_property
+    def encoder(self):
+        return self.encoder_class()
+
+    @cached_property
+    def msgspec_encoder(self):
+        return msgspec.json.Encoder(enc_hook=self.enc_hook, decimal_format="number")
+
+    def enc_hook(self, obj):
+        if isinstance(obj, RawJSON):
+            return msgspec.Raw(obj.data)
+        if isinstance(obj, str):
+            # msgspec does not encode subclasses of str, e.g., SafeString or ErrorDetail;
+            # str.__str__ returns a plain str copy
+            return str.__str__(obj)
+        return self.encoder.default(obj)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if data is None or self.ensure_ascii or not self.compact or indent is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        return _escape_line_separators(self.msgspec_encoder.encode(data))
+
+
+#: JSON renderers selectable by the ``REST_JSON_RENDERER`` setting
+JSON_RENDERERS = {
+    "json": (JSONRenderer, True),
+    "orjson": (ORJSONRenderer, orjson is not None),
+    "msgspec": (MsgspecJSONRenderer, msgspec is not None),
+}
+
+
+def get_json_renderer_class() -> type[JSONRenderer]:
+    """
+    Returns the JSON renderer class selected by the ``REST_JSON_RENDERER`` setting.
+    """
+    name = getattr(settings, "REST_JSON_RENDERER", "json")
+    try:
+        renderer_class, available = JSON_RENDERERS[name]
+    except KeyError:
+        raise ImproperlyConfigured(
+            f"REST_JSON_RENDERER must be one of {', '.join(JSON_RENDERERS)}, got {name!r}."
+        )
+    if not available:
+        raise ImproperlyConfigured(f"REST_JSON_RENDERER is set to {name!r}, but {name} is not installed.")
+    return renderer_class
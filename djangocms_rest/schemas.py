@@ -1,6 +1,11 @@
 """OpenAPI schema generation utilities for djangocms-rest."""
 
+from django.apps import apps
+
 try:
+    if not apps.is_installed("drf_spectacular"):
+        # Not generating schemas: spare loading drf-spectacular's schema machinery
+        raise ImportError("drf_spectacular is not in INSTALLED_APPS")
     from drf_spectacular.openapi import AutoSchema
     from drf_spectacular.types import OpenApiTypes
     from drf_spectacular.utils import OpenApiParameter, OpenApiResponse, extend_schema
@@ -85,6 +90,64 @@ try:
                 description="Set to true to preview unpublished content (admin access required)",
                 required=False,
             ),
+            OpenApiParameter(
+                name="depth",
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description=(
+                    "Number of plugin levels to include. Deeper plugins are replaced by a children_count "
+                    "and a children_url on their parent"
+                ),
+                required=False,
+            ),
+            OpenApiParameter(
+                name="parent",
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description="Id of the plugin whose children to return instead of the top-level plugins",
+                required=False,
+            ),
+            OpenApiParameter(
+                name="cursor",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="Paginate the top-level plugins; empty for the first page, then as in the next link",
+                required=False,
+            ),
+            OpenApiParameter(
+                name="limit",
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description="Number of top-level plugins per page when paginating with cursor",
+                required=False,
+            ),
+        ]
+    )
+
+    extend_static_alias_schema = extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="html",
+                type=OpenApiTypes.INT,
+                location="query",
+                description="Set to 1 to include HTML rendering in response",
+                required=False,
+                enum=[1],
+            ),
+            OpenApiParameter(
+                name="preview",
+                type=OpenApiTypes.BOOL,
+                location="query",
+                description="Set to true to preview unpublished content (admin access required)",
+                required=False,
+            ),
+            OpenApiParameter(
+                name="If-None-Match",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.HEADER,
+                description="ETag of a previous response; returns 304 Not Modified while the alias is unchanged",
+                required=False,
+            ),
         ]
     )
 
@@ -94,7 +157,60 @@ try:
                 name="q",
                 type=OpenApiTypes.STR,
                 location=OpenApiParameter.QUERY,
-                description="Search for an exact match of the search term to find pages",
+                description=(
+                    "Search term. Results are ranked by relevance and include a highlighted snippet "
+                    "and the matched placeholder slots"
+                ),
+                required=False,
+            ),
+        ]
+    )
+
+    extend_page_detail_schema = extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="include",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description=(
+                    "Comma-separated list of navigation structures to add to the response: "
+                    "menu, submenu, breadcrumbs. Each is returned as by its own endpoint with default options"
+                ),
+                required=False,
+            ),
+            OpenApiParameter(
+                name="languages",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description=(
+                    "Comma-separated list of languages, or all, to return the page in under translations"
+                ),
+                required=False,
+            ),
+            OpenApiParameter(
+                name="translations",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="Set to full to include the placeholders of each translation",
+                required=False,
+                enum=["full"],
+            ),
+            OpenApiParameter(
+                name="placeholders",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description=(
+                    "How to include the placeholders: full (default) with their content, links with "
+                    "their details URL only, or none"
+                ),
+                required=False,
+                enum=["none", "links", "full"],
+            ),
+            OpenApiParameter(
+                name="slots",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="Comma-separated list of the placeholder slots to include",
                 required=False,
             ),
         ]
@@ -116,6 +232,14 @@ except ImportError:
         """No-op when drf-spectacular is not available."""
         return func
 
+    def extend_static_alias_schema(func):
+        """No-op when drf-spectacular is not available."""
+        return func
+
     def extend_page_search_schema(func):
         """No-op when drf-spectacular is not available."""
         return func
+
+    def extend_page_detail_schema(func):
+        """No-op when drf-spectacular is not available."""
+        return func
@@ -0,0 +1,294 @@
+"""
+Full-text search for the ``page_search`` endpoint.
+
+The searchable text of each published page content — titles, meta description and the
+text of plugins declaring ``search_fields`` — is stored in the ``PageSearchIndex`` table
+when the content is published. A search backend queries the index and ranks the results.
+"""
+
+from __future__ import annotations
+
+import html
+import re
+from collections import defaultdict
+
+from django.apps import apps
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import Case, IntegerField, Q, QuerySet, Value, When
+from django.db.models.functions import Cast
+from django.utils.html import escape, strip_tags
+from django.utils.module_loading import import_string
+
+from cms.models import CMSPlugin, Page, PageContent, Placeholder
+from cms.utils.plugins import downcast_plugins
+
+from djangocms_rest.models import PageSearchIndex
+
+_whitespace = re.compile(r"\s+")
+
+
+def get_plugin_text(plugin: CMSPlugin) -> str:
+    """Returns the plain text of the plugin's ``search_fields``."""
+    values = (getattr(plugin, field, None) for field in getattr(plugin, "search_fields", ()))
+    return " ".join(html.unescape(strip_tags(str(value))) for value in values if value)
+
+
+def get_page_content_texts(page_content: PageContent) -> dict[str, str]:
+    """Returns the plain text of the plugins of the page content by placeholder slot."""
+    slots = {placeholder.pk: placeholder.slot for placeholder in page_content.placeholders.all()}
+    plugins = CMSPlugin.objects.filter(placeholder_id__in=slots, language=page_content.language).order_by(
+        "placeholder_id", "position"
+    )
+    texts = defaultdict(list)
+    for plugin in downcast_plugins(plugins):
+        text = get_plugin_text(plugin)
+        if text:
+            texts[slots[plugin.placeholder_id]].append(text)
+    return {slot: _whitespace.sub(" ", " ".join(parts)).strip() for slot, parts in texts.items()}
+
+
+class BaseSearchBackend:
+    """
+    Searches the page search index. Subclasses implement :meth:`search`; the index is
+    maintained by :meth:`update` and :meth:`remove`. Snippets and matched slots of results
+    are taken from the index entry, without loading any plugins.
+    """
+
+    #: Maximum number of characters of a snippet
+    snippet_length = 200
+
+    def search(self, queryset: QuerySet[PageContent], term: str) -> QuerySet[PageContent]:
+        """
+        Returns the page contents of ``queryset`` matching ``term``, annotated with their
+        ``search_rank`` and ordered by it, best match first.
+        """
+        raise NotImplementedError
+
+    def search_unindexed(
+        self, queryset: QuerySet[PageContent], term: str, language: str | None = None
+    ) -> QuerySet[PageContent]:
+        """
+        Returns the page contents of ``queryset`` whose page matches ``term`` by django CMS's
+        page search, which scans the page and plugin tables. Used while the index is empty,
+        e.g., after upgrading and before ``rebuild_rest_search_index`` has run.
+        """
+        pages = Page.objects.search(term, language=language, current_site_only=False)
+        return queryset.filter(page__in=pages).order_by("pk")
+
+    def update(self, page_content: PageContent) -> PageSearchIndex:
+        """Indexes the page content, replacing the entry of its page and language."""
+        slots = get_page_content_texts(page_content)
+        titles = dict.fromkeys(
+            title for title in (page_content.title, page_content.page_title, page_content.menu_title) if title
+        )
+        entry, _ = PageSearchIndex.objects.update_or_create(
+            page_id=page_content.page_id,
+            language=page_content.language,
+            defaults={
+                "page_content": page_content,
+                "title": " ".join(titles),
+                "description": page_content.meta_description or "",
+                "text": " ".join(slots.values()),
+                "slots": [{"slot": slot, "text": text} for slot, text in slots.items()],
+            },
+        )
+        return entry
+
+    def remove(self, page_content: PageContent) -> None:
+        """Removes the page content from the index."""
+        PageSearchIndex.objects.filter(page_content=page_content).delete()
+
+    def get_words(self, term: str) -> list[str]:
+        """Returns the words of the search term to highlight in results."""
+        return term.split()
+
+    def get_matched_slots(self, entry: PageSearchIndex, words: list[str]) -> list[str]:
+        """Returns the slots of the placeholders whose text contains any of the words."""
+        words = [word.lower() for word in words]
+        return [item["slot"] for item in entry.slots if any(word in item["text"].lower() for word in words)]
+
+    def get_snippet(self, entry: PageSearchIndex, words: list[str]) -> str:
+        """
+        Returns an HTML excerpt of the indexed text around the first occurrence of any of the
+        words, with the occurrences wrapped in ``<mark>`` tags. If the words only appear in the
+        title, the excerpt is taken from the beginning of the text.
+        """
+        pattern = re.compile("|".join(re.escape(word) for word in sorted(words, key=len, reverse=True)), re.I)
+        text = next(
+            (text for text in (entry.text, entry.description) if words and pattern.search(text)),
+            entry.text or entry.description,
+        )
+        if not text:
+            return ""
+
+        start = 0
+        match = pattern.search(text) if words else None
+        if match and match.end() > self.snippet_length:
+            # Show some context before the match
+            start = text.rfind(" ", 0, max(match.start() - self.snippet_length // 4, 0)) + 1
+        end = start + self.snippet_length
+        if end < len(text):
+            end = text.rfind(" ", start, end + 1)
+            if end <= start:
+                end = start + self.snippet_length
+        excerpt = text[start:end]
+
+        parts = pattern.split(excerpt) if words else [excerpt]
+        matches = pattern.findall(excerpt) if words else []
+        snippet = escape(parts[0]) + "".join(
+            f"<mark>{escape(matched)}</mark>{escape(part)}" for matched, part in zip(matches, parts[1:])
+        )
+        return ("…" if start else "") + snippet + ("…" if end < len(text) else "")
+
+
+class DatabaseSearchBackend(BaseSearchBackend):
+    """
+    Works on any database. Every word of the search term must appear in the title,
+    description or text of a result. Results are ranked by where the words appear: in the
+    title first, then the description, then the text.
+
+    Words are matched with ``icontains``, which no database index covers: every search scans
+    the index table. That is one row per page and language, cheaper than the page and plugin
+    tables django CMS's search scans, but grows with the site. Large sites on PostgreSQL use
+    :class:`PostgresSearchBackend`.
+    """
+
+    #: Rank of a word found in the title, description and text
+    weights = (3, 2, 1)
+    #: Words of the search term beyond this number are ignored
+    max_words = 10
+
+    def search(self, queryset: QuerySet[PageContent], term: str) -> QuerySet[PageContent]:
+        words = self.get_words(term)
+        if not words:
+            return queryset.none()
+        title_weight, description_weight, text_weight = self.weights
+        rank = Value(0)
+        for word in words:
+            in_title = Q(rest_search_index__title__icontains=word)
+            in_description = Q(rest_search_index__description__icontains=word)
+            in_text = Q(rest_search_index__text__icontains=word)
+            queryset = queryset.filter(in_title | in_description | in_text)
+            rank += Case(
+                When(in_title, then=title_weight),
+                When(in_description, then=description_weight),
+                default=text_weight,
+                output_field=IntegerField(),
+            )
+        return queryset.annotate(search_rank=rank).order_by("-search_rank", "pk")
+
+    def get_words(self, term: str) -> list[str]:
+        return term.split()[: self.max_words]
+
+
+class PostgresSearchBackend(BaseSearchBackend):
+    """
+    Uses PostgreSQL's full-text search: words are matched by their stem, the search term
+    supports web search syntax (``"quoted phrases"``, ``or``, ``-excluded``), and results
+    are ranked by ``ts_rank`` with the title weighted highest.
+    """
+
+    #: Text search configuration, e.g., ``"english"``. ``None`` uses the database default.
+    config = None
+
+    def search(self, queryset: QuerySet[PageContent], term: str) -> QuerySet[PageContent]:
+        from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVectorField
+
+        # The stored vector is a tsvector column already: the cast only selects the lookups
+        vector = Cast("rest_search_index__search_vector", output_field=SearchVectorField())
+        query = SearchQuery(term, search_type="websearch", config=self.config)
+        return (
+            queryset.alias(search_vector=vector)
+            .filter(search_vector=query)
+            .annotate(search_rank=SearchRank(vector, query))
+            .order_by("-search_rank", "pk")
+        )
+
+    def update(self, page_content: PageContent) -> PageSearchIndex:
+        """Indexes the page content and stores its search vector, which the GIN index covers."""
+        from django.contrib.postgres.search import SearchVector
+
+        entry = super().update(page_content)
+        vector = (
+            SearchVector("title", weight="A", config=self.config)
+            + SearchVector("description", weight="B", config=self.config)
+            + SearchVector("text", weight="C", config=self.config)
+        )
+        PageSearchIndex.objects.filter(pk=entry.pk).update(search_vector=vector)
+        return entry
+
+    def get_words(self, term: str) -> list[str]:
+        # Drop the web search syntax and excluded words
+        words = (word.strip('"') for word in term.split() if word.lower() != "or" and not word.startswith("-"))
+        return [word for word in words if word]
+
+
+SEARCH_BACKENDS = {
+    "database": DatabaseSearchBackend,
+    "postgres": PostgresSearchBackend,
+}
+
+
+def get_search_backend() -> BaseSearchBackend:
+    """
+    Returns the search backend selected by the ``REST_SEARCH_BACKEND`` setting: ``"database"``,
+    ``"postgres"``, or the dotted path of a :class:`BaseSearchBackend` subclass.
+    """
+    name = getattr(settings, "REST_SEARCH_BACKEND", "database")
+    if name in SEARCH_BACKENDS:
+        return SEARCH_BACKENDS[name]()
+    try:
+        backend_class = import_string(name)
+    except ImportError:
+        raise ImproperlyConfigured(
+            f"REST_SEARCH_BACKEND must be one of {', '.join(SEARCH_BACKENDS)} or the dotted path "
+            f"of a search backend class, got {name!r}."
+        )
+    return backend_class()
+
+
+def is_versioned() -> bool:
+    return apps.is_installed("djangocms_versioning")
+
+
+def update_page_content(sender, instance: PageContent, raw: bool = False, **kwargs) -> None:
+    """Indexes saved page contents. With versioning, contents are indexed when published instead."""
+    if not raw and not is_versioned():
+        get_search_backend().update(instance)
+
+
+def update_placeholders(sender, **kwargs) -> None:
+    """Re-indexes page contents whose plugins were changed in the editor (without versioning)."""
+    if is_versioned():
+        return
+    backend = get_search_backend()
+    for value in kwargs.values():
+        if isinstance(value, Placeholder) and isinstance(value.source, PageContent):
+            backend.update(value.source)
+
+
+def update_version(sender, operation: str, obj, **kwargs) -> None:
+    """Indexes published page contents and removes unpublished ones (with versioning)."""
+    from djangocms_versioning import constants
+
+    if not isinstance(obj.content, PageContent):
+        return
+    if operation == constants.OPERATION_PUBLISH:
+        get_search_backend().update(obj.content)
+    elif operation == constants.OPERATION_UNPUBLISH:
+        get_search_backend().remove(obj.content)
+
+
+def connect_signals() -> None:
+    """Keeps the search index up to date with published page contents."""
+    from django.db.models.signals import post_save
+
+    from cms.signals import post_placeholder_operation
+
+    post_save.connect(update_page_content, sender=PageContent, dispatch_uid="djangocms_rest_search_page_content")
+    post_placeholder_operation.connect(update_placeholders, dispatch_uid="djangocms_rest_search_placeholders")
+    if is_versioned():
+        from djangocms_versioning.signals import post_version_operation
+
+        post_version_operation.connect(update_version, dispatch_uid="djangocms_rest_search_version")
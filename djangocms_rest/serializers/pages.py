@@ -1,6 +1,13 @@
-from django.db import models
+import copy
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connection, connections, models
+from django.utils import translation
 
 from cms.models import PageContent
+from cms.toolbar.utils import get_toolbar_from_request
 from cms.utils.placeholder import get_declared_placeholders_for_obj
 
 from rest_framework import serializers
@@ -130,9 +137,25 @@ class PageMetaSerializer(BasePageSerializer, BasePageContentMixin):
         return self.get_base_representation(page_content)
 
 
+def get_placeholder_workers() -> int:
+    """
+    Returns the number of threads used to serialize the placeholders of a page concurrently.
+    ``0`` or ``1`` serialize them one after another.
+    """
+    return int(getattr(settings, "REST_PLACEHOLDER_SERIALIZATION_WORKERS", 0) or 0)
+
+
+#: Values of the ``placeholders`` serializer context (and query parameter of the page detail endpoint)
+PLACEHOLDER_MODES = ("none", "links", "full")
+
+
 class PageContentSerializer(BasePageSerializer, BasePageContentMixin):
     """
     Serialize the page content with the placeholders in the order they are declared in the template.
+
+    The ``placeholders`` context key selects how placeholders are included: ``"full"`` (default)
+    embeds their content, ``"links"`` only their ``details`` URL without loading any plugins, and
+    ``"none"`` leaves them out. The ``slots`` context key limits them to the given slots.
     """
     placeholders = PlaceholderSerializer(many=True, required=False)
 
@@ -141,6 +164,12 @@ class PageContentSerializer(BasePageSerializer, BasePageContentMixin):
         self.request = self.context.get("request")
 
     def to_representation(self, page_content: PageContent) -> dict:
+        data = self.get_base_representation(page_content)
+        mode = self.context.get("placeholders", "full")
+        if mode == "none":
+            return data
+
+        slots = self.context.get("slots")
         declared_placeholders = get_declared_placeholders_for_obj(page_content)
         placeholder_map = {
             placeholder.slot: placeholder
@@ -149,18 +178,98 @@ class PageContentSerializer(BasePageSerializer, BasePageContentMixin):
         placeholders = [
             placeholder_map[declared.slot]
             for declared in declared_placeholders
-            if declared.slot in placeholder_map
+            if declared.slot in placeholder_map and (slots is None or declared.slot in slots)
         ]
 
-        data = self.get_base_representation(page_content)
-        data["placeholders"] = PlaceholderSerializer(
-            placeholders,
-            language=page_content.language,
-            many=True,
-            context={"request": self.request},
-        ).data
+        if mode == "links":
+            data["placeholders"] = self.get_placeholder_links(placeholders, page_content.language)
+        else:
+            data["placeholders"] = self.serialize_placeholders(placeholders, page_content.language)
         return data
 
+    def get_placeholder_links(self, placeholders: list, language: str) -> list:
+        """Describe the placeholders with the URL to fetch their content from, without their content."""
+        serializer = PlaceholderSerializer(language=language, render_plugins=False, context={"request": self.request})
+        return [
+            {
+                "slot": placeholder.slot,
+                "label": placeholder.get_label(),
+                "language": language,
+                "details": serializer.get_details(placeholder),
+            }
+            for placeholder in placeholders
+        ]
+
+    def serialize_placeholders(self, placeholders: list, language: str) -> list:
+        """
+        Serialize the placeholders in their given order. If ``REST_PLACEHOLDER_SERIALIZATION_WORKERS``
+        is set, the placeholders are serialized concurrently in a bounded thread pool.
+        """
+        workers = min(get_placeholder_workers(), len(placeholders))
+        if workers < 2 or connection.in_atomic_block:
+            # Worker threads use their own database connections and would not see
+            # uncommitted data of the current transaction, e.g., with ATOMIC_REQUESTS
+            return PlaceholderSerializer(
+                placeholders,
+                language=language,
+                many=True,
+                context={"request": self.request},
+            ).data
+
+        current_language = translation.get_language()
+        self.prepare_request_for_threads()
+        results = [None] * len(placeholders)
+        jobs = queue.SimpleQueue()
+        for job in enumerate(placeholders):
+            jobs.put(job)
+
+        def work():
+            request = self.get_thread_request()
+            try:
+                with translation.override(current_language):
+                    while True:
+                        try:
+                            index, placeholder = jobs.get_nowait()
+                        except queue.Empty:
+                            return
+                        results[index] = PlaceholderSerializer(
+                            placeholder,
+                            language=language,
+                            context={"request": request},
+                        ).data
+            finally:
+                # Each worker thread opens its own database connections
+                connections.close_all()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for future in [executor.submit(work) for _ in range(workers)]:
+                future.result()
+        # Results are stored by index to keep the declared order of the placeholders
+        return results
+
+    def prepare_request_for_threads(self) -> None:
+        """
+        Attaches the structures serialization adds to the request on first use before worker
+        threads copy the request: the toolbar, and the collected post-response callbacks and
+        file URLs, which the copies share with the request.
+        """
+        if not hasattr(self.request, "toolbar"):
+            self.request.toolbar = get_toolbar_from_request(self.request)
+        request = getattr(self.request, "_request", self.request)
+        request.__dict__.setdefault("_rest_post_response_callbacks", [])
+        request.__dict__.setdefault("_rest_file_urls", {})
+
+    def get_thread_request(self):
+        """
+        Returns a shallow copy of the request for a worker thread, so that attributes set on
+        the request while serializing stay with the thread.
+        """
+        request = copy.copy(self.request)
+        if hasattr(self.request, "_request"):
+            # DRF's request wraps Django's
+            request._request = copy.copy(self.request._request)
+        return request
+
 
 class PageListSerializer(BasePageSerializer, BasePageContentMixin):
     def __init__(self, *args, **kwargs):
@@ -169,3 +278,21 @@ class PageListSerializer(BasePageSerializer, BasePageContentMixin):
 
     def to_representation(self, page_content: PageContent) -> dict:
         return self.get_base_representation(page_content)
+
+
+class PageSearchResultSerializer(PageListSerializer):
+    snippet = serializers.CharField(allow_blank=True)
+    matched_slots = serializers.ListSerializer(child=serializers.CharField(), allow_empty=True)
+
+    def to_representation(self, page_content: PageContent) -> dict:
+        """
+        Adds the highlighted snippet and matched slots taken from the page's search index entry.
+        Results found while the index is empty have neither.
+        """
+        data = super().to_representation(page_content)
+        backend = self.context["search_backend"]
+        words = self.context["search_words"]
+        entry = getattr(page_content, "rest_search_index", None)
+        data["snippet"] = backend.get_snippet(entry, words) if entry else ""
+        data["matched_slots"] = backend.get_matched_slots(entry, words) if entry else []
+        return data
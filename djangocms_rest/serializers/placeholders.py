@@ -1,14 +1,18 @@
 from urllib.parse import urlencode
 
+from django.apps import apps
 from django.template import Context
-from django.urls import reverse
 
 from rest_framework import serializers
 
+from djangocms_rest.renderers import RawJSON
 from djangocms_rest.serializers.utils.render import render_html
-from djangocms_rest.utils import get_absolute_frontend_url
+from djangocms_rest.utils import get_absolute_frontend_url, placeholder_detail_url
 
 try:
+    if not apps.is_installed("drf_spectacular"):
+        # Not generating schemas: spare loading drf-spectacular
+        raise ImportError("drf_spectacular is not in INSTALLED_APPS")
     from drf_spectacular.utils import extend_schema_field
 
     HAS_SPECTACULAR = True
@@ -64,26 +68,38 @@ class PlaceholderSerializer(serializers.Serializer):
                     context=Context({"request": self.request}),
                     language=self.language,
                     use_cache=not getattr(self.request, "_preview_mode", False),
+                    raw_json=getattr(self.request, "_rest_raw_json", False),
                 )
             if self.request.GET.get("html", False):
-                html = render_html(self.request, instance, self.language)
+                html = render_html(
+                    self.request,
+                    instance,
+                    self.language,
+                    use_cache=not getattr(self.request, "_preview_mode", False),
+                )
                 for key, value in html.items():
                     if not hasattr(instance, key):
                         setattr(instance, key, value)
 
+        content = getattr(instance, "content", None)
+        if isinstance(content, RawJSON):
+            # Pre-encoded content is embedded by the renderer as is
+            instance.content = []
+            data = super().to_representation(instance)
+            data["content"] = instance.content = content
+            return data
         return super().to_representation(instance)
 
     def get_details(self, instance):
         url = get_absolute_frontend_url(
             self.request,
-            reverse(
-                "placeholder-detail",
-                args=[
-                    self.language,
-                    instance.content_type_id,
-                    instance.object_id,
-                    instance.slot,
-                ],
+            placeholder_detail_url.reverse(
+                {
+                    "language": self.language,
+                    "content_type_id": instance.content_type_id,
+                    "object_id": instance.object_id,
+                    "slot": instance.slot,
+                }
             ),
         )
         get_params = {key: self.request.GET[key] for key in ("html", "preview") if key in self.request.GET}
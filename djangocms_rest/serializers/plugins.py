@@ -1,17 +1,87 @@
+import hashlib
+import logging
 from typing import Any
 
 from django.apps import apps
 from django.db.models import Field, Model
 from django.http import HttpRequest
 from django.urls import NoReverseMatch, reverse
+from django.utils import translation
 
 from cms.models import CMSPlugin
 from cms.plugin_pool import plugin_pool
 
 from rest_framework import serializers
 
+from djangocms_rest import __version__
+from djangocms_rest.serializers.utils.cache import get_file_urls
 from djangocms_rest.utils import get_absolute_frontend_url
 
+try:
+    from filer.models import File
+except ImportError:
+    File = None
+
+
+logger = logging.getLogger(__name__)
+
+
+def _collect_soft_file_refs(data: Any, file_ids: set) -> None:
+    """
+    Collects the ids of filer files referenced as soft references in JSON data — where
+    :func:`serialize_soft_refs` resolves them, i.e., in the values of dicts.
+    """
+    if isinstance(data, list):
+        for item in data:
+            _collect_soft_file_refs(item, file_ids)
+    elif isinstance(data, dict):
+        for key, value in data.items():
+            if not isinstance(value, dict):
+                _collect_soft_file_refs(value, file_ids)
+            elif set(value.keys()) == {"model", "pk"}:
+                if value["model"] in ("filer.file", "filer.image"):
+                    _add_file_id(value["pk"], file_ids)
+            elif (key == "attrs" and value.get("data-cms-href")) or "internal_link" in value:
+                continue
+            elif "file_link" in value:
+                _add_file_id(value["file_link"], file_ids)
+            else:
+                _collect_soft_file_refs(value, file_ids)
+
+
+def _add_file_id(pk: Any, file_ids: set) -> None:
+    # Links without a file hold None or an empty string
+    if pk and str(pk).isdigit():
+        file_ids.add(str(pk))
+
+
+def prefetch_file_urls(request: HttpRequest, plugins) -> None:
+    """
+    Resolves the URLs of all filer files the plugins refer to — by foreign key or soft
+    reference — with one query and one cache round trip, and attaches them to the request.
+    :func:`serialize_fk` then uses them instead of loading each file and asking the storage
+    for its URL.
+    """
+    if File is None or request is None:
+        return
+    file_ids = set()
+    for plugin in plugins:
+        for field in plugin._meta.concrete_fields:
+            if field.is_relation and issubclass(field.related_model, File):
+                pk = getattr(plugin, field.attname)
+                if pk is not None:
+                    file_ids.add(str(pk))
+            elif isinstance(field, JSON_FIELDS):
+                _collect_soft_file_refs(getattr(plugin, field.attname, None), file_ids)
+
+    request = getattr(request, "_request", request)
+    file_urls = request.__dict__.setdefault("_rest_file_urls", {})
+    file_ids -= file_urls.keys()
+    if file_ids:
+        files = File.objects.non_polymorphic().filter(pk__in=file_ids)
+        urls = get_file_urls(files, resolve=lambda file: file.get_api_endpoint())
+        file_urls.update({str(pk): url for pk, url in urls.items()})
+
 
 def serialize_fk(
     request: HttpRequest,
@@ -34,7 +104,30 @@ def serialize_fk(
 
     Returns:
         dict[str, Any]: A dictionary representing the serialized foreign key, typically as a URL or identifier.
+
+    If the request carries a ``_rest_fk_cache`` dict, results are memoized in it. Bulk
+    serializations share it, since plugins on different pages often reference the same objects.
     """
+    fk_cache = getattr(request, "_rest_fk_cache", None)
+    if fk_cache is None:
+        return _serialize_fk(request, related_model, pk, obj)
+    key = (related_model._meta.label_lower, str(pk), translation.get_language())
+    if key not in fk_cache:
+        fk_cache[key] = _serialize_fk(request, related_model, pk, obj)
+    return fk_cache[key]
+
+
+def _serialize_fk(
+    request: HttpRequest,
+    related_model: type[CMSPlugin],
+    pk: Any,
+    obj: Model | None = None,
+) -> dict[str, Any]:
+    # File URLs resolved in bulk by prefetch_file_urls()
+    file_urls = getattr(getattr(request, "_request", request), "_rest_file_urls", None)
+    if file_urls and File is not None and issubclass(related_model, File) and str(pk) in file_urls:
+        return get_absolute_frontend_url(request, file_urls[str(pk)])
+
     # First choice: Check for get_api_endpoint method
     if hasattr(related_model, "get_api_endpoint"):
         if obj is None:
@@ -229,6 +322,7 @@ class PluginDefinitionSerializer(serializers.Serializer):
 
             except Exception:
                 # Skip plugins that fail to process
+                logger.exception("Could not generate the definition of plugin %s", plugin.__name__)
                 continue
 
         return definitions
@@ -293,3 +387,55 @@ class PluginDefinitionSerializer(serializers.Serializer):
             schema["description"] = str(field.help_text)
 
         return schema
+
+
+_plugin_definitions: dict[str, dict[str, Any]] = {}
+_plugin_pool_fingerprints: dict[tuple, str] = {}
+
+
+def get_plugin_pool_fingerprint() -> str:
+    """
+    Returns a hash of the registered plugins, their models' fields and serializers. It
+    changes whenever a deployment changes what the plugin definitions are generated from.
+    The hash is computed once per set of registered plugins.
+    """
+    registry = tuple(plugin_pool.plugins.items())
+    fingerprint = _plugin_pool_fingerprints.get(registry)
+    if fingerprint is None:
+        fingerprint = _get_plugin_pool_fingerprint()
+        _plugin_pool_fingerprints.clear()
+        _plugin_pool_fingerprints[registry] = fingerprint
+    return fingerprint
+
+
+def _get_plugin_pool_fingerprint() -> str:
+    parts = [__version__]
+    for name, plugin in sorted(plugin_pool.plugins.items()):
+        serializer_cls = getattr(plugin, "serializer_class", None)
+        parts.append(
+            f"{name}:{plugin.__module__}.{plugin.__qualname__}:{plugin.model._meta.label}:"
+            f"{','.join(field.name for field in plugin.model._meta.get_fields())}:"
+            f"{serializer_cls.__module__ + '.' + serializer_cls.__qualname__ if serializer_cls else ''}"
+        )
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def get_plugin_definitions() -> dict[str, Any]:
+    """
+    Returns the plugin definitions of :meth:`PluginDefinitionSerializer.generate_plugin_definitions`.
+    They are generated once and kept in the process and the shared cache, keyed by the plugin
+    pool's fingerprint: other processes, e.g., newly started workers, read them from the cache.
+    """
+    from django.core.cache import cache
+
+    fingerprint = get_plugin_pool_fingerprint()
+    definitions = _plugin_definitions.get(fingerprint)
+    if definitions is None:
+        cache_key = f"djangocms_rest:plugin_definitions:{fingerprint}"
+        definitions = cache.get(cache_key)
+        if definitions is None:
+            definitions = PluginDefinitionSerializer.generate_plugin_definitions()
+            cache.set(cache_key, definitions, None)
+        _plugin_definitions.clear()
+        _plugin_definitions[fingerprint] = definitions
+    return definitions
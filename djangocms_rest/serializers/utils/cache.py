@@ -1,11 +1,257 @@
+import hashlib
+import json
+import logging
+import threading
 import time
-from datetime import datetime
+import zlib
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+from django.conf import settings
 
 from cms.cache.placeholder import (
     _get_placeholder_cache_key,
+    _get_placeholder_cache_version as _get_cms_placeholder_cache_version,
     _get_placeholder_cache_version_key,
 )
 from cms.utils.conf import get_cms_setting
+from cms.utils.helpers import get_header_name, get_timezone_name
+
+from rest_framework.renderers import JSONRenderer
+
+
+logger = logging.getLogger(__name__)
+
+
+def get_stale_ttl():
+    """
+    Returns the number of seconds an expired placeholder cache entry may still be served
+    while it is being refreshed (stale-while-revalidate). ``0`` disables the mode.
+    """
+    return max(int(getattr(settings, "REST_PLACEHOLDER_CACHE_STALE_TTL", 0) or 0), 0)
+
+
+#: Storage formats for cached placeholder content
+CACHE_FORMAT_PYTHON = "python"
+CACHE_FORMAT_JSON = "json"
+CACHE_FORMAT_ZLIB = "zlib"
+
+
+def get_cache_format():
+    """
+    Returns the storage format for cached placeholder content: ``"json"`` (pre-encoded JSON
+    bytes), ``"zlib"`` (zlib-compressed JSON bytes) or ``"python"`` (pickled by the cache backend).
+    """
+    return getattr(settings, "REST_PLACEHOLDER_CACHE_FORMAT", CACHE_FORMAT_JSON)
+
+
+def encode_placeholder_content(content) -> tuple[str, object]:
+    """
+    Encodes serialized placeholder content for storage in the cache. Returns the storage
+    format used and the encoded content.
+
+    JSON is encoded exactly as DRF's compact :class:`~rest_framework.renderers.JSONRenderer`
+    would, so cached bytes can be embedded into a response as they are. Content that cannot
+    be encoded as JSON is stored as is.
+    """
+    cache_format = get_cache_format()
+    if cache_format not in (CACHE_FORMAT_JSON, CACHE_FORMAT_ZLIB):
+        return CACHE_FORMAT_PYTHON, content
+    try:
+        encoded = JSONRenderer().render(content)
+    except (TypeError, ValueError):
+        return CACHE_FORMAT_PYTHON, content
+    if cache_format == CACHE_FORMAT_ZLIB:
+        encoded = zlib.compress(encoded)
+    return cache_format, encoded
+
+
+def decode_placeholder_content(cached_value, raw=False):
+    """
+    Decodes the content of a placeholder cache entry. With ``raw=True``, JSON content is
+    returned as (uncompressed) JSON bytes instead of Python objects.
+    """
+    cache_format = cached_value.get("format", CACHE_FORMAT_PYTHON)
+    content = cached_value["content"]
+    if cache_format == CACHE_FORMAT_ZLIB:
+        content = zlib.decompress(content)
+    if cache_format != CACHE_FORMAT_PYTHON and not raw:
+        content = json.loads(content)
+    return content
+
+
+def get_plugin_cache_duration():
+    """
+    Returns the number of seconds serialized plugins are cached for individually.
+    ``0`` (the default) disables the per-plugin cache.
+    """
+    return max(int(getattr(settings, "REST_PLUGIN_CACHE_DURATION", 0) or 0), 0)
+
+
+def _get_plugin_rest_cache_key(plugin, site_id, request):
+    """
+    Returns the REST cache key of a serialized plugin. Saving a plugin updates its
+    ``changed_date`` and moving it changes its parent, so edited plugins get a new key.
+    Changes to objects the plugin refers to do not change the key: they show once the entry
+    expires, after ``REST_PLUGIN_CACHE_DURATION`` at most.
+    """
+    prefix = get_cms_setting("CACHE_PREFIX")
+    changed = plugin.changed_date.timestamp() if plugin.changed_date else 0
+    # Serialized plugins contain absolute URLs
+    host = request.get_host() if request else "_"
+    cache_key = (
+        f"{prefix}|rest_plugin|id:{plugin.pk}|lang:{plugin.language}|parent:{plugin.parent_id}"
+        f"|changed:{changed}|site:{site_id}|host:{host}"
+    )
+    if len(cache_key) > 200:
+        cache_key = f"{prefix}|rest_plugin|{hashlib.sha1(cache_key.encode('utf-8')).hexdigest()}"
+    return cache_key
+
+
+def get_plugin_rest_cache_many(plugins, site_id, request):
+    """
+    Returns the cached serializations of ``plugins`` found in the cache, keyed by plugin pk.
+    All plugins are read in one cache round trip.
+    """
+    from django.core.cache import cache
+
+    keys = {_get_plugin_rest_cache_key(plugin, site_id, request): plugin.pk for plugin in plugins}
+    return {keys[key]: data for key, data in cache.get_many(keys).items()}
+
+
+def set_plugin_rest_cache_many(plugins_data, site_id, request):
+    """
+    Caches the serializations of plugins, given as ``(plugin, data)`` pairs, for
+    ``REST_PLUGIN_CACHE_DURATION`` seconds.
+    """
+    from django.core.cache import cache
+
+    duration = get_plugin_cache_duration()
+    if duration and plugins_data:
+        cache.set_many(
+            {_get_plugin_rest_cache_key(plugin, site_id, request): data for plugin, data in plugins_data},
+            duration,
+        )
+
+
+def get_file_url_cache_duration():
+    """
+    Returns the number of seconds resolved URLs of filer files are cached for.
+    ``0`` (the default) disables the cache.
+    """
+    return max(int(getattr(settings, "REST_FILE_URL_CACHE_DURATION", 0) or 0), 0)
+
+
+def _get_file_url_cache_key(file):
+    """Returns the cache key of a file's URL. Replacing or moving a file updates ``modified_at``."""
+    prefix = get_cms_setting("CACHE_PREFIX")
+    modified = file.modified_at.timestamp() if file.modified_at else 0
+    return f"{prefix}|rest_file_url|id:{file.pk}|modified:{modified}"
+
+
+def _get_file_url_duration(file, duration):
+    """
+    Returns the number of seconds the file's URL may be cached for. Storages signing URLs,
+    e.g., S3 and Google Cloud with ``querystring_auth``, get at most half of the lifetime of
+    a signature, so cached URLs are valid for at least the other half. URLs of signing
+    storages with an unknown lifetime are not cached.
+    """
+    storage = getattr(file.file, "storage", None)
+    if not getattr(storage, "querystring_auth", False):
+        return duration
+    lifetime = getattr(storage, "querystring_expire", None) or getattr(storage, "expiration", None)
+    if isinstance(lifetime, timedelta):
+        lifetime = lifetime.total_seconds()
+    return min(duration, int(lifetime or 0) // 2)
+
+
+def get_file_urls(files, resolve):
+    """
+    Returns the URLs of the filer ``files`` keyed by file pk. URLs are read from the cache in
+    one round trip; the others are computed with ``resolve(file)`` and cached for
+    ``REST_FILE_URL_CACHE_DURATION`` seconds, or shorter for signed URLs.
+    """
+    from django.core.cache import cache
+
+    duration = get_file_url_cache_duration()
+    if not duration:
+        return {file.pk: resolve(file) for file in files}
+
+    keys = {_get_file_url_cache_key(file): file for file in files}
+    cached = cache.get_many(keys)
+    urls = {keys[key].pk: url for key, url in cached.items()}
+    missing = {}
+    for key, file in keys.items():
+        if key not in cached:
+            urls[file.pk] = resolve(file)
+            file_duration = _get_file_url_duration(file, duration)
+            if file_duration:
+                missing.setdefault(file_duration, {})[key] = urls[file.pk]
+    for file_duration, values in missing.items():
+        cache.set_many(values, file_duration)
+    return urls
+
+
+def get_local_cache_size():
+    """
+    Returns the maximum number of entries of the per-process placeholder cache.
+    ``0`` disables the in-process cache.
+    """
+    return max(int(getattr(settings, "REST_PLACEHOLDER_LOCAL_CACHE_SIZE", 0) or 0), 0)
+
+
+class LocalPlaceholderCache:
+    """
+    A size-bounded, thread-safe, per-process LRU cache in front of the shared cache backend.
+
+    Entries are stored under the fully-addressed placeholder cache key. Since that key contains
+    the placeholder's cache version, which is still read from the shared cache, invalidations
+    propagate to all processes. Cached values are shared between requests and must be treated
+    as read-only.
+    """
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            try:
+                deadline, value = self._entries[key]
+            except KeyError:
+                return None
+            if deadline <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, deadline, max_size):
+        with self._lock:
+            self._entries[key] = (deadline, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+local_placeholder_cache = LocalPlaceholderCache()
+
+
+def _set_local_placeholder_cache(key, entry):
+    max_size = get_local_cache_size()
+    if max_size:
+        if entry.get("format") == CACHE_FORMAT_ZLIB:
+            # Compression only pays off in the shared cache: local hits are served as JSON bytes
+            entry = {**entry, "format": CACHE_FORMAT_JSON, "content": zlib.decompress(entry["content"])}
+        # Keep the entry as long as the shared cache would serve it
+        local_placeholder_cache.set(key, entry, entry["expires"] + get_stale_ttl(), max_size)
 
 
 def _get_placeholder_cache_version(placeholder, lang, site_id):
@@ -43,31 +289,224 @@ def _set_placeholder_cache_version(placeholder, lang, site_id, version, vary_on_
     cache.set(key, (version, vary_on_list), duration)
 
 
+def _get_placeholder_rest_cache_version(placeholder, lang, site_id):
+    """
+    Returns the version and vary-on header-names list REST cache entries of the placeholder
+    are addressed by: django CMS's placeholder cache version.
+
+    django CMS's version expires with its content. In stale-while-revalidate mode, the
+    version the REST entry was stored under is kept in the REST version key for the
+    stale window, and used once django CMS's version has expired. An invalidation sets a
+    new django CMS version, so invalidated entries are never reached this way.
+    """
+    from django.core.cache import cache
+
+    if get_stale_ttl():
+        version_key = _get_placeholder_cache_version_key(placeholder, lang, site_id)
+        cached = cache.get_many([version_key, f"{version_key}:rest"])
+        version = cached.get(version_key) or cached.get(f"{version_key}:rest")
+        if version:
+            return version
+    return _get_cms_placeholder_cache_version(placeholder, lang, site_id)
+
+
+def _get_current_placeholder_rest_cache_key(placeholder, lang, site_id, request):
+    """Returns the REST cache key of the placeholder to read from or write to."""
+    version, vary_on_list = _get_placeholder_rest_cache_version(placeholder, lang, site_id)
+    return _get_placeholder_rest_cache_key(placeholder, lang, site_id, request, version, vary_on_list)
+
+
 def set_placeholder_rest_cache(placeholder, lang, site_id, content, request):
     """
     Sets the (correct) placeholder cache with the rendered placeholder.
+
+    If stale-while-revalidate is enabled, the entry carries its soft expiry and is kept
+    in the cache for another ``REST_PLACEHOLDER_CACHE_STALE_TTL`` seconds beyond it.
     """
     from django.core.cache import cache
 
-    key = _get_placeholder_cache_key(placeholder, lang, site_id, request) + ":rest"
+    # Stores the placeholder's vary-on headers with its django CMS cache version
+    _get_placeholder_cache_key(placeholder, lang, site_id, request)
+    version, vary_on_list = _get_cms_placeholder_cache_version(placeholder, lang, site_id)
+    key = _get_placeholder_rest_cache_key(placeholder, lang, site_id, request, version, vary_on_list)
 
     duration = min(
         get_cms_setting("CACHE_DURATIONS")["content"],
         placeholder.get_cache_expiration(request, datetime.now()),
     )
-    cache.set(key, {"content": content}, duration)
+    cache_format, encoded_content = encode_placeholder_content(content)
+    entry = {"content": encoded_content, "format": cache_format, "expires": time.time() + duration}
+    stale_ttl = get_stale_ttl()
+    if stale_ttl and duration > 0:
+        duration += stale_ttl
+    cache.set(key, entry, duration)
+    if duration > 0:
+        _set_local_placeholder_cache(key, entry)
 
-    # "touch" the cache-version, so that it stays as fresh as this content.
-    version, vary_on_list = _get_placeholder_cache_version(placeholder, lang, site_id)
+    # Keep the version the entry is stored under as long as the entry, so that it stays
+    # reachable for the stale window after django CMS's version has expired
     _set_placeholder_cache_version(placeholder, lang, site_id, version, vary_on_list, duration=duration)
 
 
-def get_placeholder_rest_cache(placeholder, lang, site_id, request):
+def get_placeholder_rest_cache(placeholder, lang, site_id, request, raw=False):
     """
     Returns the placeholder from cache respecting the placeholder's
     VARY headers.
+
+    The entry's content is decoded into Python objects unless ``raw`` is set: then content
+    stored as JSON is returned as JSON bytes, ready to be embedded into a response.
+
+    If ``REST_PLACEHOLDER_LOCAL_CACHE_SIZE`` is set, the per-process cache is consulted
+    before the shared cache. A local copy past its soft expiry is only used if the shared
+    entry has not been refreshed in the meantime. Entries prefetched for the request by
+    :func:`aprefetch_placeholder_rest_cache` are used without accessing any cache.
+    """
+    from django.core.cache import cache
+
+    prefetched = getattr(getattr(request, "_request", request), "_rest_placeholder_cache", None)
+    if prefetched and (placeholder.pk, lang, site_id) in prefetched:
+        # Entry already read by aprefetch_placeholder_rest_cache()
+        cached_value = prefetched[placeholder.pk, lang, site_id]
+        return {**cached_value, "content": decode_placeholder_content(cached_value, raw=raw)}
+
+    key = _get_current_placeholder_rest_cache_key(placeholder, lang, site_id, request)
+    cached_value = local_placeholder_cache.get(key) if get_local_cache_size() else None
+    if cached_value is None or is_placeholder_rest_cache_stale(cached_value):
+        # A stale local copy may already have been refreshed in the shared cache by another process
+        shared_value = cache.get(key)
+        if shared_value is not None:
+            cached_value = shared_value
+            if "expires" in cached_value:
+                _set_local_placeholder_cache(key, cached_value)
+    if cached_value is None:
+        return None
+    return {**cached_value, "content": decode_placeholder_content(cached_value, raw=raw)}
+
+
+def set_placeholder_html_cache(placeholder, lang, site_id, content, request):
+    """
+    Caches the HTML rendering of a placeholder together with its sekizai blocks (the result
+    of :func:`~djangocms_rest.serializers.utils.render.render_html`). The entry is versioned
+    and varied like the placeholder cache, so it is invalidated with it.
+    """
+    from django.core.cache import cache
+
+    duration = min(
+        get_cms_setting("CACHE_DURATIONS")["content"],
+        placeholder.get_cache_expiration(request, datetime.now()),
+    )
+    if duration > 0:
+        key = f"{_get_current_placeholder_rest_cache_key(placeholder, lang, site_id, request)}:html"
+        cache.set(key, content, duration)
+
+
+def get_placeholder_html_cache(placeholder, lang, site_id, request):
+    """Returns the cached HTML rendering of a placeholder with its sekizai blocks, or ``None``."""
+    from django.core.cache import cache
+
+    return cache.get(f"{_get_current_placeholder_rest_cache_key(placeholder, lang, site_id, request)}:html")
+
+
+def _get_placeholder_rest_cache_key(placeholder, lang, site_id, request, version, vary_on_list):
+    """
+    Returns the REST cache key of a placeholder for a django CMS placeholder cache version.
+
+    All REST placeholder cache entries are addressed through this function, so the sync
+    lookup, writes and the async prefetch cannot disagree on a key. Like django CMS's keys,
+    it varies on the time zone and the placeholder's vary-on headers.
+    """
+    prefix = get_cms_setting("CACHE_PREFIX")
+    tz = get_timezone_name()
+    cache_key = f"{prefix}|rest_placeholder|id:{placeholder.pk}|lang:{lang}|site:{site_id}|tz:{tz}|v:{version}"
+    sub_key_list = [f"{key}:{request.META.get(get_header_name(key)) or '_'}" for key in vary_on_list]
+    if sub_key_list:
+        cache_key += "|" + "|".join(sub_key_list)
+    if len(cache_key) > 200:
+        cache_key = f"{prefix}|rest_placeholder|{hashlib.sha1(cache_key.encode('utf-8')).hexdigest()}"
+    return cache_key
+
+
+async def aprefetch_placeholder_rest_cache(placeholders, lang, site_id, request):
+    """
+    Reads the REST cache entries of ``placeholders`` with the cache's async API (two round
+    trips for all placeholders: one for the cache versions, one for the entries) and attaches
+    the hits to the request, where :func:`get_placeholder_rest_cache` picks them up.
+
+    Returns a dict of the cache entries found, keyed by placeholder pk.
+    """
+    from django.core.cache import cache
+
+    version_keys = {
+        placeholder.pk: _get_placeholder_cache_version_key(placeholder, lang, site_id) for placeholder in placeholders
+    }
+    # In stale-while-revalidate mode, also read the versions REST entries were stored under
+    rest_version_keys = [f"{key}:rest" for key in version_keys.values()] if get_stale_ttl() else []
+    versions = await cache.aget_many([*version_keys.values(), *rest_version_keys]) if version_keys else {}
+    keys = {}
+    for placeholder in placeholders:
+        version_key = version_keys[placeholder.pk]
+        cached = versions.get(version_key) or (rest_version_keys and versions.get(f"{version_key}:rest"))
+        if cached:
+            # Without a cache version, there cannot be a cache entry
+            version, vary_on_list = cached
+            keys[placeholder.pk] = _get_placeholder_rest_cache_key(
+                placeholder, lang, site_id, request, version, vary_on_list
+            )
+
+    entries = {}
+    if get_local_cache_size():
+        for key in keys.values():
+            cached_value = local_placeholder_cache.get(key)
+            if cached_value is not None:
+                entries[key] = cached_value
+    # Stale local copies may already have been refreshed in the shared cache by another process
+    missing = [key for key in keys.values() if key not in entries or is_placeholder_rest_cache_stale(entries[key])]
+    if missing:
+        for key, cached_value in (await cache.aget_many(missing)).items():
+            entries[key] = cached_value
+            if "expires" in cached_value:
+                _set_local_placeholder_cache(key, cached_value)
+
+    hits = {pk: entries[key] for pk, key in keys.items() if key in entries}
+    request = getattr(request, "_request", request)
+    prefetched = request.__dict__.setdefault("_rest_placeholder_cache", {})
+    prefetched.update({(pk, lang, site_id): cached_value for pk, cached_value in hits.items()})
+    return hits
+
+
+def is_placeholder_rest_cache_stale(cached_value) -> bool:
+    """
+    Returns ``True`` if a cache entry returned by :func:`get_placeholder_rest_cache` has passed
+    its soft expiry and should be refreshed.
+    """
+    expires = cached_value.get("expires")
+    return expires is not None and expires <= time.time() and bool(get_stale_ttl())
+
+
+def schedule_placeholder_refresh(placeholder, lang, site_id, request, refresh):
+    """
+    Schedules ``refresh`` to run once the current response has been sent.
+
+    Only one refresh per placeholder entry is scheduled at a time across all processes
+    sharing the cache. The callbacks are collected on the request and run when the response
+    is closed, see :class:`~djangocms_rest.views_base.PostResponseCallbacks`.
     """
     from django.core.cache import cache
 
-    key = f"{_get_placeholder_cache_key(placeholder, lang, site_id, request, soft=True)}:rest"
-    return cache.get(key)
+    key = f"{_get_current_placeholder_rest_cache_key(placeholder, lang, site_id, request)}:refresh"
+    if not cache.add(key, True, get_stale_ttl()):
+        # Another request is already refreshing this entry
+        return False
+
+    def callback():
+        try:
+            refresh()
+        except Exception:
+            logger.exception("Refreshing the REST cache of placeholder %s failed", placeholder.pk)
+        finally:
+            cache.delete(key)
+
+    request = getattr(request, "_request", request)
+    # setdefault is atomic: placeholders may be serialized in parallel threads
+    request.__dict__.setdefault("_rest_post_response_callbacks", []).append(callback)
+    return True
@@ -1,21 +1,42 @@
+from django.contrib.sites.shortcuts import get_current_site
+
 from sekizai.context import SekizaiContext
 from sekizai.helpers import get_varname
 
+from djangocms_rest.serializers.utils.cache import get_placeholder_html_cache, set_placeholder_html_cache
+
 
-def render_html(request, placeholder, language):
+def render_html(request, placeholder, language, use_cache=True):
+    """
+    Renders the placeholder as HTML and returns it with the content of its sekizai blocks
+    (e.g., ``js`` and ``css``). With ``use_cache``, the whole result is cached next to the
+    REST placeholder cache.
+    """
     from cms.plugin_rendering import ContentRenderer
 
     content_renderer = ContentRenderer(request)
+    use_cache = use_cache and content_renderer.placeholder_cache_is_enabled()
+    site_id = get_current_site(request).pk
+    if use_cache:
+        cached_value = get_placeholder_html_cache(placeholder, language, site_id, request)
+        if cached_value is not None:
+            return cached_value
+
     context = SekizaiContext({"request": request, "LANGUAGE_CODE": language})
     content = content_renderer.render_placeholder(
         placeholder,
         context=context,
         language=language,
-        use_cache=True,
+        use_cache=use_cache,
     )
     sekizai_blocks = context[get_varname()]
 
-    return {
+    result = {
         "html": content,
         **{key: "".join(value) for key, value in sekizai_blocks.items() if value},
     }
+    # cache_placeholder is True unless a placeholder class opts out. Plugins that may not be
+    # cached reduce get_cache_expiration() to 0, in which case nothing is stored.
+    if use_cache and placeholder.cache_placeholder:
+        set_placeholder_html_cache(placeholder, language, site_id, result, request)
+    return result
@@ -0,0 +1,212 @@
+"""
+Static aliases of djangocms-alias for the ``static-alias-detail`` endpoint.
+
+Static aliases hold site-wide fragments such as headers and footers, addressed by the
+static code the ``{% static_alias %}`` template tag uses. They are requested with every
+page view but rarely change, so their responses are cached for a long time, carry an
+ETag, and are invalidated explicitly whenever an alias or its content changes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from functools import partial
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils.timezone import now
+
+from cms.models import Placeholder
+from cms.utils.conf import get_cms_setting
+from cms.utils.helpers import get_header_name
+
+
+def get_static_alias_cache_duration() -> int:
+    """
+    Returns the number of seconds static alias responses are cached for. They are
+    invalidated when an alias changes, so the default is a day. It also bounds how long
+    URLs of linked pages and files in them can be out of date. ``0`` disables the cache.
+    """
+    return max(int(getattr(settings, "REST_STATIC_ALIAS_CACHE_DURATION", 86400) or 0), 0)
+
+
+def get_static_alias(site: Site, static_code: str):
+    """
+    Returns the static alias with the given code. As with the ``static_alias`` template tag,
+    an alias of the site takes precedence over one shared by all sites.
+    """
+    from djangocms_alias.models import Alias
+
+    return (
+        Alias.objects.filter(Q(site=site) | Q(site__isnull=True), static_code=static_code)
+        .order_by(F("site").asc(nulls_last=True))
+        .first()
+    )
+
+
+def _get_cache_key(key: str) -> str:
+    prefix = get_cms_setting("CACHE_PREFIX")
+    cache_key = f"{prefix}|{key}"
+    if len(cache_key) > 200:
+        cache_key = f"{prefix}|{hashlib.sha1(cache_key.encode('utf-8')).hexdigest()}"
+    return cache_key
+
+
+def _get_static_alias_cache_version_key(static_code: str) -> str:
+    return _get_cache_key(f"rest_static_alias_version|code:{static_code}")
+
+
+def _get_static_alias_cache_version(static_code: str) -> int:
+    """Returns the cache version of the static code, starting a new one if there is none."""
+    from django.core.cache import cache
+
+    key = _get_static_alias_cache_version_key(static_code)
+    version = cache.get(key)
+    if version is None:
+        version = int(time.time() * 1000000)
+        cache.set(key, version, None)
+    return version
+
+
+def invalidate_static_alias_cache(static_code: str) -> None:
+    """Makes the cached responses of the static alias unreachable, in all languages and sites."""
+    from django.core.cache import cache
+
+    cache.set(_get_static_alias_cache_version_key(static_code), int(time.time() * 1000000), None)
+
+
+def _get_static_alias_vary_key(static_code: str, lang: str, site_id: int) -> str:
+    return _get_cache_key(f"rest_static_alias_vary|code:{static_code}|lang:{lang}|site:{site_id}")
+
+
+def _get_static_alias_rest_cache_key(
+    static_code: str, lang: str, site_id: int, request, html: bool, version: int, vary_on_list: list[str]
+) -> str:
+    # Responses contain absolute URLs
+    scheme = request.scheme if request else "_"
+    host = request.get_host() if request else "_"
+    cache_key = (
+        f"rest_static_alias|code:{static_code}|lang:{lang}|site:{site_id}|scheme:{scheme}|host:{host}"
+        f"|html:{int(html)}|v:{version}"
+    )
+    # Like django CMS's placeholder cache, vary on the headers the alias's plugins declare
+    sub_key_list = [f"{key}:{request.META.get(get_header_name(key)) or '_'}" for key in vary_on_list]
+    if sub_key_list:
+        cache_key += "|" + "|".join(sub_key_list)
+    return _get_cache_key(cache_key)
+
+
+def get_static_alias_rest_cache(static_code: str, lang: str, site_id: int, request, html: bool = False):
+    """Returns the cached response of a static alias as ``{"content": <JSON bytes>, "etag": ...}`` or ``None``."""
+    from django.core.cache import cache
+
+    version_key = _get_static_alias_cache_version_key(static_code)
+    vary_key = _get_static_alias_vary_key(static_code, lang, site_id)
+    values = cache.get_many([version_key, vary_key])
+    version, vary = values.get(version_key), values.get(vary_key)
+    # The vary-on headers are stored with the version they were read for
+    if version is None or vary is None or vary[0] != version:
+        return None
+    return cache.get(_get_static_alias_rest_cache_key(static_code, lang, site_id, request, html, *vary))
+
+
+def set_static_alias_rest_cache(
+    static_code: str, lang: str, site_id: int, request, content: bytes, placeholder: Placeholder, html: bool = False
+) -> dict:
+    """
+    Caches the JSON encoded response of the static alias's ``placeholder`` together with its
+    ETag, and returns the cache entry. The entry is kept for ``REST_STATIC_ALIAS_CACHE_DURATION``
+    seconds, or less if the placeholder's plugins expire sooner. It is not cached at all if
+    any of them may not be cached.
+    """
+    from django.core.cache import cache
+
+    entry = {"content": content, "etag": f'"{hashlib.sha1(content).hexdigest()}"'}
+    duration = min(get_static_alias_cache_duration(), placeholder.get_cache_expiration(request, now()))
+    if duration > 0:
+        version = _get_static_alias_cache_version(static_code)
+        vary_on_list = placeholder.get_vary_cache_on(request)
+        key = _get_static_alias_rest_cache_key(static_code, lang, site_id, request, html, version, vary_on_list)
+        vary_key = _get_static_alias_vary_key(static_code, lang, site_id)
+        cache.set_many({vary_key: (version, vary_on_list), key: entry}, duration)
+    return entry
+
+
+def is_versioned() -> bool:
+    return apps.is_installed("djangocms_versioning")
+
+
+def _invalidate_on_commit(static_code: str) -> None:
+    # Until the change is committed, a request would cache the old content under the new version
+    transaction.on_commit(partial(invalidate_static_alias_cache, static_code))
+
+
+def _invalidate_alias(alias_id: int) -> None:
+    from djangocms_alias.models import Alias
+
+    static_code = Alias.objects.filter(pk=alias_id).values_list("static_code", flat=True).first()
+    if static_code:
+        _invalidate_on_commit(static_code)
+
+
+def invalidate_alias(sender, instance, raw: bool = False, **kwargs) -> None:
+    """Invalidates a static alias when it is saved or deleted."""
+    if instance.static_code and not raw:
+        _invalidate_on_commit(instance.static_code)
+
+
+def invalidate_alias_content(sender, instance, raw: bool = False, **kwargs) -> None:
+    """
+    Invalidates the static alias of saved or deleted alias contents. With versioning,
+    contents are invalidated when published or unpublished instead.
+    """
+    if not raw and not is_versioned():
+        _invalidate_alias(instance.alias_id)
+
+
+def invalidate_placeholders(sender, **kwargs) -> None:
+    """Invalidates static aliases whose plugins were changed in the editor (without versioning)."""
+    from djangocms_alias.models import AliasContent
+
+    if is_versioned():
+        return
+    for value in kwargs.values():
+        if isinstance(value, Placeholder) and isinstance(value.source, AliasContent):
+            _invalidate_alias(value.source.alias_id)
+
+
+def invalidate_version(sender, operation: str, obj, **kwargs) -> None:
+    """Invalidates static aliases whose content was published or unpublished (with versioning)."""
+    from djangocms_alias.models import AliasContent
+    from djangocms_versioning import constants
+
+    if isinstance(obj.content, AliasContent) and operation in (
+        constants.OPERATION_PUBLISH,
+        constants.OPERATION_UNPUBLISH,
+    ):
+        _invalidate_alias(obj.content.alias_id)
+
+
+def connect_signals() -> None:
+    """Invalidates cached static alias responses when changes to aliases are committed."""
+    from django.db.models.signals import post_delete, post_save
+
+    from cms.signals import post_placeholder_operation
+    from djangocms_alias.models import Alias, AliasContent
+
+    for signal in (post_save, post_delete):
+        signal.connect(invalidate_alias, sender=Alias, dispatch_uid="djangocms_rest_static_alias")
+        signal.connect(
+            invalidate_alias_content, sender=AliasContent, dispatch_uid="djangocms_rest_static_alias_content"
+        )
+    post_placeholder_operation.connect(
+        invalidate_placeholders, dispatch_uid="djangocms_rest_static_alias_placeholders"
+    )
+    if is_versioned():
+        from djangocms_versioning.signals import post_version_operation
+
+        post_version_operation.connect(invalidate_version, dispatch_uid="djangocms_rest_static_alias_version")
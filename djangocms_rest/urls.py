@@ -1,3 +1,4 @@
+from django.apps import apps
 from django.urls import path
 
 from . import views
@@ -43,6 +44,18 @@ urlpatterns = [
         name="placeholder-detail",
     ),
     path("plugins/", views.PluginDefinitionView.as_view(), name="plugin-list"),
+    # Static alias endpoint (requires djangocms-alias)
+    *(
+        [
+            path(
+                "<slug:language>/static_aliases/<str:static_code>/",
+                views.StaticAliasDetailView.as_view(),
+                name="static-alias-detail",
+            ),
+        ]
+        if apps.is_installed("djangocms_alias")
+        else []
+    ),
     # Menu endpoints
     path("<slug:language>/menu/", create_view_with_url_name(views.MenuView, "menu"), name="menu"),
     path(
@@ -0,0 +1,33 @@
+"""
+URL configuration using the async views where available. Use it in place of
+``djangocms_rest.urls`` when running on an ASGI server::
+
+    path("api/", include("djangocms_rest.urls_async")),
+"""
+
+from django.urls import URLPattern
+
+from . import urls, views, views_async
+from .schemas import create_view_with_url_name
+
+
+ASYNC_VIEWS = {
+    views.PageDetailView: views_async.AsyncPageDetailView,
+    views.PlaceholderDetailView: views_async.AsyncPlaceholderDetailView,
+    views.MenuView: views_async.AsyncMenuView,
+    views.SubMenuView: views_async.AsyncSubMenuView,
+    views.BreadcrumbView: views_async.AsyncBreadcrumbView,
+}
+
+
+def get_async_pattern(pattern: URLPattern) -> URLPattern:
+    """Return the pattern with its view replaced by the async variant, if there is one."""
+    view_class = getattr(pattern.callback, "view_class", None)
+    for cls in getattr(view_class, "__mro__", ()):
+        if cls in ASYNC_VIEWS:
+            view = create_view_with_url_name(ASYNC_VIEWS[cls], pattern.name)
+            return URLPattern(pattern.pattern, view, pattern.default_args, pattern.name)
+    return pattern
+
+
+urlpatterns = [get_async_pattern(pattern) for pattern in urls.urlpatterns]
@@ -1,9 +1,22 @@
+import re
+import time
+from urllib.parse import quote
+
+from django.conf import settings
 from django.contrib.sites.models import Site
 from django.core.exceptions import FieldError
-from django.db.models import QuerySet
+from django.core.signals import setting_changed
+from django.db import transaction
+from django.db.models import Prefetch, QuerySet, prefetch_related_objects
+from django.dispatch import receiver
 from django.http import Http404
+from django.urls import NoReverseMatch, get_script_prefix, get_urlconf, reverse
+from django.urls.converters import get_converters
+from django.utils import translation
+from django.utils.http import RFC3986_SUBDELIMS
 
-from cms.models import Page, PageUrl
+from cms.models import Page, PageContent, PageUrl
+from cms.models.pagemodel import AdminCacheDict
 
 from rest_framework.request import Request
 
@@ -17,14 +30,132 @@ def get_site_filtered_queryset(site: Site) -> QuerySet:
         return Page.objects.filter(site=site)
     except FieldError:
         # Can be removed once django CMS 4.1 is no longer supported
-        return Page.objects.filter(node__site=site)
+        return Page.objects.filter(node__site=site).select_related("node")
 
 
-def get_object(site: Site, path: str) -> Page:
-    page_urls = (
-        PageUrl.objects.get_for_site(site).filter(path=path).select_related("page")
-    )
-    page_urls = list(page_urls)
+# The position of a page in the page tree. On django CMS 4.1, it is kept by the page's node.
+# Can be removed once django CMS 4.1 is no longer supported
+PAGE_TREE_PATH_FIELD = "path" if any(field.name == "path" for field in Page._meta.fields) else "node__path"
+
+
+def get_page_tree_path(page: Page) -> str:
+    """Returns the path of the page in the page tree."""
+    return page.path if PAGE_TREE_PATH_FIELD == "path" else page.node.path
+
+
+def prefetch_page_contents(pages: list[Page]) -> list[Page]:
+    """
+    Loads the contents of all ``pages`` in all languages in two queries: the published
+    contents used by ``Page.get_content_obj`` and the latest contents used by
+    ``Page.get_admin_content`` and ``Page.get_languages``.
+    """
+    prefetch_related_objects(pages, Prefetch("pagecontent_set", queryset=PageContent.objects.all()))
+    admin_contents = {}
+    pages_by_id = {page.pk: page for page in pages}
+    for page_content in PageContent.admin_manager.filter(page__in=pages).latest_content():
+        page_content.page = pages_by_id[page_content.page_id]
+        admin_contents.setdefault(page_content.page_id, {}).setdefault(page_content.language, page_content)
+    for page in pages:
+        page.admin_content_cache = AdminCacheDict(admin_contents.get(page.pk, {}))
+    return pages
+
+
+def get_page_contents(pages: QuerySet | list[Page], language: str, preview: bool = False) -> list[PageContent]:
+    """
+    Returns the content of each page in ``language`` (or a fallback language), skipping pages
+    without content. With ``preview``, the latest (possibly unpublished) content is returned.
+    The contents of all pages are loaded at once.
+    """
+    content_getter = "get_admin_content" if preview else "get_content_obj"
+    page_contents = []
+    for page in prefetch_page_contents(list(pages)):
+        page_content = getattr(page, content_getter)(language, fallback=True)
+        if page_content:
+            page_contents.append(page_content)
+    return page_contents
+
+
+PATH_INDEX_VERSION_KEY = "djangocms_rest:path_index_version"
+
+# Per-process index of page paths by site id: (version, {path: page id})
+_path_index: dict[int, tuple[int, dict[str, int]]] = {}
+
+
+def invalidate_path_index(*args, **kwargs) -> None:
+    """Invalidates the path indexes of all sites in all processes."""
+    from django.core.cache import cache
+
+    cache.set(PATH_INDEX_VERSION_KEY, time.time_ns(), None)
+    _path_index.clear()
+
+
+def invalidate_path_index_on_commit(*args, **kwargs) -> None:
+    """
+    Invalidates the path indexes once the current transaction is committed, so that no request
+    rebuilds them from the data before the change. Connected to the signals of page and page
+    URL changes.
+    """
+    transaction.on_commit(invalidate_path_index, using=kwargs.get("using"))
+
+
+def _start_path_index_version() -> int:
+    """Starts a version on first use or after eviction from the cache, unless another process just did."""
+    from django.core.cache import cache
+
+    version = time.time_ns()
+    if not cache.add(PATH_INDEX_VERSION_KEY, version, None):
+        version = cache.get(PATH_INDEX_VERSION_KEY, version)
+    return version
+
+
+def _build_path_index(rows) -> dict[str, int]:
+    index = {}
+    for path, page_id in rows:
+        # Keep the first page if pages share a path in different languages
+        index.setdefault(path, page_id)
+    return index
+
+
+def _get_path_index_rows(site: Site) -> QuerySet:
+    return PageUrl.objects.get_for_site(site).exclude(path=None).order_by("pk").values_list("path", "page_id")
+
+
+def get_page_id_for_path(site: Site, path: str) -> int | None:
+    """
+    Returns the id of the page of ``site`` with the URL path ``path``, or ``None``. The paths
+    of all pages of the site are loaded at once and kept in memory until pages or their URLs
+    change, so an unknown path is rejected without a database query.
+    """
+    from django.core.cache import cache
+
+    version = cache.get(PATH_INDEX_VERSION_KEY) or _start_path_index_version()
+    entry = _path_index.get(site.pk)
+    if entry is None or entry[0] != version:
+        entry = _path_index[site.pk] = (version, _build_path_index(_get_path_index_rows(site)))
+    return entry[1].get(path)
+
+
+async def aget_page_id_for_path(site: Site, path: str) -> int | None:
+    """Async version of :func:`get_page_id_for_path`."""
+    from asgiref.sync import sync_to_async
+    from django.core.cache import cache
+
+    version = await cache.aget(PATH_INDEX_VERSION_KEY) or await sync_to_async(_start_path_index_version)()
+    entry = _path_index.get(site.pk)
+    if entry is None or entry[0] != version:
+        rows = [row async for row in _get_path_index_rows(site)]
+        entry = _path_index[site.pk] = (version, _build_path_index(rows))
+    return entry[1].get(path)
+
+
+def _get_page_urls(site: Site, path: str, page_id: int | None) -> QuerySet:
+    if page_id is None:
+        # Unknown path: answered from the path index alone
+        raise Http404
+    return PageUrl.objects.get_for_site(site).filter(path=path, page_id=page_id).select_related("page")
+
+
+def _get_page_from_urls(page_urls: list) -> Page:
     try:
         page = page_urls[0].page
     except IndexError:
@@ -34,6 +165,16 @@ def get_object(site: Site, path: str) -> Page:
     return page
 
 
+def get_object(site: Site, path: str) -> Page:
+    return _get_page_from_urls(list(_get_page_urls(site, path, get_page_id_for_path(site, path))))
+
+
+async def aget_object(site: Site, path: str) -> Page:
+    """Async version of :func:`get_object` using the async ORM."""
+    page_urls = _get_page_urls(site, path, await aget_page_id_for_path(site, path))
+    return _get_page_from_urls([url async for url in page_urls])
+
+
 def get_absolute_frontend_url(request: Request, path: str) -> str:
     """
     Creates an absolute URL for a given relative path using the current site's domain and protocol.
@@ -54,3 +195,80 @@ def get_absolute_frontend_url(request: Request, path: str) -> str:
     if not path.startswith("/"):
         path = f"/{path}"
     return f"{protocol}://{domain}{path}"
+
+
+class URLTemplate:
+    """
+    Builds the URLs of a named route as ``reverse()`` does, but from a template compiled once
+    per URLconf, script prefix and language: only the variable parts are filled in. Variables
+    are declared with their path converter, e.g., ``URLTemplate("page-detail", language="slug",
+    path="path")``.
+    """
+
+    _instances = []
+
+    def __init__(self, name: str, **converters: str):
+        self.name = name
+        self.converters = {key: get_converters()[converter] for key, converter in converters.items()}
+        self.patterns = {key: re.compile(converter.regex) for key, converter in self.converters.items()}
+        self.templates = {}
+        self._instances.append(self)
+
+    def compile(self) -> list[str]:
+        """
+        Reverses the route once with unique stand-ins for the variables and splits the URL at
+        them. Returns a list alternating literal parts and variable names.
+        """
+        stand_ins = {key: f"{90817263500 + i}" for i, key in enumerate(self.converters)}
+        url = reverse(self.name, kwargs=stand_ins)
+        parts = [url]
+        for key, stand_in in stand_ins.items():
+            literal, sep, rest = parts.pop().partition(stand_in)
+            if not sep:
+                raise NoReverseMatch(f"Cannot compile a URL template for {self.name!r}.")
+            parts += [literal, key, rest]
+        return parts
+
+    def reverse(self, kwargs: dict, language: str | None = None) -> str:
+        """
+        Returns the URL for ``kwargs``, as ``reverse()`` would with ``language`` (or the current
+        language) active. Raises ``NoReverseMatch`` for values the route's converters reject.
+        """
+        language = language or translation.get_language()
+        key = (get_urlconf() or settings.ROOT_URLCONF, get_script_prefix(), language)
+        template = self.templates.get(key)
+        if template is None:
+            with translation.override(language):
+                template = self.templates[key] = self.compile()
+
+        url = []
+        for i, part in enumerate(template):
+            if i % 2:
+                converter = self.converters[part]
+                try:
+                    value = converter.to_url(kwargs[part])
+                except (KeyError, ValueError):
+                    value = None
+                if value is None or not self.patterns[part].fullmatch(value):
+                    raise NoReverseMatch(f"Reverse for {self.name!r} with {part}={kwargs.get(part)!r} not found.")
+                part = quote(value, safe=RFC3986_SUBDELIMS + "/~:@")
+            url.append(part)
+        return "".join(url)
+
+    @classmethod
+    def clear(cls) -> None:
+        for url_template in cls._instances:
+            url_template.templates.clear()
+
+
+@receiver(setting_changed)
+def clear_url_templates(*, setting, **kwargs):
+    if setting in ("ROOT_URLCONF", "FORCE_SCRIPT_NAME", "LANGUAGES", "LANGUAGE_CODE"):
+        URLTemplate.clear()
+
+
+page_root_url = URLTemplate("page-root", language="slug")
+page_detail_url = URLTemplate("page-detail", language="slug", path="path")
+placeholder_detail_url = URLTemplate(
+    "placeholder-detail", language="slug", content_type_id="int", object_id="int", slot="str"
+)
@@ -1,47 +1,65 @@
 from __future__ import annotations
 
+import json
 from typing import Any
 from django.contrib.sites.shortcuts import get_current_site
-from django.urls import reverse
-from django.utils.functional import lazy
+from django.db.models import F, Q
+from django.template import Context
+from django.utils.functional import cached_property
+from django.utils.http import parse_etags
 
-from cms.models import Page, PageContent, Placeholder
+from cms.models import CMSPlugin, Page, PageContent, Placeholder
 from cms.utils.conf import get_languages
 from cms.utils.page_permissions import user_can_view_page
+from cms.utils.plugins import downcast_plugins, get_plugins_as_layered_tree
 from menus.menu_pool import menu_pool
 from menus.templatetags.menu_tags import ShowBreadcrumb, ShowMenu, ShowSubMenu
 
 
-from rest_framework.exceptions import NotFound
+from rest_framework import status
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from djangocms_rest.permissions import CanViewPage, IsAllowedPublicLanguage
+from djangocms_rest.pagination import KeysetCursorPagination
+from djangocms_rest.permissions import CanViewPage, IsAllowedPublicLanguage, get_visible_page_ids
 from djangocms_rest.serializers.languages import LanguageSerializer
 from djangocms_rest.serializers.menus import NavigationNodeSerializer
 from djangocms_rest.serializers.pages import (
+    PLACEHOLDER_MODES,
     PageContentSerializer,
     PageListSerializer,
     PageMetaSerializer,
+    PageSearchResultSerializer,
 )
 from djangocms_rest.serializers.placeholders import PlaceholderSerializer
-from djangocms_rest.serializers.plugins import PluginDefinitionSerializer
+from djangocms_rest.serializers.plugins import PluginDefinitionSerializer, get_plugin_definitions
 from djangocms_rest.utils import (
+    PAGE_TREE_PATH_FIELD,
     get_object,
+    get_page_contents,
     get_site_filtered_queryset,
+    page_detail_url,
+    page_root_url,
+    prefetch_page_contents,
 )
 from djangocms_rest.views_base import BaseAPIView, BaseListAPIView, preview_schema
-from djangocms_rest.schemas import extend_placeholder_schema, extend_page_search_schema, menu_schema_class
+from djangocms_rest.schemas import (
+    extend_page_detail_schema,
+    extend_page_search_schema,
+    extend_placeholder_schema,
+    extend_static_alias_schema,
+    menu_schema_class,
+)
+
 
-# Generate the plugin definitions once at module load time
-# This avoids the need to import the plugin definitions in every view
-# and keeps the code cleaner.
-# Attn: Dynamic changes to the plugin pool will not be reflected in the
-# plugin definitions.
-# If you need to update the plugin definitions, you need to reassign the variable.
-PLUGIN_DEFINITIONS = lazy(PluginDefinitionSerializer.generate_plugin_definitions, dict)()
+def __getattr__(name: str) -> Any:
+    # The plugin definitions used to be generated into this module-level name
+    if name == "PLUGIN_DEFINITIONS":
+        return get_plugin_definitions()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class HealthCheckView(APIView):
@@ -72,41 +90,113 @@ class PageListView(BaseListAPIView):
     permission_classes = [IsAllowedPublicLanguage]
     serializer_class = PageListSerializer
     pagination_class = LimitOffsetPagination
-
-    def get_queryset(self):
-        """Get queryset of pages for the given language."""
-        language = self.kwargs["language"]
+    # Used instead of pagination_class if the request has a `cursor` parameter
+    cursor_pagination_class = KeysetCursorPagination
+    # Pages are annotated with their tree path, which django CMS 4.1 keeps on the page's node
+    cursor_ordering = "tree_path"
+
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator") and self.cursor_pagination_requested():
+            self._paginator = self.cursor_pagination_class()
+        return super().paginator
+
+    def cursor_pagination_requested(self) -> bool:
+        return self.cursor_pagination_class is not None and "cursor" in self.request.query_params
+
+    def get_page_queryset(self):
+        """Get queryset of pages of the site the user might see."""
         qs = get_site_filtered_queryset(self.site)
 
         # Filter out pages which require login
         if self.request.user.is_anonymous:
             qs = qs.filter(login_required=False)
+        return qs
 
+    def get_queryset(self):
+        """Get queryset of pages for the given language."""
+        qs = self.get_page_queryset()
+        if self.cursor_pagination_requested():
+            # Contents are resolved for the requested page of results only. Pages the user
+            # cannot see are left out before paginating so that no page of results comes up short.
+            qs = qs.filter(pk__in=get_visible_page_ids(self.request.user, qs, self.site))
+            return qs.annotate(tree_path=F(PAGE_TREE_PATH_FIELD))
+        return self.get_page_contents(qs)
+
+    def paginate_queryset(self, queryset):
+        page = super().paginate_queryset(queryset)
+        if page is not None:
+            page = self.get_page_results(page)
+        return page
+
+    def get_page_results(self, page: list) -> list:
+        """Get the results to serialize for a page of the paginated queryset."""
+        if self.cursor_pagination_requested():
+            return self.resolve_page_contents(page)
+        return page
+
+    def get_page_contents(self, pages) -> list[PageContent]:
+        """Get the contents of the pages visible to the user in the requested language."""
+        pages = list(pages)
+        visible_page_ids = get_visible_page_ids(self.request.user, pages, self.site)
+        return self.resolve_page_contents([page for page in pages if page.pk in visible_page_ids])
+
+    def resolve_page_contents(self, pages) -> list[PageContent]:
+        """Get the contents of the pages in the requested language."""
         try:
-            pages = [
-                getattr(page, self.content_getter)(language, fallback=True)
-                for page in qs
-                if user_can_view_page(self.request.user, page)
-                and getattr(page, self.content_getter)(language, fallback=True)
-            ]
-
-            return pages
+            return get_page_contents(pages, self.kwargs["language"], preview=self._preview_requested())
         except PageContent.DoesNotExist:
             raise NotFound()
 
 
 class PageSearchView(PageListView):
+    serializer_class = PageSearchResultSerializer
+    search_term = ""
+    # Results are ordered by rank, which is no unique key to page on
+    cursor_pagination_class = None
+
     @extend_page_search_schema
     def get(self, request, language: str | None = None) -> Response:
-        self.search_term = request.GET.get("q", "")
+        if "cursor" in request.query_params:
+            raise ValidationError({"cursor": "Search results are ranked and paginated with limit and offset only."})
         self.language = language
         return super().get(request)
 
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.search_term = request.GET.get("q", "")
+
+    @cached_property
+    def search_backend(self):
+        from djangocms_rest.search import get_search_backend
+
+        return get_search_backend()
+
     def get_queryset(self):
+        from djangocms_rest.models import PageSearchIndex
+
         if not self.search_term:
             return PageContent.objects.none()
-        qs = Page.objects.search(self.search_term, language=self.language, current_site_only=False).on_site(self.site)
-        return PageContent.objects.filter(page__in=qs).distinct()
+        pages = self.get_page_queryset()
+        qs = PageContent.objects.filter(page__in=pages).select_related("rest_search_index")
+        if self.language:
+            qs = qs.filter(language=self.language)
+        if PageSearchIndex.objects.exists():
+            qs = self.search_backend.search(qs, self.search_term)
+        else:
+            qs = self.search_backend.search_unindexed(qs, self.search_term, language=self.language)
+        visible_page_ids = get_visible_page_ids(self.request.user, pages.filter(pk__in=qs.values("page")), self.site)
+        return qs.filter(page__in=visible_page_ids)
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["search_backend"] = self.search_backend
+        context["search_words"] = self.search_backend.get_words(self.search_term)
+        return context
+
+    def get_page_results(self, page: list) -> list:
+        # Search results are page contents already
+        return page
 
 
 class PageTreeListView(BaseAPIView):
@@ -122,12 +212,10 @@ class PageTreeListView(BaseAPIView):
             qs = qs.filter(login_required=False)
 
         try:
-            pages = [
-                getattr(page, self.content_getter)(language, fallback=True)
-                for page in qs
-                if user_can_view_page(self.request.user, page)
-                and getattr(page, self.content_getter)(language, fallback=True)
-            ]
+            pages = list(qs)
+            visible_page_ids = get_visible_page_ids(self.request.user, pages, self.site)
+            pages = [page for page in pages if page.pk in visible_page_ids]
+            pages = get_page_contents(pages, language, preview=self._preview_requested())
 
             if not any(pages):
                 raise PageContent.DoesNotExist()
@@ -143,26 +231,138 @@ class PageDetailView(BaseAPIView):
     permission_classes = [IsAllowedPublicLanguage, CanViewPage]
     serializer_class = PageContentSerializer
 
+    @extend_page_detail_schema
     def get(self, request: Request, language: str, path: str = "") -> Response:
         """Retrieve a page instance. The page instance includes the placeholders and
-        their links to retrieve dynamic content."""
+        their links to retrieve dynamic content.
+
+        Optional (if the get parameter `?include=menu,submenu,breadcrumbs` is added to the API url):
+        the navigation structures of the page, as returned by the menu, submenu and breadcrumbs
+        endpoints with their default options
+
+        Optional (if the get parameter `?placeholders=links` or `?placeholders=none` is added to the
+        API url): only the links to the placeholders, or no placeholders at all. `?slots=` limits
+        the placeholders to a comma-separated list of slots"""
         site = self.site
+        context = self.get_serializer_context()
+        includes = self.get_includes()
+        translation_languages = self.get_translation_languages(language)
         page = get_object(site, path)
+        if translation_languages:
+            # Load the contents of all languages at once
+            prefetch_page_contents([page])
+        page_content = self.get_page_content(request, page, language)
+        try:
+            serializer = self.serializer_class(page_content, read_only=True, context=context)
+            data = serializer.data
+        except PageContent.DoesNotExist:
+            raise NotFound()
+        if includes:
+            data.update(self.get_included_data(request, includes, page, language, path))
+        if translation_languages:
+            data["translations"] = self.get_translations(request, page, translation_languages)
+        return Response(data)
+
+    def get_translation_languages(self, language: str) -> list[str]:
+        """
+        Return the languages requested with the `languages` query parameter: a comma-separated
+        list of language codes, or `all` for all languages available to the user.
+        """
+        requested = [code for code in self.request.GET.get("languages", "").split(",") if code]
+        if not requested:
+            return []
+        available = [
+            lang["code"]
+            for lang in get_languages().get(self.site.pk, [])
+            if lang.get("public", True) or self._preview_requested()
+        ]
+        if requested == ["all"]:
+            return available
+        unknown = [code for code in requested if code not in available]
+        if unknown:
+            raise ValidationError({"languages": f"Unknown or unavailable language(s): {', '.join(unknown)}."})
+        return requested
+
+    def get_translations(self, request: Request, page: Page, languages: list[str]) -> dict[str, dict]:
+        """
+        Serialize the page in each of the languages it has content in: its metadata, or
+        with `?translations=full`, the same data as the page detail response.
+        """
+        if request.GET.get("translations") == "full":
+            serializer_class = self.serializer_class
+        else:
+            serializer_class = PageListSerializer
+        translations = {}
+        for code in languages:
+            page_content = getattr(page, self.content_getter)(code, fallback=False)
+            if page_content:
+                translations[code] = serializer_class(
+                    page_content, read_only=True, context=self.get_serializer_context()
+                ).data
+        return translations
+
+    def get_serializer_context(self) -> dict[str, Any]:
+        """
+        Return the serializer context with the placeholder inclusion mode of the `placeholders`
+        query parameter (`none`, `links` or `full`) and the slots of the `slots` query parameter.
+        """
+        mode = self.request.GET.get("placeholders") or "full"
+        if mode not in PLACEHOLDER_MODES:
+            raise ValidationError({"placeholders": f"Must be one of: {', '.join(PLACEHOLDER_MODES)}."})
+        slots = self.request.GET.get("slots")
+        return {
+            "request": self.request,
+            "placeholders": mode,
+            "slots": {slot for slot in slots.split(",") if slot} if slots else None,
+        }
+
+    def get_includes(self) -> list[str]:
+        """Return the navigation structures requested with the `include` query parameter."""
+        includes = [name for name in self.request.GET.get("include", "").split(",") if name]
+        unknown = [name for name in includes if name not in self.get_include_views()]
+        if unknown:
+            raise ValidationError({"include": f"Unknown value(s): {', '.join(unknown)}."})
+        return includes
+
+    def get_include_views(self) -> dict[str, type[MenuView]]:
+        """Return the views whose data can be included, by the name used in the `include` query parameter."""
+        return {"menu": MenuView, "submenu": SubMenuView, "breadcrumbs": BreadcrumbView}
+
+    def get_included_data(
+        self, request: Request, includes: list[str], page: Page, language: str, path: str
+    ) -> dict[str, Any]:
+        """Serialize the requested navigation structures for the resolved page, sharing one menu renderer."""
+        include_views = self.get_include_views()
+        views = {
+            name: include_views[name](request=request, args=(), kwargs={}, format_kwarg=None, site=self.site)
+            for name in includes
+        }
+        menu_renderer = views[includes[0]].get_menu_renderer(request, page, language, path)
+        data = {}
+        for name, view in views.items():
+            kwargs = {}
+            view.populate_defaults(kwargs)
+            nodes = view.render_menu(request, menu_renderer, **kwargs)
+            data[name] = view.serializer_class(nodes, many=True, context={"request": request}).data
+        return data
+
+    def get_page_content(self, request: Request, page: Page, language: str) -> PageContent:
+        """Check the permissions for the page and return its content in the given language."""
         self.check_object_permissions(request, page)
-
         try:
             page_content = getattr(page, self.content_getter)(language, fallback=True)
             if not page_content:
                 raise PageContent.DoesNotExist()
-            serializer = self.serializer_class(page_content, read_only=True, context={"request": request})
-            return Response(serializer.data)
         except PageContent.DoesNotExist:
             raise NotFound()
+        return page_content
 
 
 class PlaceholderDetailView(BaseAPIView):
     permission_classes = [IsAllowedPublicLanguage]
     serializer_class = PlaceholderSerializer
+    cursor_pagination_class = KeysetCursorPagination
+    cursor_ordering = "position"
 
     @extend_placeholder_schema
     def get(
@@ -184,7 +384,11 @@ class PlaceholderDetailView(BaseAPIView):
 
         Optional (if the get parameter `?html=1` is added to the API url):
         - "html": The content rendered as html. Sekizai blocks such as "js" or "css" will be added
-          as separate attributes"""
+          as separate attributes
+
+        Optional (if the get parameters `?depth=`, `?cursor=` or `?parent=` are added to the API url):
+        the plugin tree limited to `depth` levels, a page of top-level plugins with "next" and
+        "previous" links, or the children of the plugin `parent`"""
         try:
             placeholder = Placeholder.objects.get(content_type_id=content_type_id, object_id=object_id, slot=slot)
         except Placeholder.DoesNotExist:
@@ -196,18 +400,180 @@ class PlaceholderDetailView(BaseAPIView):
 
         if source is None:
             raise NotFound()
-        else:
-            # TODO: Here should be a check for the source model's visibility
-            # For now, we only check pages
-            if isinstance(source, PageContent):
-                # If the object is a PageContent, check the page view permission
-                if not user_can_view_page(request.user, source.page):
-                    raise NotFound()
+        self.check_source(request, placeholder, source)
+
+        if self.plugin_tree_requested():
+            return Response(self.get_plugin_tree_data(request, placeholder, language))
+        serializer = self.serializer_class(instance=placeholder, request=request, language=language, read_only=True)
+        return Response(serializer.data)
+
+    def check_source(self, request: Request, placeholder: Placeholder, source) -> None:
+        """Check that the placeholder and the object it belongs to may be viewed."""
+        # TODO: Here should be a check for the source model's visibility
+        # For now, we only check pages
+        if isinstance(source, PageContent):
+            # If the object is a PageContent, check the page view permission
+            if not user_can_view_page(request.user, source.page):
+                raise NotFound()
 
         self.check_object_permissions(request, placeholder)
 
+    def plugin_tree_requested(self) -> bool:
+        """Return whether only part of the plugin tree is requested, which bypasses the placeholder cache."""
+        return any(param in self.request.query_params for param in ("depth", "cursor", "parent"))
+
+    def get_depth(self) -> int | None:
+        """Return the nesting depth requested with the `depth` query parameter."""
+        depth = self.request.query_params.get("depth")
+        if depth is None:
+            return None
+        if not depth.isdigit() or int(depth) < 1:
+            raise ValidationError({"depth": "Must be a positive integer."})
+        return int(depth)
+
+    def get_parent_plugin(self, placeholder: Placeholder, language: str) -> CMSPlugin | None:
+        """Return the plugin whose children are requested with the `parent` query parameter."""
+        parent_id = self.request.query_params.get("parent")
+        if parent_id is None:
+            return None
+        if not parent_id.isdigit():
+            raise ValidationError({"parent": "Must be a plugin id."})
+        parent = CMSPlugin.objects.filter(placeholder=placeholder, language=language, pk=parent_id).first()
+        if parent is None:
+            raise NotFound()
+        return parent
+
+    def get_plugin_tree_data(self, request: Request, placeholder: Placeholder, language: str) -> dict[str, Any]:
+        """
+        Serialize the top-level plugins of the placeholder (or the children of the `parent` plugin),
+        a page of them if a cursor is given, with their children up to the requested depth.
+        """
+        from djangocms_rest.plugin_rendering import RESTRenderer
+
+        depth = self.get_depth()
+        parent = self.get_parent_plugin(placeholder, language)
+        queryset = CMSPlugin.objects.filter(placeholder=placeholder, language=language, parent=parent)
+        paginator = self.cursor_pagination_class() if "cursor" in request.query_params else None
+        if paginator:
+            plugins = paginator.paginate_queryset(queryset, request, view=self)
+        else:
+            plugins = list(queryset.order_by("position"))
+
+        serializer = self.serializer_class(
+            instance=placeholder, request=request, language=language, render_plugins=False
+        )
+        placeholder.content = []
+        if plugins:
+            tree = self.get_plugin_subtrees(request, placeholder, language, plugins, parent)
+            renderer = RESTRenderer(request)
+            placeholder.content = renderer.serialize_plugins(
+                placeholder,
+                language,
+                context=Context({"request": request}),
+                plugins=tree,
+                depth=depth,
+                use_cache=not self._preview_requested() and renderer.placeholder_cache_is_enabled(),
+            )
+        data = serializer.data
+        if paginator:
+            data["next"] = paginator.get_next_link()
+            data["previous"] = paginator.get_previous_link()
+        return data
+
+    def get_plugin_subtrees(
+        self,
+        request: Request,
+        placeholder: Placeholder,
+        language: str,
+        plugins: list[CMSPlugin],
+        parent: CMSPlugin | None,
+    ) -> list[CMSPlugin]:
+        """
+        Load the given sibling plugins with all their descendants. Descendants directly follow
+        their ancestor in position order, so all are fetched with one position range query
+        ending at the next plugin outside of the subtrees.
+        """
+        ancestor_ids = []
+        while parent is not None:
+            ancestor_ids.append(parent.pk)
+            parent = parent.parent
+        plugin_range = CMSPlugin.objects.filter(placeholder=placeholder, language=language)
+        end = (
+            plugin_range.filter(position__gt=plugins[-1].position)
+            .filter(Q(parent__isnull=True) | Q(parent_id__in=ancestor_ids))
+            .order_by("position")
+            .values_list("position", flat=True)
+            .first()
+        )
+        plugin_range = plugin_range.filter(position__gte=plugins[0].position)
+        if end is not None:
+            plugin_range = plugin_range.filter(position__lt=end)
+
+        instances = list(downcast_plugins(list(plugin_range.order_by("position")), [placeholder], request=request))
+        get_plugins_as_layered_tree(instances)
+        instances_by_id = {instance.pk: instance for instance in instances}
+        return [instances_by_id[plugin.pk] for plugin in plugins if plugin.pk in instances_by_id]
+
+
+class StaticAliasDetailView(BaseAPIView):
+    permission_classes = [IsAllowedPublicLanguage]
+    serializer_class = PlaceholderSerializer
+
+    @extend_static_alias_schema
+    def get(self, request: Request, language: str, static_code: str) -> Response:
+        """Retrieve the content of a static alias of djangocms-alias by its static code, with the
+        same attributes as a placeholder. An alias of the current site takes precedence over
+        one shared by all sites.
+
+        Responses are cached until the alias changes and carry an ETag: send it back in an
+        `If-None-Match` header to get a `304 Not Modified` response while the alias is unchanged."""
+        from djangocms_rest.renderers import RawJSON, get_json_renderer_class
+        from djangocms_rest.static_aliases import (
+            get_static_alias_cache_duration,
+            get_static_alias_rest_cache,
+            set_static_alias_rest_cache,
+        )
+
+        html = bool(request.GET.get("html", False))
+        use_cache = not self._preview_requested() and get_static_alias_cache_duration() > 0
+        if not use_cache:
+            return Response(self.get_static_alias_data(request, language, static_code))
+
+        entry = get_static_alias_rest_cache(static_code, language, self.site.pk, request, html=html)
+        if entry is None:
+            placeholder = self.get_static_alias_placeholder(language, static_code)
+            data = self.get_static_alias_data(request, language, static_code, placeholder)
+            content = get_json_renderer_class()().render(data)
+            entry = set_static_alias_rest_cache(
+                static_code, language, self.site.pk, request, content, placeholder, html=html
+            )
+
+        headers = {"ETag": entry["etag"]}
+        if entry["etag"] in parse_etags(request.headers.get("If-None-Match", "")):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        if getattr(request._request, "_rest_raw_json", False):
+            # The cached response is embedded by the renderer as is
+            return Response(RawJSON(entry["content"]), headers=headers)
+        return Response(json.loads(entry["content"]), headers=headers)
+
+    def get_static_alias_placeholder(self, language: str, static_code: str) -> Placeholder:
+        """Returns the placeholder of the static alias in the given language."""
+        from djangocms_rest.static_aliases import get_static_alias
+
+        alias = get_static_alias(self.site, static_code)
+        placeholder = alias.get_placeholder(language, show_draft_content=self._preview_requested()) if alias else None
+        if placeholder is None:
+            raise NotFound()
+        return placeholder
+
+    def get_static_alias_data(
+        self, request: Request, language: str, static_code: str, placeholder: Placeholder | None = None
+    ) -> dict[str, Any]:
+        """Serialize the placeholder of the static alias in the given language."""
+        if placeholder is None:
+            placeholder = self.get_static_alias_placeholder(language, static_code)
         serializer = self.serializer_class(instance=placeholder, request=request, language=language, read_only=True)
-        return Response(serializer.data)
+        return {"static_code": static_code, **serializer.data}
 
 
 class PluginDefinitionView(BaseAPIView):
@@ -227,7 +593,7 @@ class PluginDefinitionView(BaseAPIView):
                 "type": definition["type"],
                 "properties": definition["properties"],
             }
-            for plugin_type, definition in PLUGIN_DEFINITIONS.items()
+            for plugin_type, definition in get_plugin_definitions().items()
         ]
         return Response(definitions)
 
@@ -250,9 +616,19 @@ class MenuView(BaseAPIView):
     ) -> Response:
         """Get the menu structure for a specific language and path."""
         self.populate_defaults(kwargs)
+        return Response(self.get_menu_data(request, language, path, **kwargs))
+
+    def get_menu_data(
+        self,
+        request: Request,
+        language: str,
+        path: str,
+        **kwargs: dict[str, Any],
+    ) -> list[dict[str, Any]]:
+        """Get the serialized menu structure for a specific language and path."""
         menu = self.get_menu_structure(request, language, path, **kwargs)
         serializer = self.serializer_class(menu, many=True, context={"request": request})
-        return Response(serializer.data)
+        return serializer.data
 
     def populate_defaults(self, kwargs: dict[str, Any]) -> None:
         """Set default values for menu view parameters."""
@@ -274,41 +650,48 @@ class MenuView(BaseAPIView):
         """Get the menu structure for a specific language and path."""
         # Implement the logic to retrieve the menu structure
 
-        # Create tag instance without calling __init__
-        tag_instance = self.tag.__new__(self.tag)
+        page = get_object(self.site, path)
+        self.check_object_permissions(request, page)
+        menu_renderer = self.get_menu_renderer(request, page, language, path)
+        result = self.render_menu(request, menu_renderer, **kwargs)
+        if not result and kwargs.get("root_id"):
+            # Edge case: No menu nodes found but a root_id was specified.
+            # This might be due to a non-existing root_id.
+            nodes = menu_renderer.get_nodes(kwargs.get("namespace"), kwargs["root_id"])
+            id_nodes = menu_pool.get_nodes_by_attribute(nodes, "reverse_id", kwargs["root_id"])
+            if not id_nodes:
+                raise NotFound()
 
-        # Initialize minimal necessary attributes
-        tag_instance.kwargs = {}
-        tag_instance.blocks = {}
+        return result
 
+    def get_menu_renderer(self, request: Request, page: Page, language: str, path: str):
+        """Set up the request for the menu of the page and return a menu renderer for it."""
         if path == "":
-            api_endpoint = reverse("page-root", kwargs={"language": language})
+            request.api_endpoint = page_root_url.reverse({"language": language})
         else:
-            api_endpoint = reverse("page-detail", kwargs={"language": language, "path": path})
-
-        request.api_endpoint = api_endpoint
+            request.api_endpoint = page_detail_url.reverse({"language": language, "path": path})
         request.LANGUAGE_CODE = language
-        request.current_page = get_object(self.site, path)  # Used to identify the current page in menus
-        self.check_object_permissions(request, request.current_page)
+        request.current_page = page  # Used to identify the current page in menus
         menu_renderer = menu_pool.get_renderer(request)
         menu_renderer.site = self.site
-        context = {"request": request, "cms_menu_renderer": menu_renderer}
+        return menu_renderer
+
+    def render_menu(self, request: Request, menu_renderer, **kwargs: dict[str, Any]) -> list:
+        """Return the menu nodes the view's menu tag selects."""
+        # Create tag instance without calling __init__
+        tag_instance = self.tag.__new__(self.tag)
+
+        # Initialize minimal necessary attributes
+        tag_instance.kwargs = {}
+        tag_instance.blocks = {}
 
+        context = {"request": request, "cms_menu_renderer": menu_renderer}
         context = tag_instance.get_context(
             context=context,
             **kwargs,
             template=None,
         )
-        result = context.get(self.return_key, [])
-        if not result and kwargs.get("root_id"):
-            # Edge case: No menu nodes found but a root_id was specified.
-            # This might be due to a non-existing root_id.
-            nodes = menu_renderer.get_nodes(kwargs.get("namespace"), kwargs["root_id"])
-            id_nodes = menu_pool.get_nodes_by_attribute(nodes, "reverse_id", kwargs["root_id"])
-            if not id_nodes:
-                raise NotFound()
-
-        return result
+        return context.get(self.return_key, [])
 
 
 class SubMenuView(MenuView):
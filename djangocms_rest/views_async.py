@@ -0,0 +1,182 @@
+"""
+Async variants of the read endpoints for deployments on an ASGI server.
+
+The views look up objects with the async ORM and read the REST placeholder cache with the
+cache's async API. Code that is only available synchronously (permission checks, menus, and
+the serialization of content that is not cached) runs in a worker thread. Placeholder
+content served from the cache is serialized without leaving the event loop.
+
+The views require `adrf <https://github.com/em1208/adrf>`_ (``pip install djangocms-rest[async]``).
+Include ``djangocms_rest.urls_async`` instead of ``djangocms_rest.urls`` to use them.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from asgiref.sync import sync_to_async
+from django.contrib.sites.shortcuts import get_current_site
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import prefetch_related_objects
+
+from cms.models import Page, PageContent, Placeholder
+
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from djangocms_rest import views
+from djangocms_rest.schemas import extend_placeholder_schema
+from djangocms_rest.serializers.utils.cache import aprefetch_placeholder_rest_cache, is_placeholder_rest_cache_stale
+from djangocms_rest.utils import aget_object, prefetch_page_contents
+
+try:
+    from adrf.views import APIView as AsyncAPIView
+except ImportError as e:  # pragma: no cover
+    raise ImproperlyConfigured(
+        "The async views of djangocms-rest require adrf. Install it with `pip install djangocms-rest[async]`."
+    ) from e
+
+
+class AsyncPageDetailView(views.PageDetailView, AsyncAPIView):
+    async def get(self, request: Request, language: str, path: str = "") -> Response:
+        """Retrieve a page instance. The page instance includes the placeholders and
+        their links to retrieve dynamic content."""
+        context = self.get_serializer_context()
+        includes = self.get_includes()
+        translation_languages = self.get_translation_languages(language)
+        page = await aget_object(self.site, path)
+        if translation_languages:
+            await sync_to_async(prefetch_page_contents)([page])
+        page_content = await sync_to_async(self.get_page_content)(request, page, language)
+        serializer = self.serializer_class(page_content, read_only=True, context=context)
+        if await self.aprefetch_placeholders(request, page_content, context):
+            # All placeholders are cached: serializing does not need the database
+            data = serializer.data
+        else:
+            data = await sync_to_async(lambda: serializer.data)()
+        if includes:
+            # Menus are built by django CMS' synchronous menu pool
+            data.update(await sync_to_async(self.get_included_data)(request, includes, page, language, path))
+        if translation_languages:
+            data["translations"] = await sync_to_async(self.get_translations)(request, page, translation_languages)
+        return Response(data)
+
+    def get_page_content(self, request: Request, page: Page, language: str) -> PageContent:
+        page_content = super().get_page_content(request, page, language)
+        # Load what serializing the page content reads from the database while still in the
+        # worker thread. Each of these is memoized on the page content or page.
+        page_content.page.get_languages()
+        page_content.get_template()
+        prefetch_related_objects([page_content], "placeholders")
+        for placeholder in page_content.placeholders.all():
+            placeholder.source = page_content
+        return page_content
+
+    async def aprefetch_placeholders(self, request: Request, page_content: PageContent, context: dict) -> bool:
+        """
+        Reads the cached content of the page content's placeholders at once; the serializer
+        picks it up. Returns ``True`` if all placeholders to serialize are cached and fresh.
+        """
+        if self._preview_requested():
+            return False
+        if context["placeholders"] != "full":
+            # Placeholder links are built without the database
+            return True
+        slots = context.get("slots")
+        placeholders = [
+            placeholder
+            for placeholder in page_content.placeholders.all()
+            if slots is None or placeholder.slot in slots
+        ]
+        hits = await aprefetch_placeholder_rest_cache(
+            placeholders, page_content.language, get_current_site(request).pk, request
+        )
+        return not request.GET.get("html", False) and all(
+            placeholder.pk in hits and not is_placeholder_rest_cache_stale(hits[placeholder.pk])
+            for placeholder in placeholders
+        )
+
+
+class AsyncPlaceholderDetailView(views.PlaceholderDetailView, AsyncAPIView):
+    @extend_placeholder_schema
+    async def get(
+        self,
+        request: Request,
+        language: str,
+        content_type_id: int,
+        object_id: int,
+        slot: str,
+    ) -> Response:
+        """Placeholder contain the dynamic content. This view retrieves the content as a
+        structured nested object.
+
+        Attributes:
+        - "slot": The slot name of the placeholder.
+        - "content": The content of the placeholder as a nested JSON tree
+        - "language": The language of the content
+        - "label": The verbose label of the placeholder
+
+        Optional (if the get parameter `?html=1` is added to the API url):
+        - "html": The content rendered as html. Sekizai blocks such as "js" or "css" will be added
+          as separate attributes"""
+        try:
+            placeholder = await Placeholder.objects.select_related("content_type").aget(
+                content_type_id=content_type_id, object_id=object_id, slot=slot
+            )
+        except Placeholder.DoesNotExist:
+            raise NotFound()
+
+        source_model = placeholder.content_type.model_class()
+        content_manager = "admin_manager" if self._preview_requested() else "content"
+        manager = getattr(source_model, content_manager, source_model.objects)
+        source = await manager.filter(pk=placeholder.object_id).afirst()
+        if source is None:
+            raise NotFound()
+        await sync_to_async(self.check_source)(request, placeholder, source)
+
+        if self.plugin_tree_requested():
+            return Response(await sync_to_async(self.get_plugin_tree_data)(request, placeholder, language))
+        serializer = self.serializer_class(instance=placeholder, request=request, language=language, read_only=True)
+        if not self._preview_requested() and not request.GET.get("html", False):
+            hits = await aprefetch_placeholder_rest_cache(
+                [placeholder], language, get_current_site(request).pk, request
+            )
+            cached_value = hits.get(placeholder.pk)
+            if cached_value is not None and not is_placeholder_rest_cache_stale(cached_value):
+                # Cache hit: serializing does not need the database
+                return Response(serializer.data)
+        return Response(await sync_to_async(lambda: serializer.data)())
+
+    def check_source(self, request: Request, placeholder: Placeholder, source) -> None:
+        super().check_source(request, placeholder, source)
+        # Resolve the placeholder's source and label (which may depend on the source's
+        # template) here, where database access is possible
+        placeholder.source = source
+        placeholder.get_label()
+
+
+class AsyncMenuViewMixin:
+    async def get(
+        self,
+        request: Request,
+        language: str,
+        path: str = "",  # for menu-root endpoint
+        **kwargs: dict[str, Any],
+    ) -> Response:
+        """Get the menu structure for a specific language and path."""
+        self.populate_defaults(kwargs)
+        # Menus are built by django CMS' synchronous menu pool
+        return Response(await sync_to_async(self.get_menu_data)(request, language, path, **kwargs))
+
+
+class AsyncMenuView(AsyncMenuViewMixin, views.MenuView, AsyncAPIView):
+    pass
+
+
+class AsyncSubMenuView(AsyncMenuViewMixin, views.SubMenuView, AsyncAPIView):
+    pass
+
+
+class AsyncBreadcrumbView(AsyncMenuViewMixin, views.BreadcrumbView, AsyncAPIView):
+    pass
@@ -1,18 +1,25 @@
 from typing import ParamSpec, TypeVar
 
+from django.apps import apps
 from django.contrib.sites.shortcuts import get_current_site
 from django.utils.functional import cached_property
 
 from cms.toolbar.toolbar import CMSToolbar
 
+from rest_framework import renderers
 from rest_framework.generics import ListAPIView
 from rest_framework.permissions import IsAdminUser
 from rest_framework.views import APIView
 
+from djangocms_rest.renderers import get_json_renderer_class
+
 P = ParamSpec("P")
 T = TypeVar("T")
 
 try:
+    if not apps.is_installed("drf_spectacular"):
+        # Not generating schemas: spare loading drf-spectacular's schema machinery
+        raise ImportError("drf_spectacular is not in INSTALLED_APPS")
     from drf_spectacular.types import OpenApiTypes
     from drf_spectacular.utils import OpenApiParameter, extend_schema
 
@@ -51,6 +58,35 @@ except ImportError:  # pragma: no cover
         return obj
 
 
+class PostResponseCallbacks:
+    """
+    Work deferred until after a response has been sent, e.g., refreshing stale cache entries.
+    Attached to a response, the callbacks run when the server closes the response, before
+    Django's ``request_finished`` signal closes the database connections.
+    """
+
+    def __init__(self, callbacks):
+        self.callbacks = list(callbacks)
+
+    def attach(self, response):
+        response._rest_post_response_callbacks = self
+        close_response = response.close
+
+        def close():
+            try:
+                self.close()
+            finally:
+                close_response()
+
+        response.close = close
+
+    def close(self):
+        """Runs the callbacks (once)."""
+        callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            callback()
+
+
 @preview_schema
 class BaseAPIMixin:
     """
@@ -59,6 +95,15 @@ class BaseAPIMixin:
 
     http_method_names = ("get", "options")
 
+    def get_renderers(self):
+        # Use the configured, fragment-aware JSON renderer in place of DRF's JSON renderer.
+        # Resolved per request so that changes of the REST_JSON_RENDERER setting take effect.
+        json_renderer_class = get_json_renderer_class()
+        return [
+            json_renderer_class() if renderer is renderers.JSONRenderer else renderer()
+            for renderer in self.renderer_classes
+        ]
+
     @cached_property
     def site(self):
         """
@@ -95,6 +140,22 @@ class BaseAPIMixin:
             permissions.insert(0, IsAdminUser())
         return permissions
 
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        # Allow serializers to hand over pre-encoded JSON (e.g., cached placeholder content)
+        # if the negotiated renderer can embed it
+        request._request._rest_raw_json = getattr(request.accepted_renderer, "supports_raw_json", False)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        # Work deferred until after the response has been sent, e.g., refreshing stale
+        # cache entries, runs when the server closes the response
+        callbacks = getattr(request._request, "_rest_post_response_callbacks", None)
+        if callbacks:
+            PostResponseCallbacks(callbacks).attach(response)
+            del request._request._rest_post_response_callbacks
+        return response
+
 
 class BaseAPIView(BaseAPIMixin, APIView):
     """
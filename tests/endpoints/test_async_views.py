@@ -0,0 +1,134 @@
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from cms.api import add_plugin
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.test import override_settings
+from rest_framework.reverse import reverse
+
+from djangocms_rest.serializers.utils.cache import local_placeholder_cache
+from djangocms_rest.views_async import AsyncPageDetailView, AsyncPlaceholderDetailView
+from tests.base import BaseCMSRestTestCase
+
+
+@override_settings(ROOT_URLCONF="tests.urls_async")
+class AsyncViewsTestCase(BaseCMSRestTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.page = cls.pages[0]
+        cls.page_content = cls.page.get_content_obj("en")
+        cls.placeholder = cls.page.get_placeholders(language="en").get(slot="content")
+        add_plugin(
+            placeholder=cls.placeholder,
+            plugin_type="TextPlugin",
+            language="en",
+            body="<p>Test content</p>",
+        )
+        cls.placeholder_url = reverse(
+            "placeholder-detail",
+            kwargs={
+                "language": "en",
+                "content_type_id": ContentType.objects.get_for_model(cls.page_content).pk,
+                "object_id": cls.page_content.pk,
+                "slot": "content",
+            },
+            urlconf="tests.urls_async",
+        )
+
+    def setUp(self):
+        cache.clear()
+        local_placeholder_cache.clear()
+
+    def test_async_urlconf(self):
+        """
+        The async URL configuration routes detail, placeholder and menu endpoints to async views.
+        """
+        match = self.client.get(reverse("page-detail", kwargs={"language": "en", "path": "page-1"}))
+        self.assertTrue(issubclass(match.resolver_match.func.view_class, AsyncPageDetailView))
+        match = self.client.get(self.placeholder_url)
+        self.assertTrue(issubclass(match.resolver_match.func.view_class, AsyncPlaceholderDetailView))
+
+    async def test_page_detail(self):
+        """
+        The async page detail view returns the same data as the sync view.
+        """
+        url = reverse("page-root", kwargs={"language": "en"})
+        response = await self.async_client.get(url)
+        self.assertEqual(response.status_code, 200)
+        with override_settings(ROOT_URLCONF="tests.urls"):
+            expected = (await self.async_client.get(url)).json()
+        self.assertEqual(response.json(), expected)
+
+        response = await self.async_client.get(reverse("page-detail", kwargs={"language": "en", "path": "nope"}))
+        self.assertEqual(response.status_code, 404)
+
+        response = await self.async_client.get(url + "?include=breadcrumbs")
+        self.assertEqual([node["title"] for node in response.json()["breadcrumbs"]], ["page 0"])
+
+    async def test_placeholder_cache_hit(self):
+        """
+        Cached placeholder content is read with the async cache API and served without
+        re-serializing the placeholder.
+        """
+        response = await self.async_client.get(self.placeholder_url)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(len(data["content"]), 1)
+
+        with (
+            mock.patch("djangocms_rest.plugin_rendering.RESTRenderer.serialize_plugins") as serialize_plugins,
+            mock.patch("djangocms_rest.serializers.utils.cache._get_placeholder_cache_key") as get_key,
+            mock.patch("djangocms_rest.views_async.sync_to_async", wraps=sync_to_async) as to_thread,
+        ):
+            response = await self.async_client.get(self.placeholder_url)
+        serialize_plugins.assert_not_called()
+        get_key.assert_not_called()
+        # Only the permission checks run in a thread
+        self.assertEqual([call.args[0].__name__ for call in to_thread.call_args_list], ["check_source"])
+        self.assertEqual(response.json(), data)
+
+    async def test_page_detail_cache_hit(self):
+        """Pages whose placeholders are all cached are serialized without a thread hop."""
+        url = reverse("page-root", kwargs={"language": "en"})
+        data = (await self.async_client.get(url)).json()
+
+        with (
+            mock.patch("djangocms_rest.plugin_rendering.RESTRenderer.serialize_plugins") as serialize_plugins,
+            mock.patch("djangocms_rest.views_async.sync_to_async", wraps=sync_to_async) as to_thread,
+        ):
+            response = await self.async_client.get(url)
+        serialize_plugins.assert_not_called()
+        # Only the page content is looked up in a thread
+        self.assertEqual([call.args[0].__name__ for call in to_thread.call_args_list], ["get_page_content"])
+        self.assertEqual(response.json(), data)
+
+        for mode in ("links", "none"):
+            response = await self.async_client.get(f"{url}?placeholders={mode}")
+            with override_settings(ROOT_URLCONF="tests.urls"):
+                expected = (await self.async_client.get(f"{url}?placeholders={mode}")).json()
+            self.assertEqual(response.json(), expected, mode)
+
+    async def test_placeholder_not_found(self):
+        url = reverse(
+            "placeholder-detail",
+            kwargs={"language": "en", "content_type_id": 1, "object_id": 99999, "slot": "content"},
+        )
+        response = await self.async_client.get(url)
+        self.assertEqual(response.status_code, 404)
+
+    async def test_menu(self):
+        """
+        The async menu views return the same data as the sync views.
+        """
+        for url in (
+            reverse("menu", kwargs={"language": "en"}),
+            reverse("submenu", kwargs={"language": "en"}),
+            reverse("breadcrumbs-path", kwargs={"language": "en", "path": "page-1"}),
+        ):
+            response = await self.async_client.get(url)
+            self.assertEqual(response.status_code, 200, url)
+            with override_settings(ROOT_URLCONF="tests.urls"):
+                expected = (await self.async_client.get(url)).json()
+            self.assertEqual(response.json(), expected, url)
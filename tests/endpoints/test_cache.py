@@ -1,13 +1,29 @@
+import json
+from unittest import mock
+
 from cms.api import add_plugin
 from cms.models import PageContent
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.sites.shortcuts import get_current_site
 from django.core.cache import cache
-
+from django.test import override_settings
 
 from rest_framework.reverse import reverse
 
-from djangocms_rest.serializers.utils.cache import get_placeholder_rest_cache
+from cms.cache.placeholder import (
+    _get_placeholder_cache_version_key,
+    clear_placeholder_cache,
+)
+
+from djangocms_rest.plugin_rendering import serialize_cms_plugin
+from djangocms_rest.serializers.utils.cache import (
+    _get_current_placeholder_rest_cache_key,
+    LocalPlaceholderCache,
+    decode_placeholder_content,
+    encode_placeholder_content,
+    get_placeholder_rest_cache,
+    local_placeholder_cache,
+)
 from tests.base import BaseCMSRestTestCase
 
 
@@ -35,6 +51,7 @@ class CachingAPITestCase(BaseCMSRestTestCase):
     def setUp(self):
         """Clear the cache before each test"""
         cache.clear()
+        local_placeholder_cache.clear()
 
     def get_placeholder_url(self):
         """Helper to generate the placeholder URL"""
@@ -197,3 +214,242 @@ class CachingAPITestCase(BaseCMSRestTestCase):
         )
         self.assertEqual(version4, 12345)
         self.assertEqual(vary_list4, [])
+
+    @override_settings(REST_PLACEHOLDER_CACHE_STALE_TTL=60)
+    def test_stale_while_revalidate(self):
+        """
+        Test the stale-while-revalidate mode:
+        1. The first request populates the cache with a soft expiry
+        2. Once the soft expiry has passed, the stale content is served
+        3. The entry is refreshed after the stale response and the next request sees fresh content
+        """
+        site_id = get_current_site(None).pk
+        original_content = self.plugin.body
+
+        # Request #1 - populate cache
+        response1 = self.client.get(self.get_placeholder_url())
+        self.assertEqual(response1.status_code, 200)
+        cached_content = get_placeholder_rest_cache(self.placeholder, lang="en", site_id=site_id, request=None)
+        self.assertIn("expires", cached_content)
+
+        # Let the entry pass its soft expiry and change the content
+        key = _get_current_placeholder_rest_cache_key(self.placeholder, "en", site_id, None)
+        cache.set(key, {**cache.get(key), "expires": 0})
+        self.plugin.body = "<p>Refreshed content</p>"
+        self.plugin.save()
+
+        # Request #2 - stale content is served immediately
+        response2 = self.client.get(self.get_placeholder_url())
+        self.assertEqual(response2.status_code, 200)
+        self.assertEqual(response1.json()["content"], response2.json()["content"])
+
+        # Request #3 - the entry has been refreshed after request #2
+        response3 = self.client.get(self.get_placeholder_url())
+        self.assertEqual(response3.status_code, 200)
+        self.assertIn("Refreshed content", response3.json()["content"][0]["body"])
+        cached_content = get_placeholder_rest_cache(self.placeholder, lang="en", site_id=site_id, request=None)
+        self.assertGreater(cached_content["expires"], 0)
+
+        # Restore content
+        self.plugin.body = original_content
+        self.plugin.save()
+
+    @override_settings(REST_PLACEHOLDER_CACHE_STALE_TTL=60)
+    def test_stale_entry_outlives_cms_cache_version(self):
+        """
+        Stale entries remain reachable after django CMS's placeholder cache version has expired,
+        without django CMS's version being kept for longer.
+        """
+        site_id = get_current_site(None).pk
+        original_content = self.plugin.body
+        version_key = _get_placeholder_cache_version_key(self.placeholder, "en", site_id)
+
+        response1 = self.client.get(self.get_placeholder_url())
+        key = _get_current_placeholder_rest_cache_key(self.placeholder, "en", site_id, None)
+        cache.set(key, {**cache.get(key), "expires": 0})
+        # django CMS's version expires with its content
+        cache.delete(version_key)
+        self.plugin.body = "<p>Refreshed content</p>"
+        self.plugin.save()
+
+        # The stale entry is served and refreshed after the response
+        response2 = self.client.get(self.get_placeholder_url())
+        self.assertEqual(response1.json()["content"], response2.json()["content"])
+        response3 = self.client.get(self.get_placeholder_url())
+        self.assertIn("Refreshed content", response3.json()["content"][0]["body"])
+
+        # Invalidation is respected even while the stale version is kept
+        self.plugin.body = "<p>Invalidated content</p>"
+        self.plugin.save()
+        clear_placeholder_cache(self.placeholder, "en", site_id)
+        response4 = self.client.get(self.get_placeholder_url())
+        self.assertIn("Invalidated content", response4.json()["content"][0]["body"])
+
+        self.plugin.body = original_content
+        self.plugin.save()
+
+    @override_settings(REST_PLACEHOLDER_LOCAL_CACHE_SIZE=10)
+    def test_local_cache(self):
+        """
+        Test the in-process cache in front of the shared cache:
+        1. Content is served from the process even if the shared entry is gone
+        2. Invalidating the placeholder cache version is respected
+        """
+        site_id = get_current_site(None).pk
+        original_content = self.plugin.body
+
+        # Request #1 - populate both caches
+        response1 = self.client.get(self.get_placeholder_url())
+        self.assertEqual(response1.status_code, 200)
+        self.assertEqual(len(local_placeholder_cache), 1)
+
+        # Remove the shared entry and change the content
+        key = _get_current_placeholder_rest_cache_key(self.placeholder, "en", site_id, None)
+        cache.delete(key)
+        self.plugin.body = "<p>Invalidated content</p>"
+        self.plugin.save()
+
+        # Request #2 - served from the in-process cache
+        response2 = self.client.get(self.get_placeholder_url())
+        self.assertEqual(response1.json(), response2.json())
+
+        # Request #3 - invalidation moves the cache version on
+        clear_placeholder_cache(self.placeholder, "en", site_id)
+        response3 = self.client.get(self.get_placeholder_url())
+        self.assertIn("Invalidated content", response3.json()["content"][0]["body"])
+
+        # Restore content
+        self.plugin.body = original_content
+        self.plugin.save()
+
+    @override_settings(REST_PLACEHOLDER_LOCAL_CACHE_SIZE=10, REST_PLACEHOLDER_CACHE_STALE_TTL=60)
+    def test_stale_local_copy_rechecks_shared_cache(self):
+        """A stale in-process copy is replaced by a shared entry another process has refreshed."""
+        site_id = get_current_site(None).pk
+        self.client.get(self.get_placeholder_url())
+        key = _get_current_placeholder_rest_cache_key(self.placeholder, "en", site_id, None)
+        entry = cache.get(key)
+        local_placeholder_cache.set(key, {**entry, "expires": 0}, deadline=float("inf"), max_size=10)
+        # Another process refreshed the shared entry
+        content = decode_placeholder_content(entry)
+        content[0]["body"] = "<p>Refreshed elsewhere</p>"
+        cache_format, content = encode_placeholder_content(content)
+        cache.set(key, {**entry, "format": cache_format, "content": content})
+
+        with mock.patch("djangocms_rest.plugin_rendering.schedule_placeholder_refresh") as schedule:
+            response = self.client.get(self.get_placeholder_url())
+        self.assertEqual(response.json()["content"][0]["body"], "<p>Refreshed elsewhere</p>")
+        schedule.assert_not_called()
+        self.assertGreater(local_placeholder_cache.get(key)["expires"], 0)
+
+    def test_local_cache_is_bounded(self):
+        """The in-process cache evicts the least recently used entries and expired entries."""
+        local_cache = LocalPlaceholderCache()
+        local_cache.set("a", {"content": []}, deadline=float("inf"), max_size=2)
+        local_cache.set("b", {"content": []}, deadline=float("inf"), max_size=2)
+        local_cache.get("a")
+        local_cache.set("c", {"content": []}, deadline=float("inf"), max_size=2)
+
+        self.assertIsNotNone(local_cache.get("a"))
+        self.assertIsNone(local_cache.get("b"))
+        self.assertIsNotNone(local_cache.get("c"))
+
+        local_cache.set("d", {"content": []}, deadline=0, max_size=2)
+        self.assertIsNone(local_cache.get("d"))
+
+    def test_cache_formats(self):
+        """
+        Test the storage formats of cached placeholder content:
+        1. Content is stored as JSON bytes (default), compressed JSON or Python objects
+        2. All formats return the same response
+        3. Raw access returns JSON bytes
+        """
+        site_id = get_current_site(None).pk
+
+        responses = {}
+        for cache_format, content_type in (("json", bytes), ("zlib", bytes), ("python", list)):
+            with self.subTest(cache_format=cache_format), override_settings(
+                REST_PLACEHOLDER_CACHE_FORMAT=cache_format
+            ):
+                cache.clear()
+                self.client.get(self.get_placeholder_url())  # Populate cache
+                key = _get_current_placeholder_rest_cache_key(self.placeholder, "en", site_id, None)
+                self.assertEqual(cache.get(key)["format"], cache_format)
+                self.assertIsInstance(cache.get(key)["content"], content_type)
+
+                responses[cache_format] = self.client.get(self.get_placeholder_url()).json()  # Cache hit
+
+                cached_content = get_placeholder_rest_cache(self.placeholder, lang="en", site_id=site_id, request=None)
+                self.assertEqual(cached_content["content"], responses[cache_format]["content"])
+
+        self.assertEqual(responses["json"], responses["python"])
+        self.assertEqual(responses["zlib"], responses["python"])
+
+        with override_settings(REST_PLACEHOLDER_CACHE_FORMAT="zlib"):
+            cache.clear()
+            self.client.get(self.get_placeholder_url())
+            raw_content = get_placeholder_rest_cache(
+                self.placeholder, lang="en", site_id=site_id, request=None, raw=True
+            )["content"]
+        self.assertIsInstance(raw_content, bytes)
+        self.assertEqual(json.loads(raw_content), responses["json"]["content"])
+
+    @override_settings(REST_PLACEHOLDER_CACHE_FORMAT="zlib", REST_PLACEHOLDER_LOCAL_CACHE_SIZE=10)
+    def test_local_cache_stores_uncompressed_json(self):
+        """Compressed shared entries are kept uncompressed in the in-process cache."""
+        site_id = get_current_site(None).pk
+        response1 = self.client.get(self.get_placeholder_url())
+        key = _get_current_placeholder_rest_cache_key(self.placeholder, "en", site_id, None)
+        self.assertEqual(cache.get(key)["format"], "zlib")
+        self.assertEqual(local_placeholder_cache.get(key)["format"], "json")
+
+        with mock.patch("djangocms_rest.serializers.utils.cache.zlib.decompress") as decompress:
+            response2 = self.client.get(self.get_placeholder_url())
+        decompress.assert_not_called()
+        self.assertEqual(response1.json(), response2.json())
+
+    @override_settings(REST_PLUGIN_CACHE_DURATION=60)
+    def test_plugin_cache(self):
+        """Editing one plugin only re-serializes that plugin; its siblings come from the plugin cache."""
+        site_id = get_current_site(None).pk
+        other_plugin = add_plugin(
+            placeholder=self.placeholder,
+            plugin_type="TextPlugin",
+            language="en",
+            body="<p>Other content</p>",
+        )
+        with mock.patch(
+            "djangocms_rest.plugin_rendering.serialize_cms_plugin", wraps=serialize_cms_plugin
+        ) as serialize:
+            content = self.client.get(self.get_placeholder_url()).json()["content"]
+            self.assertEqual(serialize.call_count, 2)
+
+            other_plugin.body = "<p>Edited content</p>"
+            other_plugin.save()
+            clear_placeholder_cache(self.placeholder, "en", site_id)
+            serialize.reset_mock()
+            edited_content = self.client.get(self.get_placeholder_url()).json()["content"]
+
+        self.assertEqual([call.args[0].pk for call in serialize.call_args_list], [other_plugin.pk])
+        self.assertEqual(edited_content[0], content[0])
+        self.assertIn("Edited content", edited_content[1]["body"])
+        other_plugin.delete()
+
+    def test_html_cache(self):
+        """The HTML rendering with its sekizai blocks is cached with the placeholder's cache version."""
+        from cms.plugin_rendering import ContentRenderer
+
+        site_id = get_current_site(None).pk
+        url = self.get_placeholder_url() + "?html=1"
+        with mock.patch.object(
+            ContentRenderer, "render_placeholder", autospec=True, side_effect=ContentRenderer.render_placeholder
+        ) as render_placeholder:
+            html = self.client.get(url).json()["html"]
+            self.assertEqual(render_placeholder.call_count, 1)
+
+            self.assertEqual(self.client.get(url).json()["html"], html)
+            self.assertEqual(render_placeholder.call_count, 1)
+
+            clear_placeholder_cache(self.placeholder, "en", site_id)
+            self.client.get(url)
+            self.assertEqual(render_placeholder.call_count, 2)
@@ -1,5 +1,16 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from cms.api import add_plugin, create_page, create_page_content
+from django.core.cache import cache
+from django.db import connection, connections, transaction
+from django.test import RequestFactory, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.request import Request
 from rest_framework.reverse import reverse
 
+from djangocms_rest.serializers.pages import PageContentSerializer
+from djangocms_rest.utils import get_object
 from tests.base import BaseCMSRestTestCase
 from tests.types import PAGE_CONTENT_FIELD_TYPES
 from tests.utils import assert_field_types
@@ -59,3 +70,159 @@ class PageDetailAPITestCase(BaseCMSRestTestCase):
             reverse("page-detail", kwargs={"language": "en", "path": "page-0"})
         )
         self.assertEqual(response.status_code, 200)
+
+    def test_include_navigation(self):
+        path = "page-2/page-0"
+        url = reverse("page-detail", kwargs={"language": "en", "path": path})
+        response = self.client.get(url + "?include=menu,breadcrumbs,submenu")
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["path"], path)
+
+        for name, endpoint in (
+            (
+                "menu",
+                reverse(
+                    "menu-levels-path",
+                    kwargs={
+                        "language": "en",
+                        "from_level": 0,
+                        "to_level": 100,
+                        "extra_inactive": 0,
+                        "extra_active": 1000,
+                        "path": path,
+                    },
+                ),
+            ),
+            ("breadcrumbs", reverse("breadcrumbs-path", kwargs={"language": "en", "path": path})),
+            ("submenu", reverse("submenu-path", kwargs={"language": "en", "path": path})),
+        ):
+            with self.subTest(include=name):
+                self.assertEqual(data[name], self.client.get(endpoint).json())
+        self.assertEqual([node["title"] for node in data["breadcrumbs"]], ["page 0", "page 2", "page 0"])
+
+        # The page is resolved once
+        with mock.patch("djangocms_rest.views.get_object", wraps=get_object) as get_object_mock:
+            self.client.get(url + "?include=menu,breadcrumbs")
+        get_object_mock.assert_called_once()
+
+    def test_include_unknown(self):
+        url = reverse("page-detail", kwargs={"language": "en", "path": "page-0"})
+        response = self.client.get(url + "?include=menu,footer")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("footer", response.json()["include"])
+
+    def test_translations(self):
+        page = self.pages[0]
+        create_page_content("it", "pagina 0", page)
+        create_page_content("fr", "page 0 fr", page)
+        url = reverse("page-detail", kwargs={"language": "en", "path": page.get_path("en")})
+
+        with CaptureQueriesContext(connection) as baseline:
+            self.client.get(url)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url + "?languages=all")
+        self.assertEqual(response.status_code, 200)
+        translations = response.json()["translations"]
+        # French is not public
+        self.assertEqual(list(translations), ["en", "it"])
+        self.assertEqual(translations["it"]["title"], "pagina 0")
+        self.assertNotIn("placeholders", translations["it"])
+        # The contents of all languages are loaded at once
+        self.assertLessEqual(len(queries), len(baseline) + 2)
+
+        response = self.client.get(url + "?languages=it&translations=full")
+        translations = response.json()["translations"]
+        self.assertEqual(list(translations), ["it"])
+        self.assertIn("placeholders", translations["it"])
+
+        response = self.client.get(url + "?languages=it,fr")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("fr", response.json()["languages"])
+
+    def test_placeholder_modes(self):
+        page = self.pages[1]
+        placeholder = page.get_placeholders(language="en").get(slot="content")
+        add_plugin(placeholder=placeholder, plugin_type="TextPlugin", language="en", body="<p>Text</p>")
+        url = reverse("page-detail", kwargs={"language": "en", "path": page.get_path("en")})
+
+        response = self.client.get(url)
+        full = {placeholder["slot"]: placeholder for placeholder in response.json()["placeholders"]}
+        self.assertTrue(full["content"]["content"])
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url + "?placeholders=links")
+        self.assertEqual(response.status_code, 200)
+        links = response.json()["placeholders"]
+        self.assertEqual([placeholder["slot"] for placeholder in links], list(full))
+        self.assertEqual(
+            links[0], {key: full[links[0]["slot"]][key] for key in ("slot", "label", "language", "details")}
+        )
+        self.assertFalse([query for query in queries if "cms_cmsplugin" in query["sql"]])
+
+        response = self.client.get(url + "?placeholders=links&slots=content,unknown")
+        self.assertEqual([placeholder["slot"] for placeholder in response.json()["placeholders"]], ["content"])
+
+        response = self.client.get(url + "?slots=content")
+        self.assertEqual(response.json()["placeholders"], [full["content"]])
+
+        response = self.client.get(url + "?placeholders=none")
+        self.assertNotIn("placeholders", response.json())
+
+        response = self.client.get(url + "?placeholders=some")
+        self.assertEqual(response.status_code, 400)
+
+
+class ParallelPlaceholderSerializationTestCase(TransactionTestCase):
+    # Worker threads need committed data
+    slots = ["header", "content", "sidebar", "footer"]
+
+    def setUp(self):
+        with transaction.atomic():
+            page = create_page("parallel", template="multi_placeholder.html", language="en")
+            page.set_as_homepage()
+            for slot in self.slots:
+                placeholder = page.get_placeholders(language="en").get(slot=slot)
+                for i in range(3):
+                    add_plugin(placeholder, "TextPlugin", "en", body=f"<p>{slot} {i}</p>")
+        self.url = reverse("page-root", kwargs={"language": "en"})
+
+    def test_placeholders_serialized_in_parallel(self):
+        sequential = self.client.get(self.url).json()
+        cache.clear()  # Serialize placeholders from the database again
+
+        with (
+            override_settings(REST_PLACEHOLDER_SERIALIZATION_WORKERS=4),
+            mock.patch("djangocms_rest.serializers.pages.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as executor,
+        ):
+            parallel = self.client.get(self.url).json()
+
+        executor.assert_called_once_with(max_workers=4)
+        self.assertEqual([placeholder["slot"] for placeholder in parallel["placeholders"]], self.slots)
+        self.assertEqual(parallel, sequential)
+        self.assertEqual(parallel["placeholders"][2]["content"][1]["body"], "<p>sidebar 1</p>")
+
+    def test_worker_connections_closed_once_per_thread(self):
+        with (
+            override_settings(REST_PLACEHOLDER_SERIALIZATION_WORKERS=2),
+            mock.patch.object(connections, "close_all", wraps=connections.close_all) as close_all,
+        ):
+            response = self.client.get(self.url)
+
+        self.assertEqual(len(response.json()["placeholders"]), len(self.slots))
+        # Two workers serialize four placeholders
+        self.assertEqual(close_all.call_count, 2)
+
+    def test_worker_threads_use_request_copies(self):
+        request = Request(RequestFactory().get(self.url))
+        request._request.toolbar = mock.Mock()
+        serializer = PageContentSerializer(context={"request": request})
+        serializer.prepare_request_for_threads()
+
+        thread_request = serializer.get_thread_request()
+        thread_request._rest_fk_cache = {}
+        self.assertIsNot(thread_request._request, request._request)
+        self.assertFalse(hasattr(request, "_rest_fk_cache"))
+        # Collected callbacks and file URLs are shared with the request
+        for name in ("_rest_post_response_callbacks", "_rest_file_urls"):
+            self.assertIs(getattr(thread_request._request, name), getattr(request._request, name))
@@ -1,5 +1,9 @@
+from cms.models import ACCESS_PAGE, PagePermission
 from django.contrib.sites.models import Site
-from djangocms_rest.utils import get_site_filtered_queryset
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from djangocms_rest.utils import PAGE_TREE_PATH_FIELD, get_site_filtered_queryset
 from rest_framework.reverse import reverse
 
 from tests.base import BaseCMSRestTestCase
@@ -111,3 +115,72 @@ class PageListAPITestCase(BaseCMSRestTestCase):
         self.assertIn("results", data)
         self.assertIsInstance(results, list)
         self.assertEqual(data["count"], 0)
+
+    def test_page_contents_loaded_in_bulk(self):
+        """
+        Page contents are loaded for all pages at once, for published and preview content.
+        """
+        url = reverse("page-list", kwargs={"language": "en"})
+        self.client.force_login(self.user)
+        for query in ("", "?preview=1"):
+            with self.subTest(query=query):
+                with CaptureQueriesContext(connection) as queries:
+                    response = self.client.get(url + query)
+                self.assertEqual(response.status_code, 200)
+                content_queries = [q for q in queries if 'FROM "cms_pagecontent"' in q["sql"]]
+                self.assertLessEqual(len(content_queries), 2)
+
+    def test_cursor_pagination(self):
+        """
+        With a `cursor` parameter, pages are returned in path order using keyset pagination:
+        following the `next` links returns every page exactly once, each fetched with LIMIT.
+        """
+        site = Site.objects.get_current()
+        expected_paths = [page.get_path("en") for page in get_site_filtered_queryset(site).order_by(PAGE_TREE_PATH_FIELD)]
+
+        url = reverse("page-list", kwargs={"language": "en"}) + "?cursor=&limit=3"
+        paths = []
+        while url:
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            data = response.json()
+            self.assertNotIn("count", data)
+            self.assertLessEqual(len(data["results"]), 3)
+            page_queries = [q["sql"] for q in queries if q["sql"].startswith('SELECT "cms_page"')]
+            # The visibility check loads the page ids, the results are fetched with LIMIT
+            page_queries = [sql for sql in page_queries if "LIMIT" in sql]
+            self.assertEqual(len(page_queries), 1)
+            self.assertIn("LIMIT 4", page_queries[0])
+            paths.extend(page["path"] for page in data["results"])
+            url = data["next"]
+
+        self.assertEqual(paths, expected_paths)
+
+    @override_settings(CMS_PERMISSION=True)
+    def test_cursor_pagination_skips_restricted_pages(self):
+        """Pages the user cannot see are filtered out before paginating, so no page of results is short."""
+        site = Site.objects.get_current()
+        pages = list(get_site_filtered_queryset(site).order_by(PAGE_TREE_PATH_FIELD))
+        restricted = pages[:3]
+        for page in restricted:
+            PagePermission.objects.create(page=page, user=self.user, can_view=True, grant_on=ACCESS_PAGE)
+        expected_paths = [page.get_path("en") for page in pages if page not in restricted]
+
+        url = reverse("page-list", kwargs={"language": "en"}) + "?cursor=&limit=3"
+        paths = []
+        while url:
+            data = self.client.get(url).json()
+            if data["next"]:
+                self.assertEqual(len(data["results"]), 3)
+            paths.extend(page["path"] for page in data["results"])
+            url = data["next"]
+
+        self.assertEqual(paths, expected_paths)
+
+    def test_page_search_cursor_pagination(self):
+        """Search results are ordered by rank and cannot be paginated with a cursor."""
+        url = reverse("page-search", kwargs={"language": "en"}) + "?q=1&cursor=&limit=3"
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("cursor", response.json())
@@ -229,3 +229,68 @@ class PlaceholdersAPITestCase(BaseCMSRestTestCase):
             rendered_plugin["page"],
             f"http://testserver{self.page.get_api_endpoint('en')}",
         )
+
+
+class PlaceholderPluginTreeTestCase(BaseCMSRestTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        page = create_page(title="Tree Page", template="INHERIT", language="en")
+        cls.page_content = PageContent.objects.get(page=page, language="en")
+        placeholder = page.get_placeholders(language="en").get(slot="content")
+        cls.parent = add_plugin(placeholder=placeholder, plugin_type="DummyParentPlugin", language="en")
+        child = add_plugin(placeholder=placeholder, target=cls.parent, plugin_type="DummyChildPlugin", language="en")
+        add_plugin(placeholder=placeholder, target=child, plugin_type="DummyChildPlugin", language="en")
+        parent = add_plugin(placeholder=placeholder, plugin_type="DummyParentPlugin", language="en")
+        add_plugin(placeholder=placeholder, target=parent, plugin_type="DummyChildPlugin", language="en")
+        add_plugin(placeholder=placeholder, plugin_type="TextPlugin", language="en", body="<p>Text</p>")
+        cls.url = reverse(
+            "placeholder-detail",
+            kwargs={
+                "language": "en",
+                "content_type_id": ContentType.objects.get_for_model(PageContent).id,
+                "object_id": cls.page_content.id,
+                "slot": "content",
+            },
+        )
+
+    def test_depth(self):
+        full = self.client.get(self.url).json()["content"]
+        self.assertEqual(len(full), 3)
+
+        response = self.client.get(self.url + "?depth=1")
+        self.assertEqual(response.status_code, 200)
+        content = response.json()["content"]
+        self.assertEqual([plugin["id"] for plugin in content], [plugin["id"] for plugin in full])
+        self.assertNotIn("children", content[0])
+        self.assertEqual(content[0]["children_count"], 1)
+        self.assertNotIn("children_count", content[2])
+
+        # The link serves the children with the same depth
+        response = self.client.get(content[0]["children_url"].removeprefix("http://testserver"))
+        children = response.json()["content"]
+        self.assertEqual([plugin["id"] for plugin in children], [full[0]["children"][0]["id"]])
+        self.assertEqual(children[0]["children_count"], 1)
+
+        content = self.client.get(self.url + "?depth=2").json()["content"]
+        self.assertEqual(content[0]["children"][0]["children_count"], 1)
+        self.assertEqual(content[1], full[1])
+
+        self.assertEqual(self.client.get(self.url + "?depth=0").status_code, 400)
+        self.assertEqual(self.client.get(self.url + "?parent=99999").status_code, 404)
+
+    def test_cursor_pagination(self):
+        full = self.client.get(self.url).json()["content"]
+
+        response = self.client.get(self.url + "?cursor=&limit=2")
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["content"], full[:2])
+        self.assertIsNone(data["previous"])
+
+        data = self.client.get(data["next"]).json()
+        self.assertEqual(data["content"], full[2:])
+        self.assertIsNone(data["next"])
+
+        data = self.client.get(self.url + f"?parent={self.parent.pk}&cursor=").json()
+        self.assertEqual(data["content"], full[0]["children"])
@@ -1,5 +1,9 @@
+from unittest import mock
+
+from django.core.cache import cache
 from rest_framework.reverse import reverse
 
+from djangocms_rest.serializers import plugins
 from tests.base import BaseCMSRestTestCase
 from tests.types import PLUGIN_FIELD_TYPES
 from tests.utils import assert_field_types
@@ -77,3 +81,37 @@ class PluginListTestCase(BaseCMSRestTestCase):
         # "position" is a base_exclude member and must be skipped from the schema.
         self.assertNotIn("position", dummy_plugin["properties"])
         self.assertDictEqual(dummy_plugin, expected_dummy_plugin_signature)
+
+    def test_definitions_generated_once(self):
+        cache.clear()
+        plugins._plugin_definitions.clear()
+        with mock.patch.object(
+            plugins.PluginDefinitionSerializer,
+            "generate_plugin_definitions",
+            wraps=plugins.PluginDefinitionSerializer.generate_plugin_definitions,
+        ) as generate:
+            definitions = plugins.get_plugin_definitions()
+            self.assertEqual(plugins.get_plugin_definitions(), definitions)
+
+            # Another process reads them from the shared cache
+            plugins._plugin_definitions.clear()
+            self.assertEqual(plugins.get_plugin_definitions(), definitions)
+        generate.assert_called_once()
+        self.assertIn("DummyNumberPlugin", definitions)
+        self.assertIsNotNone(
+            cache.get(f"djangocms_rest:plugin_definitions:{plugins.get_plugin_pool_fingerprint()}")
+        )
+
+    def test_fingerprint_computed_once_per_registry(self):
+        plugins._plugin_pool_fingerprints.clear()
+        with mock.patch.object(
+            plugins, "_get_plugin_pool_fingerprint", wraps=plugins._get_plugin_pool_fingerprint
+        ) as compute:
+            fingerprint = plugins.get_plugin_pool_fingerprint()
+            self.assertEqual(plugins.get_plugin_pool_fingerprint(), fingerprint)
+        compute.assert_called_once()
+
+    def test_plugin_definitions_module_attribute(self):
+        from djangocms_rest import views
+
+        self.assertEqual(views.PLUGIN_DEFINITIONS, plugins.get_plugin_definitions())
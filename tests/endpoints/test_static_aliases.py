@@ -0,0 +1,120 @@
+from unittest import mock
+
+from cms.api import add_plugin
+from cms.models import Placeholder
+from django.contrib.sites.models import Site
+from django.db import connection, transaction
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from djangocms_alias.models import Alias, AliasContent, Category
+
+from rest_framework.reverse import reverse
+
+from tests.base import BaseCMSRestTestCase
+
+
+class StaticAliasTestCase(BaseCMSRestTestCase):
+    def setUp(self):
+        super().setUp()
+        category = Category.objects.create(name="Static")
+        self.alias = Alias.objects.create(category=category, static_code="footer", site=Site.objects.get_current())
+        self.alias_content = AliasContent.objects.create(alias=self.alias, name="Footer", language="en")
+        self.plugin = add_plugin(
+            placeholder=self.alias_content.placeholder,
+            plugin_type="TextPlugin",
+            language="en",
+            body="<p>Footer</p>",
+        )
+        self.url = reverse("static-alias-detail", kwargs={"language": "en", "static_code": "footer"})
+
+    def test_static_alias(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["static_code"], "footer")
+        self.assertEqual(data["content"][0]["body"], "<p>Footer</p>")
+        self.assertTrue(response.headers["ETag"])
+
+        # Cached responses are served without queries
+        with CaptureQueriesContext(connection) as queries:
+            cached = self.client.get(self.url)
+        self.assertEqual(cached.json(), data)
+        self.assertEqual(cached.headers["ETag"], response.headers["ETag"])
+        self.assertFalse([query for query in queries if "djangocms_alias" in query["sql"]])
+
+    def test_not_modified(self):
+        etag = self.client.get(self.url).headers["ETag"]
+        response = self.client.get(self.url, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers["ETag"], etag)
+
+        response = self.client.get(self.url, headers={"If-None-Match": '"stale"'})
+        self.assertEqual(response.status_code, 200)
+
+    def test_invalidated_on_change(self):
+        etag = self.client.get(self.url).headers["ETag"]
+
+        self.plugin.body = "<p>New footer</p>"
+        self.plugin.save()
+        # As the editor does when plugins change
+        self.alias_content.placeholder.clear_cache("en")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.alias_content.save()
+
+        response = self.client.get(self.url, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["content"][0]["body"], "<p>New footer</p>")
+        self.assertNotEqual(response.headers["ETag"], etag)
+
+    def test_invalidated_after_commit(self):
+        """A request before the change is committed must not cache the old content under a new version."""
+        etag = self.client.get(self.url).headers["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                self.plugin.body = "<p>New footer</p>"
+                self.plugin.save()
+                self.alias_content.placeholder.clear_cache("en")
+                self.alias_content.save()
+                # Still served from the cache until the transaction is committed
+                self.assertEqual(self.client.get(self.url, headers={"If-None-Match": etag}).status_code, 304)
+
+        response = self.client.get(self.url, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["content"][0]["body"], "<p>New footer</p>")
+
+    def test_not_found(self):
+        url = reverse("static-alias-detail", kwargs={"language": "en", "static_code": "header"})
+        self.assertEqual(self.client.get(url).status_code, 404)
+        # No content in the language
+        url = reverse("static-alias-detail", kwargs={"language": "it", "static_code": "footer"})
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+    @override_settings(REST_STATIC_ALIAS_CACHE_DURATION=0)
+    def test_cache_disabled(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("ETag", response.headers)
+        self.assertEqual(response.json()["static_code"], "footer")
+
+    def test_not_cached_if_plugins_may_not_be_cached(self):
+        with mock.patch.object(Placeholder, "get_cache_expiration", return_value=0):
+            etag = self.client.get(self.url).headers["ETag"]
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(self.url, headers={"If-None-Match": etag})
+        # Still answered with an ETag, but from the database
+        self.assertEqual(response.status_code, 304)
+        self.assertTrue([query for query in queries if "djangocms_alias" in query["sql"]])
+
+    def test_cache_varies_on_plugin_headers_and_scheme(self):
+        with mock.patch.object(Placeholder, "get_vary_cache_on", return_value=["User-Agent"]):
+            self.client.get(self.url, headers={"User-Agent": "one"})
+            for kwargs in ({"headers": {"User-Agent": "two"}}, {"headers": {"User-Agent": "one"}, "secure": True}):
+                with self.subTest(**kwargs):
+                    with CaptureQueriesContext(connection) as queries:
+                        self.client.get(self.url, **kwargs)
+                    self.assertTrue([query for query in queries if "djangocms_alias" in query["sql"]])
+
+            with CaptureQueriesContext(connection) as queries:
+                self.client.get(self.url, headers={"User-Agent": "one"})
+            self.assertFalse([query for query in queries if "djangocms_alias" in query["sql"]])
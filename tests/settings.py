@@ -32,6 +32,8 @@ INSTALLED_APPS = [
     "treebeard",
     "sekizai",
     "djangocms_text",
+    "djangocms_alias",
+    "parler",
     "djangocms_rest",
     "tests.test_app",
     "filer",
@@ -132,6 +134,8 @@ CMS_PLACEHOLDER_CONF = {
 }
 
 FILE_UPLOAD_TEMP_DIR = mkdtemp()
+# Files uploaded by tests, e.g., filer images, are not written into the checkout
+MEDIA_ROOT = mkdtemp()
 SITE_ID = 1
 THUMBNAIL_PROCESSORS = (
     "easy_thumbnails.processors.colorspace",
@@ -143,6 +147,7 @@ THUMBNAIL_PROCESSORS = (
 CMS_TEMPLATES = (
     ("page.html", "Normal page"),
     ("plugin_with_sekizai.html", "Plugin with sekizai"),
+    ("multi_placeholder.html", "Multiple placeholders"),
 )
 
 DJANGOCMS_TRANSLATIONS_CONF = {
@@ -1,6 +1,6 @@
 from django.urls import reverse
 from django.utils import translation
-from djangocms_rest.serializers.plugins import serialize_fk, serialize_soft_refs
+from djangocms_rest.serializers.plugins import _collect_soft_file_refs, serialize_fk, serialize_soft_refs
 from tests.base import BaseCMSRestTestCase
 from tests.test_app.models import Pizza, Topping
 
@@ -85,3 +85,19 @@ class PlaceholdersAPITestCase(BaseCMSRestTestCase):
             request, dict(attrs={"data-cms-href": "test_app.topping:314"})
         )
         self.assertEqual(fk, {"attrs": {"data-cms-href": "test_app.topping:314"}})
+
+    def test_collect_soft_file_refs(self):
+        """File ids are collected where serialize_soft_refs resolves them, skipping empty and invalid ids."""
+        data = {
+            "file_link": "1",
+            "empty": {"file_link": None},
+            "blank": {"file_link": ""},
+            "invalid": {"file_link": "not-a-pk"},
+            "link": {"file_link": "2"},
+            "image": {"model": "filer.image", "pk": 3},
+            "page": {"internal_link": "cms.page:4", "file_link": "4"},
+            "items": [{"link": {"file_link": 5}}, {"model": "filer.file", "pk": 6}],
+        }
+        file_ids = set()
+        _collect_soft_file_refs(data, file_ids)
+        self.assertEqual(file_ids, {"2", "3", "5"})
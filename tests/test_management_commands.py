@@ -0,0 +1,113 @@
+import json
+from io import StringIO
+
+from cms.api import add_plugin
+from django.contrib.sites.models import Site
+from django.contrib.sites.shortcuts import get_current_site
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from djangocms_rest.management.commands.warm_rest_cache import Command
+from djangocms_rest.serializers.utils.cache import get_placeholder_rest_cache
+from djangocms_rest.utils import get_site_filtered_queryset
+from tests.base import BaseCMSRestTestCase
+
+
+class WarmRestCacheCommandTestCase(BaseCMSRestTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.placeholder = cls.pages[1].get_placeholders(language="en").get(slot="content")
+        add_plugin(
+            placeholder=cls.placeholder,
+            plugin_type="TextPlugin",
+            language="en",
+            body="<p>Warm content</p>",
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_warm_rest_cache(self):
+        site_id = get_current_site(None).pk
+        self.assertIsNone(get_placeholder_rest_cache(self.placeholder, lang="en", site_id=site_id, request=None))
+
+        out = StringIO()
+        call_command("warm_rest_cache", "--host=testserver", "--language=en", "--rate=1000", stdout=out, verbosity=2)
+
+        cached_content = get_placeholder_rest_cache(self.placeholder, lang="en", site_id=site_id, request=None)
+        self.assertIsNotNone(cached_content)
+        self.assertIn("Warm content", cached_content["content"][0]["body"])
+        # Tree, menu and one request per page
+        expected = get_site_filtered_queryset(Site.objects.get_current()).count() + 2
+        self.assertIn(f"Warmed {expected} of {expected} endpoints", out.getvalue())
+        self.assertIn("/api/en/pages-tree/", out.getvalue())
+
+    def test_warm_rest_cache_jobs_query_count(self):
+        site = Site.objects.get_current()
+        # Pages with published content and their URLs are loaded at once
+        with self.assertNumQueries(2):
+            jobs = Command().get_jobs(site, "en", skip_menus=True)
+        self.assertEqual(len(jobs), get_site_filtered_queryset(site).count())
+
+    def test_warm_rest_cache_reports_failures(self):
+        out, err = StringIO(), StringIO()
+        # The site domain is not an allowed host
+        call_command("warm_rest_cache", "--language=en", "--skip-menus", stdout=out, stderr=err)
+        self.assertIn("failed", err.getvalue())
+
+        with self.assertRaises(CommandError):
+            call_command("warm_rest_cache", "--language=en", "--fail-on-error", stdout=out, stderr=err)
+
+        with self.assertRaises(CommandError):
+            call_command("warm_rest_cache", "--concurrency=0")
+
+
+class ExportRestPagesCommandTestCase(BaseCMSRestTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.placeholder = cls.pages[1].get_placeholders(language="en").get(slot="content")
+        add_plugin(
+            placeholder=cls.placeholder,
+            plugin_type="TextPlugin",
+            language="en",
+            body="<p>Exported content</p>",
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_export_rest_pages(self):
+        out, err = StringIO(), StringIO()
+        call_command("export_rest_pages", "en", "--host=testserver", "--chunk-size=4", stdout=out, stderr=err)
+
+        lines = out.getvalue().splitlines()
+        expected = get_site_filtered_queryset(Site.objects.get_current()).count()
+        self.assertEqual(len(lines), expected)
+        self.assertIn(f"Exported {expected} pages", err.getvalue())
+        # Each line is the page detail endpoint's response
+        for line in lines:
+            data = json.loads(line)
+            self.assertEqual(data, self.client.get(data["details"]).json())
+        self.assertIn("Exported content", out.getvalue())
+
+    def test_export_rest_pages_query_count(self):
+        """The number of queries does not grow with the number of pages in a chunk."""
+        with CaptureQueriesContext(connection) as all_pages:
+            call_command("export_rest_pages", "en", "--host=testserver", stdout=StringIO(), stderr=StringIO())
+        cache.clear()
+        with CaptureQueriesContext(connection) as one_page:
+            call_command(
+                "export_rest_pages", "en", "--host=testserver", "--chunk-size=1", stdout=StringIO(), stderr=StringIO()
+            )
+        self.assertLess(len(all_pages), len(one_page) / 2)
+
+    def test_export_rest_pages_errors(self):
+        with self.assertRaises(CommandError):
+            call_command("export_rest_pages", "en", "--chunk-size=0")
+        with self.assertRaises(CommandError):
+            call_command("export_rest_pages", "en", "--site=999")
@@ -0,0 +1,60 @@
+from cms.models import ACCESS_PAGE, ACCESS_PAGE_AND_DESCENDANTS, PagePermission
+from cms.utils.page_permissions import user_can_view_page
+from django.contrib.auth.models import AnonymousUser, Group
+from django.contrib.sites.models import Site
+from django.test import override_settings
+
+from djangocms_rest.permissions import get_visible_page_ids
+from djangocms_rest.utils import get_page_tree_path, get_site_filtered_queryset
+from tests.base import BaseCMSRestTestCase, User
+
+
+@override_settings(CMS_PERMISSION=True)
+class VisiblePageIdsTestCase(BaseCMSRestTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # Users are copied for each test: django CMS caches permissions on them
+        cls.group = Group.objects.create(name="readers")
+        cls.reader = User.objects.create_user(username="reader", password="reader")
+        cls.group_member = User.objects.create_user(username="member", password="member")
+        cls.group_member.groups.add(cls.group)
+        cls.editor = User.objects.create_user(username="editor", password="editor", is_staff=True)
+        cls.other = User.objects.create_user(username="other", password="other")
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.site = Site.objects.get_current()
+        cls.all_pages = list(get_site_filtered_queryset(cls.site))
+        parent = next(page for page in cls.all_pages if page.get_child_pages().exists())
+        parent_path = get_page_tree_path(parent)
+        leaf = next(page for page in cls.all_pages if not get_page_tree_path(page).startswith(parent_path))
+        PagePermission.objects.create(
+            page=parent, user=cls.reader, can_view=True, grant_on=ACCESS_PAGE_AND_DESCENDANTS
+        )
+        PagePermission.objects.create(page=leaf, group=cls.group, can_view=True, grant_on=ACCESS_PAGE)
+
+    def assertMatchesUserCanViewPage(self, user):
+        expected = {page.pk for page in self.all_pages if user_can_view_page(user, page, site=self.site)}
+        self.assertEqual(get_visible_page_ids(user, self.all_pages, self.site), expected)
+        return expected
+
+    def test_matches_user_can_view_page(self):
+        for user in (AnonymousUser(), self.reader, self.group_member, self.editor, self.other, self.user):
+            with self.subTest(user=str(user)):
+                visible = self.assertMatchesUserCanViewPage(user)
+                self.assertTrue(visible)
+        # Restricted pages are hidden from users without a grant
+        self.assertLess(len(get_visible_page_ids(self.other, self.all_pages, self.site)), len(self.all_pages))
+
+    @override_settings(CMS_PUBLIC_FOR="staff")
+    def test_public_for_staff(self):
+        for user in (AnonymousUser(), self.reader, self.editor, self.other):
+            with self.subTest(user=str(user)):
+                self.assertMatchesUserCanViewPage(user)
+
+    def test_query_count(self):
+        """The restrictions of all pages are evaluated in a fixed number of queries."""
+        with self.assertNumQueries(5):
+            # View restrictions, the user's permissions (2), global page permissions and groups
+            get_visible_page_ids(self.group_member, self.all_pages, self.site)
@@ -1,4 +1,11 @@
 import json
+from unittest import mock
+
+from django.contrib.sites.shortcuts import get_current_site
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from tests.base import BaseCMSRestTestCase
 
@@ -7,9 +14,11 @@ from django.core.files import File
 
 
 from cms import api
+from cms.cache.placeholder import clear_placeholder_cache
 from cms.models import PageContent
 from cms.toolbar.utils import get_object_edit_url, get_object_preview_url
 
+from filer.models import File as FilerFile
 from filer.models.imagemodels import Image
 from bs4 import BeautifulSoup
 
@@ -194,3 +203,58 @@ class PlaceholdersAPITestCase(BaseCMSRestTestCase):
         self.assertContains(
             response, '<span class="key">"float"</span>: <span class="num">3.14</span>'
         )
+
+    @override_settings(REST_FILE_URL_CACHE_DURATION=60)
+    def test_file_urls_resolved_in_bulk(self):
+        second_image = api.add_plugin(
+            placeholder=self.placeholder,
+            plugin_type="DummyImagePlugin",
+            language="en",
+            filer_image=self.create_image("second.jpg"),
+        )
+        url = reverse(
+            "placeholder-detail",
+            kwargs={
+                "language": "en",
+                "content_type_id": ContentType.objects.get_for_model(PageContent).id,
+                "object_id": self.page.get_admin_content("en").id,
+                "slot": "content",
+            },
+        )
+        cache.clear()
+        with mock.patch.object(
+            FilerFile, "get_api_endpoint", autospec=True, side_effect=FilerFile.get_api_endpoint
+        ) as get_api_endpoint:
+            with CaptureQueriesContext(connection) as queries:
+                content = self.client.get(url).json()["content"]
+            self.assertEqual(get_api_endpoint.call_count, 2)
+            self.assertEqual(len([query for query in queries if 'FROM "filer_file"' in query["sql"]]), 1)
+            self.assertEqual(content[-1]["filer_image"], f"http://testserver{second_image.filer_image.url}")
+            self.assertEqual(
+                content[1]["children"][1]["filer_image"], f"http://testserver{self.image_plugin.filer_image.url}"
+            )
+
+            # URLs come from the cache when the placeholder is serialized again
+            clear_placeholder_cache(self.placeholder, "en", get_current_site(None).pk)
+            self.assertEqual(self.client.get(url).json()["content"], content)
+            self.assertEqual(get_api_endpoint.call_count, 2)
+
+    @override_settings(REST_FILE_URL_CACHE_DURATION=3600)
+    def test_signed_file_urls_cached_shorter(self):
+        from djangocms_rest.serializers.utils.cache import get_file_urls
+
+        file = self.image_plugin.filer_image
+        cache.clear()
+        with mock.patch.object(cache, "set_many", wraps=cache.set_many) as set_many:
+            storage = mock.Mock(querystring_auth=True, querystring_expire=600)
+            with mock.patch.object(file.file, "storage", storage):
+                get_file_urls([file], resolve=lambda file: "signed")
+            set_many.assert_called_once_with(mock.ANY, 300)
+
+            # Without a known lifetime, signed URLs are not cached
+            cache.clear()
+            set_many.reset_mock()
+            storage = mock.Mock(querystring_auth=True, querystring_expire=None, expiration=None)
+            with mock.patch.object(file.file, "storage", storage):
+                self.assertEqual(get_file_urls([file], resolve=lambda file: "signed"), {file.pk: "signed"})
+            set_many.assert_not_called()
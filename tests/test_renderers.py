@@ -0,0 +1,166 @@
+import json
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from unittest import skipUnless
+
+from cms.api import add_plugin
+from cms.models import PageContent
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase, override_settings
+from django.utils.safestring import mark_safe
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer as DRFJSONRenderer
+from rest_framework.reverse import reverse
+
+from djangocms_rest.renderers import (
+    JSONRenderer,
+    MsgspecJSONRenderer,
+    ORJSONRenderer,
+    RawJSON,
+    get_json_renderer_class,
+    msgspec,
+    orjson,
+)
+from djangocms_rest.views import PageTreeListView
+from tests.base import BaseCMSRestTestCase
+
+
+class JSONRendererTestCase(TestCase):
+    def test_raw_json_fragments_are_embedded(self):
+        data = {
+            "a": RawJSON(b"[1,2]"),
+            "b": [RawJSON(b'{"x":"\xc3\xa9"}'), "text"],
+            "c": Decimal("1.5"),
+        }
+        self.assertEqual(
+            JSONRenderer().render(data),
+            '{"a":[1,2],"b":[{"x":"é"},"text"],"c":1.5}'.encode(),
+        )
+
+    def test_output_matches_drf_renderer(self):
+        data = {"title": "Tést ", "items": [1, None, True], "nested": {"key": 1.5}}
+        self.assertEqual(JSONRenderer().render(data), DRFJSONRenderer().render(data))
+        self.assertEqual(
+            JSONRenderer().render(data, "application/json; indent=2"),
+            DRFJSONRenderer().render(data, "application/json; indent=2"),
+        )
+        self.assertEqual(JSONRenderer().render(None), b"")
+
+
+class FastJSONRendererTestCase(TestCase):
+    data = {
+        "title": gettext_lazy("Title"),
+        "creation_date": datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc),
+        "changed_date": datetime(2024, 5, 1, 12, 30, 15, tzinfo=timezone.utc),
+        "date": date(2024, 5, 1),
+        "price": Decimal("1.5"),
+        "uuid": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        "separator": "a\u2028b",
+        "safe": mark_safe("<p>Safe</p>"),
+        "nested": [{"key": None}, (1, 2), True],
+        "content": RawJSON(b'[{"id":1}]'),
+    }
+
+    def assertRendersLikeDRF(self, renderer):
+        expected = JSONRenderer().render(self.data)
+        self.assertEqual(renderer.render(self.data), expected)
+        self.assertEqual(
+            renderer.render(self.data, "application/json; indent=2"),
+            JSONRenderer().render(self.data, "application/json; indent=2"),
+        )
+        self.assertEqual(renderer.render(None), b"")
+
+    @skipUnless(orjson, "orjson not installed")
+    def test_orjson_renderer(self):
+        self.assertRendersLikeDRF(ORJSONRenderer())
+
+    @skipUnless(msgspec, "msgspec not installed")
+    def test_msgspec_renderer(self):
+        self.assertRendersLikeDRF(MsgspecJSONRenderer())
+
+    def test_types_encoded_like_drf(self):
+        """Values fast encoders support natively, or not at all, are rendered as by DRF where possible."""
+        data = {
+            "decimal": Decimal("1.10"),
+            "duration": timedelta(days=1, seconds=3),
+            "bytes": b"text",
+            "big": 2**70,
+            "nested": [{"decimal": Decimal("2.50")}, (timedelta(seconds=1),)],
+        }
+        expected = DRFJSONRenderer().render(data)
+        if orjson:
+            self.assertEqual(ORJSONRenderer().render(data), expected)
+        if msgspec:
+            # msgspec encodes durations and binary values natively; decimals keep their digits
+            rendered = json.loads(MsgspecJSONRenderer().render(data))
+            self.assertEqual(rendered["decimal"], 1.1)
+            self.assertEqual(rendered["big"], 2**70)
+            self.assertEqual(rendered["nested"][0], {"decimal": 2.5})
+
+    def test_renderer_setting_read_per_request(self):
+        view = PageTreeListView()
+        with override_settings(REST_JSON_RENDERER="json"):
+            self.assertIsInstance(view.get_renderers()[0], JSONRenderer)
+        if orjson:
+            with override_settings(REST_JSON_RENDERER="orjson"):
+                self.assertIsInstance(view.get_renderers()[0], ORJSONRenderer)
+
+    def test_renderer_setting(self):
+        with override_settings(REST_JSON_RENDERER="json"):
+            self.assertIs(get_json_renderer_class(), JSONRenderer)
+        with override_settings(REST_JSON_RENDERER="orjson"):
+            if orjson:
+                self.assertIs(get_json_renderer_class(), ORJSONRenderer)
+            else:  # pragma: no cover
+                self.assertRaises(ImproperlyConfigured, get_json_renderer_class)
+        with override_settings(REST_JSON_RENDERER="unknown"):
+            self.assertRaises(ImproperlyConfigured, get_json_renderer_class)
+
+
+class RawJSONResponseTestCase(BaseCMSRestTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.page = cls.pages[0]
+        cls.page_content = PageContent.objects.get(page=cls.page, language="en")
+        cls.placeholder = cls.page.get_placeholders(language="en").get(slot="content")
+        add_plugin(
+            placeholder=cls.placeholder,
+            plugin_type="TextPlugin",
+            language="en",
+            body="<p>Spliced content</p>",
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_cached_placeholder_content_is_spliced(self):
+        url = reverse(
+            "placeholder-detail",
+            kwargs={
+                "language": "en",
+                "content_type_id": ContentType.objects.get_for_model(PageContent).pk,
+                "object_id": self.page_content.pk,
+                "slot": "content",
+            },
+        )
+        response1 = self.client.get(url)  # Cache miss
+        response2 = self.client.get(url)  # Cache hit
+
+        self.assertIsInstance(response1.data["content"], list)
+        self.assertIsInstance(response2.data["content"], RawJSON)
+        self.assertEqual(response1.content, response2.content)
+        self.assertIn("Spliced content", json.loads(response2.content)["content"][0]["body"])
+
+    def test_cached_page_content_is_spliced(self):
+        url = reverse("page-detail", kwargs={"language": "en", "path": self.page.get_path("en")})
+        response1 = self.client.get(url)  # Cache miss
+        response2 = self.client.get(url)  # Cache hit
+
+        self.assertEqual(response1.json(), response2.json())
+        self.assertTrue(
+            any(isinstance(placeholder["content"], RawJSON) for placeholder in response2.data["placeholders"])
+        )
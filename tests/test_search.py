@@ -0,0 +1,137 @@
+from io import StringIO
+from unittest import skipUnless
+
+from cms.api import add_plugin
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.db import connection
+from django.test import RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.request import Request
+from rest_framework.reverse import reverse
+
+from cms.models import PageContent
+
+from djangocms_rest.models import PageSearchIndex
+from djangocms_rest.search import DatabaseSearchBackend, PostgresSearchBackend, get_search_backend
+from djangocms_rest.views import PageSearchView
+from tests.base import BaseCMSRestTestCase
+
+
+class PageSearchIndexTestCase(BaseCMSRestTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.page_content = cls.pages[1].get_content_obj("en")
+        placeholder = cls.pages[1].get_placeholders(language="en").get(slot="content")
+        add_plugin(
+            placeholder=placeholder,
+            plugin_type="TextPlugin",
+            language="en",
+            body="<p>Bananas &amp; page 0 cream</p>",
+        )
+
+    def test_page_contents_indexed_on_save(self):
+        entry = PageSearchIndex.objects.get(page_content=self.page_content)
+        self.assertEqual(entry.language, "en")
+        self.assertEqual(entry.title, "page 1")
+
+        self.page_content.meta_description = "All about fruit"
+        self.page_content.save()
+        entry.refresh_from_db()
+        self.assertEqual(entry.description, "All about fruit")
+
+    def test_plugin_text_indexed(self):
+        entry = get_search_backend().update(self.page_content)
+        self.assertEqual(entry.text, "Bananas & page 0 cream")
+        self.assertEqual(entry.slots, [{"slot": "content", "text": "Bananas & page 0 cream"}])
+
+    def test_title_matches_ranked_first(self):
+        get_search_backend().update(self.page_content)
+        page_content = self.pages[0].get_content_obj("en")
+        page_content.title = "Bananas"
+        page_content.save()
+
+        results = list(DatabaseSearchBackend().search(PageContent.objects.filter(language="en"), "bananas"))
+        self.assertEqual([result.page for result in results], [self.pages[0], self.pages[1]])
+        self.assertGreater(results[0].search_rank, results[1].search_rank)
+
+    @skipUnless(connection.vendor == "postgresql", "PostgreSQL full-text search")
+    def test_postgres_search_uses_stored_vector(self):
+        backend = PostgresSearchBackend()
+        entry = backend.update(self.page_content)
+        entry.refresh_from_db()
+        self.assertIsNotNone(entry.search_vector)
+
+        results = list(backend.search(PageContent.objects.filter(language="en"), "bananas"))
+        self.assertEqual([result.page for result in results], [self.pages[1]])
+        self.assertGreater(results[0].search_rank, 0)
+
+    def test_search_endpoint(self):
+        url = reverse("page-search", kwargs={"language": "en"})
+        response = self.client.get(url + "?q=bananas")
+        self.assertEqual(response.json()["count"], 0)
+
+        out = StringIO()
+        call_command("rebuild_rest_search_index", stdout=out)
+        self.assertIn("Indexed", out.getvalue())
+
+        response = self.client.get(url + "?q=bananas cream")
+        data = response.json()
+        self.assertEqual(data["count"], 1)
+        self.assertEqual(data["results"][0]["title"], "page 1")
+
+    def test_search_results_include_snippets(self):
+        get_search_backend().update(self.page_content)
+        url = reverse("page-search", kwargs={"language": "en"}) + "?q=cream"
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+
+        result = response.json()["results"][0]
+        self.assertEqual(result["snippet"], "Bananas &amp; page 0 <mark>cream</mark>")
+        self.assertEqual(result["matched_slots"], ["content"])
+        # Plugins are not loaded
+        self.assertFalse([query for query in queries if "cms_cmsplugin" in query["sql"]])
+
+    def test_search_endpoint_with_empty_index(self):
+        """Until the index is built, pages are searched with django CMS's page search."""
+        PageSearchIndex.objects.all().delete()
+        response = self.client.get(reverse("page-search", kwargs={"language": "en"}) + "?q=bananas")
+        data = response.json()
+        self.assertEqual(data["count"], 1)
+        self.assertEqual(data["results"][0]["title"], "page 1")
+        self.assertEqual(data["results"][0]["snippet"], "")
+        self.assertEqual(data["results"][0]["matched_slots"], [])
+
+    def test_snippet(self):
+        backend = DatabaseSearchBackend()
+        entry = PageSearchIndex(text=" ".join(f"word{i}" for i in range(100)) + " <needle>", description="")
+        snippet = backend.get_snippet(entry, ["NEEDLE"])
+        self.assertTrue(snippet.startswith("…word"))
+        self.assertTrue(snippet.endswith("&lt;<mark>needle</mark>&gt;"))
+        self.assertLessEqual(len(snippet), backend.snippet_length + 1)
+
+        # Without a match in the text, the snippet starts at its beginning
+        snippet = backend.get_snippet(entry, ["absent"])
+        self.assertTrue(snippet.startswith("word0 word1"))
+        self.assertTrue(snippet.endswith("…"))
+
+    def test_serializer_context_outside_get(self):
+        """The search backend is available when serializers are built without a search, e.g., for the schema."""
+        view = PageSearchView(request=Request(RequestFactory().options("/")), format_kwarg=None, kwargs={})
+        context = view.get_serializer_context()
+        self.assertIsInstance(context["search_backend"], DatabaseSearchBackend)
+        self.assertEqual(context["search_words"], [])
+
+    def test_rebuild_removes_stale_entries(self):
+        PageSearchIndex.objects.filter(page_content=self.page_content).delete()
+        PageSearchIndex.objects.create(page=self.pages[1], language="xx", page_content=self.page_content)
+        call_command("rebuild_rest_search_index", "--language=xx", stdout=StringIO())
+        self.assertFalse(PageSearchIndex.objects.filter(language="xx").exists())
+
+    def test_search_backend_setting(self):
+        with override_settings(REST_SEARCH_BACKEND="djangocms_rest.search.DatabaseSearchBackend"):
+            self.assertIsInstance(get_search_backend(), DatabaseSearchBackend)
+        with override_settings(REST_SEARCH_BACKEND="nonexistent"):
+            with self.assertRaises(ImproperlyConfigured):
+                get_search_backend()
@@ -1,7 +1,24 @@
+from unittest import mock
+
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.db import transaction
+from django.http import Http404
 from django.test import TestCase
 from django.test import RequestFactory
+from django.urls import NoReverseMatch, reverse
 
-from djangocms_rest.utils import get_absolute_frontend_url
+from djangocms_rest.utils import (
+    PATH_INDEX_VERSION_KEY,
+    URLTemplate,
+    get_absolute_frontend_url,
+    get_object,
+    get_page_id_for_path,
+    get_page_tree_path,
+    page_detail_url,
+    placeholder_detail_url,
+)
+from tests.base import BaseCMSRestTestCase
 
 
 class UtilityTestCase(TestCase):
@@ -14,3 +31,88 @@ class UtilityTestCase(TestCase):
         request = RequestFactory().get("http://testserver/")
         url = get_absolute_frontend_url(request, None)
         self.assertIsNone(url)
+
+
+class PathIndexTestCase(BaseCMSRestTestCase):
+    def setUp(self):
+        cache.clear()
+        self.site = Site.objects.get_current()
+
+    def test_get_page_tree_path(self):
+        page = self.pages[1]
+        self.assertEqual(get_page_tree_path(page), page.path)
+        # django CMS 4.1 keeps the path on the page's node
+        with mock.patch("djangocms_rest.utils.PAGE_TREE_PATH_FIELD", "node__path"):
+            self.assertEqual(get_page_tree_path(mock.Mock(node=mock.Mock(path="00010002"))), "00010002")
+
+    def test_get_object(self):
+        page = self.pages[1]
+        path = page.get_path("en")
+        self.assertEqual(get_object(self.site, path), page)
+        with self.assertRaises(Http404):
+            get_object(self.site, "does/not/exist")
+
+    def test_unknown_paths_need_no_queries(self):
+        get_page_id_for_path(self.site, "")
+        with self.assertNumQueries(0):
+            for i in range(10):
+                self.assertIsNone(get_page_id_for_path(self.site, f"does/not/exist/{i}"))
+
+    def test_index_invalidated_on_url_change(self):
+        page = self.pages[1]
+        old_path = page.get_path("en")
+        self.assertEqual(get_page_id_for_path(self.site, old_path), page.pk)
+
+        page_url = page.urls.get(language="en")
+        page_url.path = f"{old_path}-renamed"
+        with self.captureOnCommitCallbacks(execute=True):
+            page_url.save()
+
+        self.assertIsNone(get_page_id_for_path(self.site, old_path))
+        self.assertEqual(get_page_id_for_path(self.site, f"{old_path}-renamed"), page.pk)
+
+    def test_index_invalidated_after_commit(self):
+        """
+        Inside a transaction the index is kept: a concurrent request would rebuild it from the
+        data before the change. It is invalidated once the transaction is committed.
+        """
+        page = self.pages[1]
+        old_path = page.get_path("en")
+        get_page_id_for_path(self.site, old_path)
+        version = cache.get(PATH_INDEX_VERSION_KEY)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                page_url = page.urls.get(language="en")
+                page_url.path = f"{old_path}-renamed"
+                page_url.save()
+                page.save()
+                self.assertEqual(cache.get(PATH_INDEX_VERSION_KEY), version)
+
+        self.assertNotEqual(cache.get(PATH_INDEX_VERSION_KEY), version)
+        self.assertEqual(get_page_id_for_path(self.site, f"{old_path}-renamed"), page.pk)
+
+
+class URLTemplateTestCase(TestCase):
+    def test_matches_reverse(self):
+        for kwargs in (
+            {"language": "en", "path": "about"},
+            {"language": "zh-hans", "path": "über uns/a&b?c"},
+        ):
+            with self.subTest(kwargs=kwargs):
+                self.assertEqual(page_detail_url.reverse(kwargs), reverse("page-detail", kwargs=kwargs))
+
+        kwargs = {"language": "en", "content_type_id": 12, "object_id": 3, "slot": "content"}
+        self.assertEqual(placeholder_detail_url.reverse(kwargs), reverse("placeholder-detail", kwargs=kwargs))
+
+    def test_rejects_invalid_values(self):
+        for kwargs in ({"language": "en", "path": ""}, {"language": "e n", "path": "about"}, {"language": "en"}):
+            with self.subTest(kwargs=kwargs), self.assertRaises(NoReverseMatch):
+                page_detail_url.reverse(kwargs)
+
+    def test_compiled_once(self):
+        URLTemplate.clear()
+        with mock.patch("djangocms_rest.utils.reverse", wraps=reverse) as reverse_mock:
+            for i in range(3):
+                page_detail_url.reverse({"language": "en", "path": f"page-{i}"})
+        reverse_mock.assert_called_once()
@@ -0,0 +1,11 @@
+from django.urls import include, path
+
+from tests.urls import urlpatterns as base_urlpatterns
+
+urlpatterns = [
+    path(
+        "api/",
+        include("djangocms_rest.urls_async"),
+    ),
+    *base_urlpatterns,
+]